@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Benchmark Suite
+Feeds a synthetic answer corpus through both editions' interactive question
+flows with scripted input, then through the hints renderer, and records
+throughput, per-question overhead and peak memory in a JSON results file.
+Pass --compare with an earlier results file to see what changed.
+
+    python benchmarks/benchmark_suite.py --count 2000 --custom-ratio 0.1 --output results.json
+"""
+
+import argparse
+import builtins
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import goose_hints_builder_comprehensive as comprehensive  # noqa: E402
+import goose_hints_builder_simple as simple  # noqa: E402
+from goose_hints_catalog import load_catalog  # noqa: E402
+from goose_hints_platform import get_user_platform_info  # noqa: E402
+from goose_hints_render import render_hints  # noqa: E402
+from goose_hints_render_cache import RenderCache  # noqa: E402
+from synthetic_corpus import generate_answers, scripted_inputs  # noqa: E402
+
+RESULTS_VERSION = 1
+PLATFORM_INFO = get_user_platform_info(home='/home/bench', system='Linux')
+
+# Edition -> function running the builder's whole terminal question flow
+FLOWS = {
+    'simple': lambda: simple.ask_preferences(PLATFORM_INFO),
+    'comprehensive': lambda: comprehensive.ask_preferences(PLATFORM_INFO),
+}
+
+# Headline metric per benchmark kind and whether bigger is better, for --compare
+HEADLINE_METRICS = [('per_second', True), ('us_per_question', False), ('peak_kib', False)]
+
+@contextlib.contextmanager
+def scripted_session(inputs):
+    """Answer input() from a list and discard everything the builder prints"""
+    responses = iter(inputs)
+    original_input = builtins.input
+    builtins.input = lambda prompt='': next(responses)
+    try:
+        with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+            yield responses
+    finally:
+        builtins.input = original_input
+
+def run_flows(edition, sessions):
+    """Drive the builder's question flow for each (record, inputs); returns (preferences list, questions)"""
+    flow = FLOWS[edition]
+    results = []
+    questions = 0
+    for record, inputs in sessions:
+        with scripted_session(inputs) as remaining:
+            results.append(flow())
+            leftover = list(remaining)
+        if leftover:
+            raise RuntimeError(f"{record['id']}: {len(leftover)} scripted answers were not consumed")
+        questions += len(record) - 1
+    return results, questions
+
+def measure(function, *args):
+    """(result, elapsed seconds, peak traced KiB); timing and memory come from separate runs"""
+    started = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak / 1024
+
+def benchmark_edition(edition, count, custom_ratio, seed):
+    records = list(generate_answers(edition, count, custom_ratio, seed))
+    sessions = [(record, scripted_inputs(edition, record)) for record in records]
+    inputs = sum(len(session_inputs) for _, session_inputs in sessions)
+
+    (preferences, questions), elapsed, peak = measure(run_flows, edition, sessions)
+    flow = {
+        'sessions': count,
+        'questions': questions,
+        'inputs': inputs,
+        'custom_answers': sum(1 for record in records for value in record.values() if isinstance(value, dict)),
+        'elapsed_s': round(elapsed, 4),
+        'per_second': round(count / elapsed, 1),
+        'us_per_question': round(elapsed / questions * 1e6, 2),
+        'peak_kib': round(peak, 1),
+    }
+
+    def render_all():
+        return sum(len(render_hints(prefs, PLATFORM_INFO, 'bench.txt', edition)) for prefs in preferences)
+
+    total_chars, elapsed, peak = measure(render_all)
+    render = {
+        'documents': count,
+        'chars': total_chars,
+        'elapsed_s': round(elapsed, 4),
+        'per_second': round(count / elapsed, 1),
+        'us_per_document': round(elapsed / count * 1e6, 2),
+        'mib_per_second': round(total_chars / elapsed / (1024 * 1024), 2),
+        'peak_kib': round(peak, 1),
+    }
+
+    # Re-rendering answer sets already seen, as the service and repeated batch runs do
+    cache = RenderCache()
+
+    def render_cached():
+        return sum(len(cache.render(prefs, PLATFORM_INFO, 'bench.txt', edition)) for prefs in preferences)
+
+    render_cached()
+    total_chars, elapsed, peak = measure(render_cached)
+    cached = {
+        'documents': count,
+        'elapsed_s': round(elapsed, 4),
+        'per_second': round(count / elapsed, 1),
+        'us_per_document': round(elapsed / count * 1e6, 2),
+        'hit_rate': cache.stats()['hit_rate'],
+        'peak_kib': round(peak, 1),
+    }
+    return {f'flow_{edition}': flow, f'render_{edition}': render, f'render_cached_{edition}': cached}
+
+def max_rss_kib():
+    """Peak resident set size of this process in KiB, where the platform reports it"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux kilobytes
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+def print_results(results, previous=None):
+    print(f"\n📊 Benchmarks ({results['config']['count']} sessions per edition, "
+          f"custom ratio {results['config']['custom_ratio']})")
+    for name, metrics in results['benchmarks'].items():
+        line = f"   {name:<28}{metrics['per_second']:>10.1f}/s"
+        if 'us_per_question' in metrics:
+            line += f"{metrics['us_per_question']:>10.1f} µs/question"
+        else:
+            line += f"{metrics['us_per_document']:>10.1f} µs/document"
+        line += f"{metrics['peak_kib']:>10.0f} KiB peak"
+        print(line)
+        if previous and name in previous.get('benchmarks', {}):
+            for metric, higher_is_better in HEADLINE_METRICS:
+                old, new = previous['benchmarks'][name].get(metric), metrics.get(metric)
+                if old and new is not None:
+                    change = (new - old) / old * 100
+                    better = (change > 0) == higher_is_better
+                    print(f"      {metric:<16}{old:>10} -> {new:<10} {change:+6.1f}% {'✅' if better else '⚠️ '}")
+    if results['max_rss_kib']:
+        print(f"   process peak RSS: {results['max_rss_kib'] / 1024:.1f} MiB")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Goose hints question flows and renderer")
+    parser.add_argument('--count', type=int, default=1000, help="Synthetic sessions per edition")
+    parser.add_argument('--custom-ratio', type=float, default=0.1, help="Share of custom answers")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--edition', choices=sorted(FLOWS), action='append',
+                        help="Edition to benchmark (repeatable; default both)")
+    parser.add_argument('--output', default='benchmark_results.json', help="Results JSON file")
+    parser.add_argument('--compare', help="Earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    results = {
+        'version': RESULTS_VERSION,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'catalog_hash': load_catalog()['hash'],
+        'config': {'count': args.count, 'custom_ratio': args.custom_ratio, 'seed': args.seed},
+        'benchmarks': {},
+    }
+    for edition in args.edition or sorted(FLOWS, reverse=True):
+        results['benchmarks'].update(benchmark_edition(edition, args.count, args.custom_ratio, args.seed))
+    results['max_rss_kib'] = max_rss_kib()
+
+    previous = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    print_results(results, previous)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+    print(f"💾 Results written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Service Load Test
+Drives many concurrent sessions through the Help-menu service (start, then
+question/answer until done, then render) and reports p50/p99 latency for
+each step. Starts an in-process service on a free port unless --url is given.
+
+    python benchmarks/service_load_test.py --sessions 2000 --concurrency 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from goose_hints_service import serve  # noqa: E402
+
+STEPS = ['start', 'question', 'answer', 'render']
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+class Client:
+    """Minimal keep-alive HTTP/1.1 JSON client over one connection"""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.writer.write((f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                           f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+                          .encode('latin-1') + body)
+        await self.writer.drain()
+
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode('latin-1').split("\r\n")
+        status = int(lines[0].split(' ')[1])
+        headers = dict(line.split(':', 1) for line in lines[1:] if ':' in line)
+        headers = {name.strip().lower(): value.strip() for name, value in headers.items()}
+        data = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        if headers.get('content-type', '').startswith('application/json'):
+            return status, json.loads(data)
+        return status, data.decode('utf-8')
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+def pick_answer(question, rng):
+    """A plausible answer for a question payload"""
+    if question['type'] == 'text':
+        return rng.choice(['none', '~/Documents/report.docx'])
+    if question.get('allow_custom') and rng.random() < 0.05:
+        return {'custom': 'load test preference'}
+    return rng.randint(1, len(question['options']))
+
+async def run_session(client, edition, latencies, rng):
+    def timed(step, started):
+        latencies[step].append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    status, payload = await client.request('POST', '/sessions', {'edition': edition})
+    timed('start', started)
+    if status != 201:
+        raise RuntimeError(f"start failed: {status} {payload}")
+    session = payload['session']
+
+    while True:
+        started = time.perf_counter()
+        status, question = await client.request('GET', f"/sessions/{session}/question")
+        timed('question', started)
+        if question.get('done'):
+            break
+        started = time.perf_counter()
+        status, payload = await client.request('POST', f"/sessions/{session}/answer",
+                                               {'question': question['key'], 'answer': pick_answer(question, rng)})
+        timed('answer', started)
+        if status != 200:
+            raise RuntimeError(f"answer failed: {status} {payload}")
+
+    started = time.perf_counter()
+    status, text = await client.request('GET', f"/sessions/{session}/render")
+    timed('render', started)
+    if status != 200:
+        raise RuntimeError(f"render failed: {status} {text}")
+    await client.request('DELETE', f"/sessions/{session}")
+
+async def run_load(host, port, sessions, concurrency, edition, seed=0):
+    """Run sessions over `concurrency` connections; returns (latencies, errors, elapsed)"""
+    latencies = {step: [] for step in STEPS}
+    errors = []
+    remaining = iter(range(sessions))
+    rng = random.Random(seed)
+
+    async def worker():
+        client = Client(host, port)
+        try:
+            for _ in remaining:
+                try:
+                    await run_session(client, edition, latencies, rng)
+                except (OSError, RuntimeError, asyncio.IncompleteReadError) as e:
+                    errors.append(str(e))
+                    await client.close()
+        finally:
+            await client.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, sessions))))
+    return latencies, errors, time.perf_counter() - started
+
+def print_report(latencies, errors, elapsed, sessions):
+    print(f"\n📊 {sessions} sessions in {elapsed:.2f}s ({sessions / elapsed:.1f} sessions/s), {len(errors)} errors")
+    print(f"   {'step':<10}{'count':>9}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for step in STEPS:
+        samples = latencies[step]
+        print(f"   {step:<10}{len(samples):>9}{percentile(samples, 0.50) * 1000:>10.2f}"
+              f"{percentile(samples, 0.99) * 1000:>10.2f}{(max(samples) if samples else 0) * 1000:>10.2f}")
+    for error in errors[:5]:
+        print(f"   ⚠️  {error}")
+
+async def _main(args):
+    if args.url:
+        parts = urlsplit(args.url)
+        return await run_load(parts.hostname, parts.port or 80, args.sessions, args.concurrency, args.edition)
+
+    ready = asyncio.get_event_loop().create_future()
+    server_task = asyncio.ensure_future(serve('127.0.0.1', 0, ready=ready.set_result))
+    server = await ready
+    port = server.sockets[0].getsockname()[1]
+    try:
+        return await run_load('127.0.0.1', port, args.sessions, args.concurrency, args.edition)
+    finally:
+        server_task.cancel()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Goose Hints service")
+    parser.add_argument('--url', help="Service base URL; an in-process service is started if omitted")
+    parser.add_argument('--sessions', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=200, help="Concurrent client connections")
+    parser.add_argument('--edition', choices=['simple', 'comprehensive'], default='simple')
+    args = parser.parse_args(argv)
+
+    latencies, errors, elapsed = asyncio.run(_main(args))
+    print_report(latencies, errors, elapsed, args.sessions)
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Startup Budget
+Measures cold start of goose_hints_cli.py subcommands in fresh interpreters
+with -X importtime: wall time to the first prompt of `build`, wall time to
+finish `render` for a saved profile, and the import time each one pays.
+Fails if a scenario is over the budget in startup_budget.json or imports a
+module its budget forbids.
+
+    python benchmarks/startup_budget.py --runs 7
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess  # nosec B404 - runs this repo's own CLI
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = ROOT / "src" / "goose_hints_cli.py"
+BUDGET_FILE = Path(__file__).resolve().parent / "startup_budget.json"
+PROMPT_MARKER = "👤".encode('utf-8')
+
+# Scenario -> (cli arguments, wait for the first prompt instead of exit)
+SCENARIOS = {
+    'help': (['--help'], False),
+    'render': (['render'], False),
+    'build_simple': (['build', '--edition', 'simple'], True),
+    'build_comprehensive': (['build', '--edition', 'comprehensive'], True),
+}
+
+def parse_importtime(stderr):
+    """Return ({module: cumulative_us}, top_level_total_us) from -X importtime output"""
+    modules = {}
+    total = 0
+    for line in stderr.decode('utf-8', 'replace').splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        cumulative = int(cumulative)
+        modules[name.strip()] = cumulative
+        # Nested imports are indented under the module that triggered them
+        if not name[1:].startswith(' '):
+            total += cumulative
+    return modules, total
+
+def run_scenario(args, wait_for_prompt, env):
+    """Run the CLI once; returns (wall_ms, import_ms, modules)"""
+    command = [sys.executable, '-X', 'importtime', str(CLI)] + args
+    started = time.perf_counter()
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,  # nosec B603
+                               stderr=subprocess.PIPE, env=env)
+    if wait_for_prompt:
+        output = b''
+        while PROMPT_MARKER not in output:
+            chunk = os.read(process.stdout.fileno(), 4096)
+            if not chunk:
+                raise RuntimeError(f"{' '.join(args)} exited before its first prompt")
+            output += chunk
+        wall = time.perf_counter() - started
+        process.kill()
+        _, stderr = process.communicate()
+    else:
+        _, stderr = process.communicate()
+        wall = time.perf_counter() - started
+        if process.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} failed: {stderr.decode('utf-8', 'replace')[-500:]}")
+    modules, import_us = parse_importtime(stderr)
+    return wall * 1000, import_us / 1000, modules
+
+def prepare_home(home):
+    """Saved Simple Edition preferences for the render scenario"""
+    sys.path.insert(0, str(ROOT / "src"))
+    from goose_hints_catalog import get_options
+    from goose_hints_platform import get_user_platform_info
+    from goose_hints_state import save_state
+
+    preferences = {
+        'output_formats': get_options('simple', 'output_formats')[0],
+        'communication_style': get_options('simple', 'communication_style')[1],
+        'coding_preferences': get_options('simple', 'coding_preferences')[0],
+    }
+    save_state(preferences, get_user_platform_info(home=home), 'simple')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check goose_hints_cli.py startup against its budget")
+    parser.add_argument('--runs', type=int, default=5, help="Runs per scenario (median is reported)")
+    parser.add_argument('--budget', default=str(BUDGET_FILE), help="Budget JSON file")
+    parser.add_argument('--json', help="Also write measurements to this JSON file")
+    args = parser.parse_args(argv)
+
+    with open(args.budget, 'r', encoding='utf-8') as f:
+        budget = json.load(f)
+
+    results = {}
+    failures = []
+    with tempfile.TemporaryDirectory() as home:
+        prepare_home(home)
+        env = dict(os.environ, HOME=home, USERPROFILE=home, GOOSE_HINTS_CACHE_DIR=str(Path(home) / "cache"))
+        for name, (cli_args, wait_for_prompt) in SCENARIOS.items():
+            # One untimed run warms the catalog cache and the OS file cache
+            run_scenario(cli_args, wait_for_prompt, env)
+            runs = [run_scenario(cli_args, wait_for_prompt, env) for _ in range(args.runs)]
+            wall_ms = statistics.median(run[0] for run in runs)
+            import_ms = statistics.median(run[1] for run in runs)
+            modules = runs[-1][2]
+            slowest = sorted((m for m in modules if m.startswith('goose_hints')), key=modules.get, reverse=True)
+            results[name] = {'wall_ms': round(wall_ms, 2), 'import_ms': round(import_ms, 2),
+                             'project_modules': slowest}
+
+            limits = budget.get(name, {})
+            for metric in ['wall_ms', 'import_ms']:
+                if metric in limits and results[name][metric] > limits[metric]:
+                    failures.append(f"{name}: {metric} {results[name][metric]:.1f} > budget {limits[metric]}")
+            for module in limits.get('forbidden', []):
+                if module in modules:
+                    failures.append(f"{name}: imports {module}")
+
+    print(f"⏱️  Startup budget ({args.runs} runs, median)")
+    print(f"   {'scenario':<22}{'wall ms':>10}{'budget':>9}{'import ms':>12}{'budget':>9}")
+    for name, result in results.items():
+        limits = budget.get(name, {})
+        print(f"   {name:<22}{result['wall_ms']:>10.1f}{limits.get('wall_ms', '-'):>9}"
+              f"{result['import_ms']:>12.1f}{limits.get('import_ms', '-'):>9}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'python': sys.version.split()[0], 'runs': args.runs, 'results': results}, f, indent=2)
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print("✅ Within budget")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
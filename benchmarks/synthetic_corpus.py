@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Synthetic Answer Corpus
+Generates reproducible answer sets for either edition, in the same record
+format batch mode reads (question key -> option key, or {"custom": text}),
+and turns an answer set into the keystrokes the interactive builder expects.
+
+    python benchmarks/synthetic_corpus.py --edition simple --count 10000 --custom-ratio 0.1 -o answers.jsonl
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from goose_hints_catalog import get_options, iter_questions  # noqa: E402
+from goose_hints_flow import is_asked  # noqa: E402
+
+# Options left out of synthetic answers: a custom root path makes the builder create directories
+EXCLUDED_OPTIONS = {'custom_path'}
+
+CUSTOM_PHRASES = [
+    "keep answers under five sentences",
+    "use British spelling throughout",
+    "summarise findings before showing details",
+    "prefer numbered steps for procedures",
+    "always cite the source file and line",
+]
+EXEMPLAR_FILES = ["none", "~/Documents/report_template.docx", "~/Documents/style.md, ~/Templates/memo.pdf"]
+
+def generate_answers(edition, count, custom_ratio=0.1, seed=0):
+    """Yield count answer records; follow-up questions only appear when they apply"""
+    rng = random.Random(seed)
+    questions = list(iter_questions(edition))
+    for number in range(1, count + 1):
+        record = {'id': f"user-{number:06d}"}
+        # is_asked() looks at resolved options, so track chosen keys alongside the record
+        chosen = {}
+        for question in questions:
+            if not is_asked(question, chosen):
+                continue
+            if question['type'] == 'text':
+                record[question['key']] = rng.choice(EXEMPLAR_FILES)
+                continue
+            if question['allow_custom'] and rng.random() < custom_ratio:
+                record[question['key']] = {'custom': rng.choice(CUSTOM_PHRASES)}
+                chosen[question['key']] = {'key': 'custom_preference'}
+                continue
+            keys = [option['key'] for option in get_options(edition, question['key'])
+                    if option['key'] not in EXCLUDED_OPTIONS]
+            key = rng.choice(keys)
+            record[question['key']] = key
+            chosen[question['key']] = {'key': key}
+        yield record
+
+def scripted_inputs(edition, record):
+    """Keystrokes that answer the interactive builder's questions as the record does"""
+    inputs = []
+    for question in iter_questions(edition):
+        if question['key'] not in record:
+            continue
+        value = record[question['key']]
+        if question['type'] == 'text':
+            inputs.append(value)
+            continue
+        keys = [option['key'] for option in get_options(edition, question['key'])]
+        if isinstance(value, dict):
+            inputs.append(str(len(keys) + 1))
+            inputs.append(value['custom'])
+            if edition == 'simple':
+                # The simple edition confirms custom preferences
+                inputs.append('yes')
+        else:
+            inputs.append(str(keys.index(value) + 1))
+    return inputs
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic Goose hints answer records")
+    parser.add_argument('--edition', choices=['simple', 'comprehensive'], default='simple')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--custom-ratio', type=float, default=0.1, help="Share of answers that are custom text")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help="JSONL output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for record in generate_answers(args.edition, args.count, args.custom_ratio, args.seed):
+            out.write(json.dumps(record) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Organization Analytics
+Looks at many users' preferences together. Answer sets are streamed from
+hints stores or batch-mode answer files into a columnar matrix (one small
+integer column per choice question), and everything else is vectorized
+NumPy over its one-hot expansion: option distributions, co-occurrence with
+lift, per-platform breakdowns and a recommended team baseline that can be
+rendered or installed like anyone's preferences. 100k profiles take about
+a second, nearly all of it reading the input.
+
+NumPy is optional for the rest of the tool and only needed here:
+
+    pip install numpy
+    python src/goose_hints_analytics.py --answers team.jsonl --baseline-out baseline.json
+    python src/goose_hints_analytics.py --home /home/* --edition comprehensive --json
+"""
+
+import argparse
+import json
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, see module docstring
+    np = None
+
+from goose_hints_catalog import get_options, iter_questions
+
+CUSTOM = 'custom_preference'
+UNKNOWN_PLATFORM = 'unknown'
+# A baseline answer needs at least this share of the people who answered the question
+DEFAULT_BASELINE_SHARE = 0.5
+# Co-occurring pairs seen fewer times than this are not reported
+DEFAULT_MIN_SUPPORT = 20
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("organization analytics needs NumPy - install it with 'pip install numpy'")
+
+def choice_questions(edition):
+    return [question for question in iter_questions(edition) if question['type'] == 'choice']
+
+class ProfileMatrix:
+    """Answer sets as columns: an int16 option code per profile for each choice question
+
+    Code -1 means unanswered. Option codes follow catalog order with the
+    custom preference last, which is also the order of the one-hot columns.
+    """
+
+    __slots__ = ('edition', 'questions', 'options', 'codes', 'platforms', 'platform_names')
+
+    def __init__(self, edition, answer_sets):
+        """answer_sets: iterable of (platform name, {question key: option key})"""
+        require_numpy()
+        self.edition = edition
+        self.questions = [question['key'] for question in choice_questions(edition)]
+        self.options = {key: [option['key'] for option in get_options(edition, key)] + [CUSTOM]
+                        for key in self.questions}
+        lookup = {key: {option: code for code, option in enumerate(options)} for key, options in self.options.items()}
+        columns = {key: array('h') for key in self.questions}
+        platforms, platform_codes = array('h'), {}
+        for platform_name, keys in answer_sets:
+            platforms.append(platform_codes.setdefault(platform_name or UNKNOWN_PLATFORM, len(platform_codes)))
+            for key in self.questions:
+                columns[key].append(lookup[key].get(keys.get(key), -1))
+        self.codes = {key: np.frombuffer(column, dtype=np.int16) if column else np.zeros(0, dtype=np.int16)
+                      for key, column in columns.items()}
+        self.platforms = np.frombuffer(platforms, dtype=np.int16) if platforms else np.zeros(0, dtype=np.int16)
+        self.platform_names = list(platform_codes)
+
+    def __len__(self):
+        return len(self.platforms)
+
+    @property
+    def columns(self):
+        """(question key, option key) for each one-hot column"""
+        return [(key, option) for key in self.questions for option in self.options[key]]
+
+    def offsets(self):
+        offsets, start = {}, 0
+        for key in self.questions:
+            offsets[key] = start
+            start += len(self.options[key])
+        return offsets
+
+    def one_hot(self):
+        """(profiles x columns) uint8 matrix with a 1 for every answer given"""
+        offsets = self.offsets()
+        matrix = np.zeros((len(self), sum(len(options) for options in self.options.values())), dtype=np.uint8)
+        for key in self.questions:
+            rows = np.flatnonzero(self.codes[key] >= 0)
+            matrix[rows, offsets[key] + self.codes[key][rows]] = 1
+        return matrix
+
+    def answered(self):
+        """{question key: number of profiles that answered it}"""
+        return {key: int(np.count_nonzero(self.codes[key] >= 0)) for key in self.questions}
+
+def distributions(matrix, one_hot=None):
+    """{question: [(option, count, share of those who answered)]}, most common first"""
+    one_hot = matrix.one_hot() if one_hot is None else one_hot
+    counts = one_hot.sum(axis=0, dtype=np.int64)
+    answered = matrix.answered()
+    result, offsets = {}, matrix.offsets()
+    for key in matrix.questions:
+        start, options = offsets[key], matrix.options[key]
+        block = counts[start:start + len(options)]
+        order = np.argsort(-block, kind='stable')
+        result[key] = [(options[i], int(block[i]), float(block[i]) / answered[key] if answered[key] else 0.0)
+                       for i in order if block[i]]
+    return result
+
+def co_occurrence(matrix, one_hot=None, min_support=DEFAULT_MIN_SUPPORT, limit=20):
+    """Option pairs from different questions chosen together more often than chance
+
+    Returns [(question a, option a, question b, option b, count, lift)] by
+    descending lift, where lift = P(a and b) / (P(a) P(b)) among the profiles
+    that answered both questions, so follow-up questions asked only after
+    some answers don't look correlated with them just for being asked.
+    """
+    one_hot = matrix.one_hot() if one_hot is None else one_hot
+    if not len(matrix):
+        return []
+    as_float = one_hot.astype(np.float32)
+    answered = np.stack([matrix.codes[key] >= 0 for key in matrix.questions], axis=1).astype(np.float32)
+    owner = np.repeat(np.arange(len(matrix.questions)), [len(matrix.options[key]) for key in matrix.questions])
+    together = as_float.T @ as_float
+    both = (answered.T @ answered)[owner][:, owner]
+    # given[i, j]: profiles choosing option i among those who answered column j's question
+    given = (as_float.T @ answered)[:, owner]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lift = together.astype(np.float64) * both / (given * given.T)
+    eligible = (together >= min_support) & (owner[:, None] < owner[None, :]) & np.isfinite(lift) & (lift > 1)
+    rows, cols = np.nonzero(eligible)
+    order = np.argsort(-lift[rows, cols], kind='stable')[:limit]
+    columns = matrix.columns
+    pairs = []
+    for i in order:
+        row, col = rows[i], cols[i]
+        pairs.append(columns[row] + columns[col] + (int(together[row, col]), round(float(lift[row, col]), 2)))
+    return pairs
+
+def platform_breakdown(matrix, one_hot=None):
+    """{platform: {'profiles': n, question: (most common option, share)}}"""
+    one_hot = matrix.one_hot() if one_hot is None else one_hot
+    by_platform = np.zeros((len(matrix.platform_names), len(matrix)), dtype=np.float32)
+    by_platform[matrix.platforms, np.arange(len(matrix))] = 1
+    counts = by_platform @ one_hot.astype(np.float32)
+    result, offsets = {}, matrix.offsets()
+    for index, name in enumerate(matrix.platform_names):
+        row = {'profiles': int(by_platform[index].sum())}
+        for key in matrix.questions:
+            start, options = offsets[key], matrix.options[key]
+            block = counts[index, start:start + len(options)]
+            total = float(block.sum())
+            if total:
+                best = int(np.argmax(block))
+                row[key] = (options[best], float(block[best]) / total)
+        result[name] = row
+    return result
+
+def team_baseline(matrix, distribution=None, min_share=DEFAULT_BASELINE_SHARE):
+    """{question: option key} for questions where one catalog option has a clear majority
+
+    Custom preferences never become a baseline, and follow-up questions are
+    only included when the baseline answer to their parent asks them.
+    """
+    from goose_hints_catalog import get_question
+    from goose_hints_flow import is_asked
+
+    distribution = distributions(matrix) if distribution is None else distribution
+    baseline = {}
+    for key in matrix.questions:
+        choices = [(option, share) for option, _, share in distribution[key] if option != CUSTOM]
+        if choices and choices[0][1] >= min_share:
+            baseline[key] = choices[0][0]
+    resolved = {key: {'key': option} for key, option in baseline.items()}
+    return {key: option for key, option in baseline.items() if is_asked(get_question(matrix.edition, key), resolved)}
+
+def baseline_preferences(edition, baseline, platform_info):
+    """The baseline as a preferences dict, ready to render, compile or install"""
+    from goose_hints_flow import build_preferences, question_options
+    answers = {}
+    for question in choice_questions(edition):
+        if question['key'] in baseline:
+            answers[question['key']] = next(option for option in question_options(edition, question, platform_info)
+                                            if option['key'] == baseline[question['key']])
+    return build_preferences(edition, answers)
+
+def iter_store_sets(homes, edition, latest_only=True):
+    """(platform, answer keys) streamed from the hints store in each home directory"""
+    from goose_hints_platform import get_user_platform_info
+    from goose_hints_stats import store_answer_keys
+    from goose_hints_store import open_store
+    for home in homes:
+        with open_store(get_user_platform_info(home=home)) as store:
+            for platform_name, choices in store.iter_choices(edition, latest_only):
+                yield platform_name, store_answer_keys(choices)
+
+def iter_answer_file_sets(paths, edition):
+    """(platform, answer keys) from batch-mode answer files
+
+    Answers are matched by option key or number without building option
+    dicts; custom answers count as custom_preference and anything else as
+    unanswered.
+    """
+    from goose_hints_batch import iter_records
+    lookup = {}
+    for question in choice_questions(edition):
+        keys = [option['key'] for option in get_options(edition, question['key'])]
+        lookup[question['key']] = dict({key: key for key in keys}, **{str(i): key for i, key in enumerate(keys, 1)})
+    for path in paths:
+        for _, record in iter_records(path):
+            if not isinstance(record, dict):
+                continue
+            answers = record.get('answers', record)
+            if not isinstance(answers, dict):
+                continue
+            keys = {}
+            for question_key, options in lookup.items():
+                value = answers.get(question_key)
+                if isinstance(value, dict) or (isinstance(value, str) and value.lower().startswith('custom:')):
+                    keys[question_key] = CUSTOM
+                elif value is not None:
+                    option = options.get(str(value).strip())
+                    if option is not None:
+                        keys[question_key] = option
+            yield record.get('system') or UNKNOWN_PLATFORM, keys
+
+def analyze(matrix, min_share=DEFAULT_BASELINE_SHARE, min_support=DEFAULT_MIN_SUPPORT):
+    one_hot = matrix.one_hot()
+    distribution = distributions(matrix, one_hot)
+    return {
+        'edition': matrix.edition,
+        'profiles': len(matrix),
+        'distributions': distribution,
+        'co_occurrence': co_occurrence(matrix, one_hot, min_support),
+        'platforms': platform_breakdown(matrix, one_hot),
+        'baseline': team_baseline(matrix, distribution, min_share),
+    }
+
+def print_report(report):
+    print(f"📊 {report['edition']} preferences across {report['profiles']} profiles")
+    print("\nOption distributions:")
+    for key, options in report['distributions'].items():
+        top = ", ".join(f"{option} {share:.0%}" for option, _, share in options[:3])
+        print(f"   {key:<26}{top or 'no answers'}")
+    print("\nChosen together more than chance:")
+    for question_a, option_a, question_b, option_b, count, lift in report['co_occurrence'][:10]:
+        print(f"   {question_a}={option_a} + {question_b}={option_b}: {count} profiles, lift {lift}")
+    if not report['co_occurrence']:
+        print("   none with enough support")
+    print("\nBy platform (answers that differ from the overall favourite):")
+    overall = {key: options[0][0] for key, options in report['distributions'].items() if options}
+    for name, row in report['platforms'].items():
+        differing = [f"{key}={row[key][0]} {row[key][1]:.0%}" for key in overall
+                     if key in row and row[key][0] != overall[key]]
+        print(f"   {name} ({row['profiles']} profiles): {', '.join(differing) or 'same as overall'}")
+    print("\n🎯 Recommended team baseline:")
+    for key, option in report['baseline'].items():
+        print(f"   {key:<26}{option}")
+    if not report['baseline']:
+        print("   no option has a majority yet")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze many users' preferences and suggest a team baseline")
+    parser.add_argument('--edition', choices=['simple', 'comprehensive'], default='simple')
+    parser.add_argument('--answers', nargs='*', default=[], help="Batch-mode JSONL or CSV answer files")
+    parser.add_argument('--home', nargs='*', default=[], help="Home directories whose hints store to read")
+    parser.add_argument('--history', action='store_true', help="Use every indexed file, not just each store's latest")
+    parser.add_argument('--min-share', type=float, default=DEFAULT_BASELINE_SHARE)
+    parser.add_argument('--min-support', type=int, default=DEFAULT_MIN_SUPPORT)
+    parser.add_argument('--baseline-out', help="Write the baseline as a preferences JSON file")
+    parser.add_argument('--json', action='store_true', help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("❌ Organization analytics needs NumPy: pip install numpy", file=sys.stderr)
+        return 1
+    from itertools import chain
+    from goose_hints_platform import get_user_platform_info
+
+    homes = args.home if args.home or args.answers else [None]
+    sources = chain(iter_answer_file_sets(args.answers, args.edition),
+                    iter_store_sets(homes, args.edition, not args.history) if homes else ())
+    matrix = ProfileMatrix(args.edition, sources)
+    if not len(matrix):
+        print("No preference sets found", file=sys.stderr)
+        return 1
+    report = analyze(matrix, args.min_share, args.min_support)
+
+    if args.baseline_out:
+        from goose_hints_storage import atomic_write
+        preferences = baseline_preferences(args.edition, report['baseline'], get_user_platform_info())
+        atomic_write(args.baseline_out, json.dumps(preferences, indent=2) + "\n")
+        print(f"💾 Team baseline written to {args.baseline_out}", file=sys.stderr)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Batch Mode
+Non-interactive hints generation for whole teams and departments.
+Reads answer records from JSONL or CSV as a stream, answers the Simple Edition
+question engine from each record and renders the hints files across a process
+pool. Each worker renders through a render cache, so users with the same
+answers share one rendering; --render-cache adds a directory all workers share.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+from goose_hints_engine import QuestionSession
+from goose_hints_platform import get_user_platform_info
+from goose_hints_storage import save_hints
+
+# Render cache counters reported per chunk and summed for the run
+CACHE_COUNTERS = ('hits', 'disk_hits', 'misses')
+
+def iter_records(path):
+    """Stream answer records from a JSONL or CSV file as (line_number, record)"""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.suffix.lower() == '.csv':
+            # DictReader's line_num counts physical lines; header is line 1
+            reader = csv.DictReader(f)
+            for record in reader:
+                yield reader.line_num, {k: v for k, v in record.items() if v not in (None, '')}
+        else:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield line_number, e
+                    continue
+                yield line_number, record
+
+def resolve_record(record, platform_info):
+    """Build the same preferences dict universal_hints_builder() produces"""
+    answers = record.get('answers', record)
+    session = QuestionSession('simple', platform_info)
+    while not session.done:
+        session.answer(answers.get(session.question['key']))
+    return session.preferences()
+
+def safe_record_id(record, line_number):
+    """Filesystem-safe identifier for a record, used as its output directory
+
+    Other characters become '_'; when that changes the id, a short hash of
+    the original is appended so ids such as 'j doe' and 'j_doe' keep their
+    own directories. Ids made only of dots raise ValueError.
+    """
+    record_id = str(record.get('id') or f"record-{line_number}")
+    safe = re.sub(r'[^A-Za-z0-9._-]', '_', record_id)
+    if safe != record_id:
+        safe = f"{safe}-{hashlib.sha256(record_id.encode('utf-8')).hexdigest()[:8]}"
+    if not safe.strip('.'):
+        raise ValueError(f"record id {record_id!r} is not a usable directory name")
+    return safe
+
+def render_record(record, line_number, output_dir, timestamp, fsync=False, cache=None):
+    """Resolve and save the hints file for one record, returning (path, written)"""
+    record_id = safe_record_id(record, line_number)
+    platform_info = get_user_platform_info(home=record.get('home'), system=record.get('system'))
+    preferences = resolve_record(record, platform_info)
+    path, written = save_hints(preferences, platform_info, 'simple', Path(output_dir) / record_id,
+                               generated_at=timestamp, fsync=fsync, cache=cache)
+    return str(path), written
+
+def render_chunk(chunk, output_dir, timestamp, fsync=False, cache_dir=None):
+    """Worker entry point: render a chunk of records, never raising per record
+
+    Returns (results, render cache counters for this chunk).
+    """
+    from goose_hints_render_cache import process_cache
+    cache = process_cache(cache_dir)
+    before = cache.stats()
+    results = []
+    for line_number, record in chunk:
+        try:
+            if isinstance(record, Exception):
+                raise ValueError(f"invalid JSON: {record}")
+            if not isinstance(record, dict):
+                raise ValueError("record must be a JSON object")
+            path, written = render_record(record, line_number, output_dir, timestamp, fsync, cache)
+            results.append((line_number, safe_record_id(record, line_number), path, written, None))
+        except Exception as e:
+            try:
+                record_id = safe_record_id(record, line_number)
+            except (AttributeError, ValueError):
+                record_id = f"record-{line_number}"
+            results.append((line_number, record_id, None, False, str(e)))
+    after = cache.stats()
+    return results, {name: after[name] - before[name] for name in CACHE_COUNTERS}
+
+def iter_chunks(records, chunk_size):
+    """Group a record stream into lists of at most chunk_size records"""
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def run_batch(input_path, output_dir, workers=None, chunk_size=100, max_pending=None, progress=None,
+              fsync=False, cache_dir=None):
+    """Render hints for every record in input_path, keeping memory bounded"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    timestamp = datetime.now()
+    summary = {'records': 0, 'succeeded': 0, 'unchanged': 0, 'failed': [],
+               'elapsed': 0.0, 'records_per_second': 0.0, 'cache': dict.fromkeys(CACHE_COUNTERS, 0)}
+    started = time.perf_counter()
+
+    def collect(chunk_result):
+        results, counters = chunk_result
+        for name, value in counters.items():
+            summary['cache'][name] += value
+        for line_number, record_id, path, written, error in results:
+            summary['records'] += 1
+            if error is None:
+                summary['succeeded'] += 1
+                if not written:
+                    summary['unchanged'] += 1
+            else:
+                summary['failed'].append({'line': line_number, 'id': record_id, 'error': error})
+        if progress:
+            progress(summary, time.perf_counter() - started)
+
+    chunks = iter_chunks(iter_records(input_path), chunk_size)
+
+    if workers <= 0:
+        # Inline mode for debugging and tiny inputs
+        for chunk in chunks:
+            collect(render_chunk(chunk, output_dir, timestamp, fsync, cache_dir))
+    else:
+        # Only max_pending chunks are ever read ahead of the workers
+        max_pending = max_pending or workers * 2
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for chunk in chunks:
+                pending.add(executor.submit(render_chunk, chunk, output_dir, timestamp, fsync, cache_dir))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future.result())
+            for future in pending:
+                collect(future.result())
+
+    summary['elapsed'] = time.perf_counter() - started
+    if summary['elapsed'] > 0:
+        summary['records_per_second'] = summary['records'] / summary['elapsed']
+    return summary
+
+def print_summary(summary, max_failures=20):
+    """Print a human-readable batch report"""
+    print(f"\n{'='*60}")
+    print("📦 **Batch Hints Generation Complete**")
+    print(f"{'='*60}")
+    print(f"✅ Records processed: {summary['records']}")
+    print(f"✅ Hints files written: {summary['succeeded'] - summary['unchanged']}")
+    print(f"✅ Unchanged (existing file kept): {summary['unchanged']}")
+    print(f"⏱️  Elapsed: {summary['elapsed']:.2f}s ({summary['records_per_second']:.0f} records/s)")
+    cache = summary['cache']
+    if any(cache.values()):
+        print(f"🗂️  Render cache: {cache['hits']} hits, {cache['disk_hits']} from disk, {cache['misses']} rendered")
+
+    failed = summary['failed']
+    if failed:
+        print(f"\n⚠️  Failed records: {len(failed)}")
+        for failure in failed[:max_failures]:
+            print(f"   line {failure['line']} ({failure['id']}): {failure['error']}")
+        if len(failed) > max_failures:
+            print(f"   ... and {len(failed) - max_failures} more")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Goose hints for many users from an answers file")
+    parser.add_argument('answers', help="JSONL or CSV file with one answer record per user")
+    parser.add_argument('--output-dir', default='goose_hints_batch', help="Directory for per-user hints folders")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (0 = run inline)")
+    parser.add_argument('--chunk-size', type=int, default=100, help="Records per worker task")
+    parser.add_argument('--failed-out', help="Write failed records to this JSONL file")
+    parser.add_argument('--fsync', action='store_true', help="fsync every hints file before renaming it into place")
+    parser.add_argument('--render-cache', metavar='DIR', help="Share rendered templates between workers and runs")
+    args = parser.parse_args(argv)
+
+    def progress(summary, elapsed):
+        rate = summary['records'] / elapsed if elapsed > 0 else 0.0
+        print(f"\r⏳ {summary['records']} records ({rate:.0f}/s), {len(summary['failed'])} failed",
+              end='', file=sys.stderr, flush=True)
+
+    summary = run_batch(args.answers, args.output_dir, workers=args.workers,
+                        chunk_size=args.chunk_size, progress=progress, fsync=args.fsync,
+                        cache_dir=args.render_cache)
+    print(file=sys.stderr)
+    print_summary(summary)
+
+    if args.failed_out and summary['failed']:
+        with open(args.failed_out, 'w', encoding='utf-8') as f:
+            for failure in summary['failed']:
+                f.write(json.dumps(failure) + '\n')
+        print(f"\n💾 Failed records written to {args.failed_out}")
+
+    return 1 if summary['failed'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
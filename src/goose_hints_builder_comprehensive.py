@@ -6,76 +6,57 @@ Full 13-category setup (20-25 minutes) covering all aspects of AI assistant inte
 Designed to work across different operating systems, cloud providers, and user setups.
 """
 
+import argparse
+import contextlib
 import json
-import platform
-from pathlib import Path
-from datetime import datetime
 
-def get_platform_info():
-    """Get platform-specific information for better defaults"""
-    system = platform.system()
-    home_dir = Path.home()
-    
-    # Platform-specific defaults
-    if system == "Windows":
-        default_projects = home_dir / "Documents" / "Projects"
-        default_desktop = home_dir / "Desktop"
-        default_documents = home_dir / "Documents"
-    else:  # macOS, Linux, Unix
-        default_projects = home_dir / "Projects"
-        default_desktop = home_dir / "Desktop" 
-        default_documents = home_dir / "Documents"
-    
-    return {
-        "system": system,
-        "home": home_dir,
-        "projects": default_projects,
-        "desktop": default_desktop,
-        "documents": default_documents
-    }
+from goose_hints_catalog import load_catalog
+from goose_hints_engine import QuestionSession, TerminalView, run_terminal
+from goose_hints_journal import SessionInterrupted, begin_journal, offer_resume
+from goose_hints_platform import get_user_platform_info
+from goose_hints_render import render_hints
+from goose_hints_storage import save_hints
+from goose_hints_state import choose_categories_to_update, load_state, save_state
+from goose_hints_stats import AnswerStats, load_stats, load_stats_table
+from goose_hints_store import open_store
+from goose_hints_screen import preferred_screen
+from goose_hints_telemetry import JsonlExporter, exporting
+from goose_hints_transcript import ask_user, recording
 
-def get_user_choice(question, options, category_num, total_categories, category_name):
-    """Get user choice with category tracking"""
-    print(f"\n🎯 **Category {category_num} of {total_categories}: {category_name}**")
-    print(f"\n📋 **{question}**")
-    print("\nOptions:")
-    for i, option in enumerate(options, 1):
-        print(f"  {i}. {option['label']}")
-    
-    print(f"  {len(options) + 1}. Something else (I'll specify my own preference)")
-    
-    while True:
-        try:
-            choice = input(f"\n👤 Choose 1-{len(options) + 1}: ").strip()
-            choice_num = int(choice)
-            
-            if 1 <= choice_num <= len(options):
-                chosen_option = options[choice_num - 1]
-                print(f"\n✅ Got it! I'll {chosen_option['hint'].lower()}")
-                return chosen_option
-            elif choice_num == len(options) + 1:
-                custom_pref = input("\n👤 Describe your preference: ").strip()
-                if custom_pref:
-                    custom_option = {
-                        'key': 'custom_preference',
-                        'label': f"Custom: {custom_pref}",
-                        'hint': custom_pref
-                    }
-                    print(f"\n✅ Perfect! I'll {custom_pref.lower()}")
-                    return custom_option
-            else:
-                print(f"Please choose a number between 1 and {len(options) + 1}")
-                
-        except ValueError:
-            print("Please enter a number")
-        except KeyboardInterrupt:
-            print("\n\n👋 Setup cancelled. You can run this anytime!")
-            return None
+def ask_preferences(platform_info, categories=None, journal=None, stats=None, defaults=None):
+    """Ask the questions for the given categories (all 13 by default) and return their preferences
+
+    Questions already answered in the journal are skipped; with answer
+    stats the most informative questions come first and predictable answers
+    are offered for bulk review; defaults preselects options that Enter
+    accepts. Raises SessionInterrupted if the user cancels.
+    """
+    answers = journal.answers if journal is not None else None
+    session = QuestionSession('comprehensive', platform_info, categories, answers, stats, defaults)
+    return run_terminal(session, TerminalView(), journal)
 
-def comprehensive_hints_builder():
-    """Run comprehensive 13-category hints builder"""
+def detect_defaults(platform_info):
+    """Preselected file organization from scanning the projects folder"""
+    from goose_hints_layout import COMPREHENSIVE_SCHEMES, scan_root
+    layout = scan_root(platform_info['projects'], platform_info)
+    if layout['scheme'] is None:
+        return {}
+    print(f"🔎 {layout['counts'][layout['scheme']]} of {layout['projects_scanned']} projects in {layout['root']} "
+          f"follow one layout ({layout['confidence']:.0%} confidence)")
+    return {'organization': COMPREHENSIVE_SCHEMES[layout['scheme']]}
+
+def comprehensive_hints_builder(update=False, resume=False, adaptive=False, defaults=None, stats_table=None):
+    """Run comprehensive 13-category hints builder
+
+    update=True only revisits chosen categories; resume=True continues an
+    interrupted session from its journal; adaptive=True orders and pre-fills
+    questions from the answer statistics built by goose_hints_stats.py.
+    defaults maps question keys to preselected option keys (see detect_defaults()).
+    stats_table is the statistics table for adaptive=True; by default it is
+    read from the home directory.
+    """
     
-    platform_info = get_platform_info()
+    platform_info = get_user_platform_info()
     
     print("🦆 **Goose Hints Builder - Comprehensive Edition**")
     print("="*70)
@@ -99,86 +80,54 @@ def comprehensive_hints_builder():
     print("   • Workflow patterns & automation")
     print("   • Security & privacy preferences")
     
-    start_response = input("\n👤 Ready for the comprehensive personalized Goose experience? (yes/no): ").strip().lower()
+    catalog_categories = load_catalog()['editions']['comprehensive']['categories']
+    journal = offer_resume(platform_info, 'comprehensive', resume)
+    
+    if journal is not None:
+        categories = journal.header['categories']
+        state = load_state(platform_info, 'comprehensive') if journal.header['update'] else None
+        preferences = dict(state['preferences']) if state is not None else {}
+    else:
+        state = load_state(platform_info, 'comprehensive') if update else None
+        if update and state is None:
+            print("\n📂 No saved preferences found yet - let's run the full setup.")
+        
+        if state is not None:
+            categories = choose_categories_to_update(state, 'comprehensive')
+            preferences = dict(state['preferences'])
+        else:
+            start_response = ask_user("\n👤 Ready for the comprehensive personalized Goose experience? (yes/no): ").strip().lower()
+            
+            if start_response not in ['yes', 'y', 'sure', 'ok', 'ready', 'absolutely']:
+                print("\n👋 No problem! You can run this comprehensive experience anytime.")
+                return None, None
+            
+            categories = catalog_categories
+            preferences = {}
+        
+        journal = begin_journal(platform_info, 'comprehensive', categories, update=state is not None)
+    
+    if not adaptive:
+        stats = None
+    elif stats_table is not None:
+        stats = AnswerStats(stats_table)
+    else:
+        stats = load_stats(platform_info, 'comprehensive')
+    if adaptive and stats is None:
+        print("\n📊 No answer statistics yet - asking every question in the usual order.")
     
-    if start_response not in ['yes', 'y', 'sure', 'ok', 'ready', 'absolutely']:
-        print("\n👋 No problem! You can run this comprehensive experience anytime.")
+    try:
+        preferences.update(ask_preferences(platform_info, categories, journal, stats, defaults))
+    except SessionInterrupted:
+        if journal is not None:
+            print("💾 Your answers so far are saved. Run with --resume to pick up where you left off.")
         return None, None
+    finally:
+        if journal is not None:
+            journal.close()
     
-    preferences = {}
-    total_categories = 13
-    
-    # CATEGORY 1: OUTPUT FORMATS
-    options = [
-        {"key": "markdown_rich", "label": "Rich markdown with tables, charts, and executive summaries", "hint": "Use comprehensive markdown formatting with tables, visualizations, and structured summaries"},
-        {"key": "code_focused", "label": "Code blocks with syntax highlighting and technical details", "hint": "Emphasize code examples with proper syntax highlighting and technical implementation details"},
-        {"key": "visual_first", "label": "Charts and visualizations whenever possible", "hint": "Prioritize visual representations, charts, graphs, and diagrams for data presentation"},
-        {"key": "structured_reports", "label": "Professional reports with headers, sections, and appendices", "hint": "Create structured professional documents with clear sections, headers, and organized appendices"},
-        {"key": "interactive_format", "label": "Interactive elements and step-by-step breakdowns", "hint": "Use interactive formatting with step-by-step instructions and engaging elements"}
-    ]
-    
-    choice = get_user_choice(
-        "When I present information and analysis, what format style do you prefer?", 
-        options, 1, total_categories, "Output Formats"
-    )
-    if choice is None: return None, None
-    preferences['output_formats'] = choice
-    
-    # CATEGORY 2: FILE MANAGEMENT  
-    options = [
-        {"key": "descriptive_naming", "label": "Descriptive names with dates and version numbers", "hint": "Use detailed, descriptive file names with timestamps and version tracking"},
-        {"key": "project_hierarchy", "label": "Organized project folders with clear structure", "hint": "Maintain organized directory structures with logical project hierarchies"},
-        {"key": "date_organized", "label": "Date-based organization with chronological folders", "hint": "Organize files chronologically with date-based folder structures"},
-        {"key": "type_organized", "label": "File type organization (data/, scripts/, docs/, output/)", "hint": "Organize files by type into dedicated folders for different content categories"},
-        {"key": "minimal_structure", "label": "Simple, flat structure with minimal folders", "hint": "Keep file organization simple with minimal folder nesting and flat structures"}
-    ]
-    
-    choice = get_user_choice(
-        "How should I organize and name files for your projects?",
-        options, 2, total_categories, "File Management"
-    )
-    if choice is None: return None, None
-    
-    # File management sub-preferences
-    print("\n📋 **What's your preferred backup strategy?**")
-    backup_options = [
-        {"key": "auto_cloud", "label": "Automatic cloud backup for all important files", "hint": "Automatically backup important files to cloud storage"},
-        {"key": "selective_backup", "label": "Selective backup - ask before backing up files", "hint": "Confirm before backing up files to give you control over what gets stored"},
-        {"key": "local_backup", "label": "Local backups only with timestamped copies", "hint": "Create local backup copies with timestamps without cloud storage"},
-        {"key": "manual_control", "label": "Manual backup control - I'll handle it myself", "hint": "No automatic backups - you maintain full control over file backup"}
-    ]
-    
-    backup_choice = get_user_choice(
-        "What's your preferred backup strategy?",
-        backup_options, 2, total_categories, "File Management"
-    )
-    if backup_choice is None: return None, None
-    
-    preferences['file_management'] = {
-        'organization': choice,
-        'backup_strategy': backup_choice
-    }
-    
-    # Continue with remaining 11 categories...
-    # For brevity in this example, I'll show the structure for a few more categories
-    
-    # CATEGORY 3: DOCUMENTATION STANDARDS
-    options = [
-        {"key": "comprehensive_docs", "label": "Comprehensive documentation with detailed comments", "hint": "Provide extensive documentation with detailed comments explaining all code sections"},
-        {"key": "concise_focused", "label": "Concise, focused documentation for key points only", "hint": "Keep documentation concise and focused on essential information and key decision points"},
-        {"key": "example_heavy", "label": "Example-heavy documentation with use cases", "hint": "Include extensive examples and real-world use cases in all documentation"},
-        {"key": "readme_focused", "label": "Strong README files with setup and usage guides", "hint": "Create comprehensive README files with clear setup instructions and usage examples"},
-        {"key": "inline_comments", "label": "Inline comments explaining logic and decisions", "hint": "Use detailed inline comments to explain logic, decisions, and implementation choices"}
-    ]
-    
-    choice = get_user_choice(
-        "What's your preferred approach to documentation and comments?",
-        options, 3, total_categories, "Documentation Standards"
-    )
-    if choice is None: return None, None
-    preferences['documentation_standards'] = choice
-    
-    # ... Continue with all 13 categories
+    # Keep categories in catalog order after an update
+    preferences = {category: preferences[category] for category in catalog_categories if category in preferences}
     
     # COMPLETION AND FILE GENERATION
     print(f"\n{'='*70}")
@@ -193,66 +142,35 @@ def comprehensive_hints_builder():
     print("✅ Cross-platform compatibility ensured")
     print("✅ Professional-grade personalization complete")
     
-    # Generate comprehensive hints file
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
     # Save to user's home directory
     output_dir = platform_info['home'] / "goose_hints"
-    output_dir.mkdir(exist_ok=True)
-    filename = output_dir / f"comprehensive_goose_hints_{timestamp}.txt"
-    
-    hints_content = f"""# Comprehensive Goose Hints - Generated {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-# Platform: {platform_info['system']}
-# Home Directory: {platform_info['home']}
-# Configuration: Comprehensive 13-Category Personalization
-
-## Your Comprehensive Goose Configuration:
-
-### 1. Output Formats:
-- {preferences['output_formats']['hint']}
-
-### 2. File Management:
-- Organization: {preferences['file_management']['organization']['hint']}
-- Backup Strategy: {preferences['file_management']['backup_strategy']['hint']}
-
-### 3. Documentation Standards:
-- {preferences['documentation_standards']['hint']}
-
-## Universal Features Validated:
-- ✅ Cross-platform compatibility: {platform_info['system']} support
-- ✅ Universal file paths: Platform-appropriate defaults  
-- ✅ Multiple cloud options: Not limited to single provider
-- ✅ Custom preferences: Available for all 13 categories
-- ✅ Comprehensive personalization: Professional-grade configuration
-- ✅ No hardcoded assumptions: Truly universal and accessible
-
-## Integration Instructions:
-1. Save these hints to your Goose memory system using the memory tools
-2. Test with sample tasks to validate your preferences work as expected
-3. Refine any settings based on actual usage and workflow needs
-4. Share this comprehensive configuration template with your team
-5. Use as a baseline for organizational preference standards
-
-## File Location:
-{filename}
-
----
-Generated by Goose Hints Builder - Comprehensive Edition
-Ready for Help menu integration and universal deployment!
-"""
     
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(hints_content)
-        print(f"\n💾 **Comprehensive Hints File Saved:** {filename}")
-        print(f"📄 **File size:** Professional-grade comprehensive configuration")
+        with open_store(platform_info) as store:
+            filename, written = save_hints(preferences, platform_info, 'comprehensive', output_dir, store=store)
+        hints_content = filename.read_text(encoding='utf-8')
+        if written:
+            print(f"\n💾 **Comprehensive Hints File Saved:** {filename}")
+            print(f"📄 **File size:** Professional-grade comprehensive configuration")
+        else:
+            print(f"\n💾 **Preferences unchanged - existing hints kept:** {filename}")
     except Exception as e:
-        print(f"\n⚠️  Could not save to {filename}: {e}")
+        hints_content = render_hints(preferences, platform_info, output_dir, 'comprehensive')
+        print(f"\n⚠️  Could not save to {output_dir}: {e}")
         print("Here's your comprehensive configuration to copy manually:")
         print("\n" + "="*70)
         print(hints_content)
         print("="*70)
     
+    try:
+        state_file = save_state(preferences, platform_info, 'comprehensive')
+        print(f"📂 **Preferences saved for quick updates:** {state_file}")
+    except Exception as e:
+        print(f"⚠️  Could not save preferences for later updates: {e}")
+    
+    if journal is not None:
+        journal.discard()
+    
     print("\n🚀 **Your Comprehensive Personalized Goose Experience is Ready!**")
     print("\n🎯 **What You've Accomplished:**")
     print("✅ Complete 13-category personalization")
@@ -263,7 +181,7 @@ Ready for Help menu integration and universal deployment!
     print("✅ Immediate usability for your workflow")
     
     print("\n📋 **Next Steps:**")
-    print("1. Save these comprehensive hints to Goose memory")
+    print("1. Add these hints to Goose: rerun with --install, or run 'goose-hints install --edition comprehensive'")
     print("2. Test your personalized preferences with real tasks")
     print("3. Fine-tune any settings based on experience")
     print("4. Share your configuration approach with teammates")
@@ -271,17 +189,53 @@ Ready for Help menu integration and universal deployment!
     
     return preferences, hints_content
 
-if __name__ == "__main__":
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Goose Hints Builder - Comprehensive Edition")
+    parser.add_argument('--update', action='store_true',
+                        help="Load saved preferences and only revisit the categories you choose")
+    parser.add_argument('--resume', action='store_true',
+                        help="Continue an interrupted session at the first unanswered question")
+    parser.add_argument('--record', metavar='TRANSCRIPT',
+                        help="Record every prompt, answer and timing to a transcript for replay")
+    parser.add_argument('--telemetry', metavar='EVENTS',
+                        help="Append per-question timing events to a JSONL file (see goose-hints telemetry)")
+    parser.add_argument('--full-screen', action='store_true',
+                        help="Redraw questions in place and pick options with the arrow keys")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="Ask the most informative questions first and pre-fill predictable answers")
+    parser.add_argument('--no-probe', action='store_true',
+                        help="Don't scan your projects folder to preselect the file organization answer")
+    parser.add_argument('--install', action='store_true',
+                        help="Write the preferences into Goose's global hints and memory when done")
+    args = parser.parse_args(argv)
+    # Scanned before recording starts so a replay sees the same preselected answers
+    defaults = {} if args.no_probe else detect_defaults(get_user_platform_info())
+    # The statistics table too, so an adaptive replay asks in the recorded order
+    stats_table = load_stats_table(get_user_platform_info(), 'comprehensive') if args.adaptive else None
+    options = {'update': args.update, 'resume': args.resume, 'adaptive': args.adaptive, 'defaults': defaults,
+               'stats_table': stats_table}
+    transcript = recording(args.record, 'comprehensive', options) if args.record else contextlib.nullcontext()
+    telemetry = exporting(JsonlExporter(args.telemetry)) if args.telemetry else contextlib.nullcontext()
+    screen = preferred_screen('full') if args.full_screen else contextlib.nullcontext()
+    
     try:
         print("🎯 Starting Comprehensive 13-Category Goose Hints Builder...")
-        preferences, hints = comprehensive_hints_builder()
+        with transcript, telemetry, screen:
+            preferences, hints = comprehensive_hints_builder(**options)
         if preferences:
             print(f"\n✅ Comprehensive 13-category personalization successful!")
             print(f"✅ Professional-grade hints file created!")
             print(f"✅ Universal compatibility validated!")
             print(f"✅ Ready for immediate use!")
+            if args.install:
+                from goose_hints_install import install_and_report
+                install_and_report(preferences, get_user_platform_info())
     except KeyboardInterrupt:
         print("\n\n👋 Comprehensive hints builder cancelled. You can run this anytime!")
+        print("💾 Answers given so far are kept - run with --resume to continue.")
     except Exception as e:
         print(f"\n❌ An error occurred: {e}")
         print("Please report this issue so we can improve the universal compatibility!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Question Catalog
+Single declarative source of truth for the categories, questions, options and
+conditional follow-ups used by both editions. The catalog is validated and
+compiled once into an indexed structure, and the compiled form is cached on
+disk keyed by the catalog hash so later runs load it in one step.
+"""
+
+import hashlib
+import json
+import os
+import pickle  # nosec B403 - the cache directory is trusted like the user's own files; see _read_cache
+import tempfile
+from pathlib import Path
+
+# Shared option sets, referenced by name from the edition questions below.
+# Hints and labels may use {projects}, {desktop}, {documents} and {home}
+# placeholders, filled in from the user's platform info.
+OPTION_SETS = {
+    "simple_output_formats": [
+        {"key": "markdown_tables", "label": "Clean markdown tables with summaries", "hint": "Present data in well-formatted markdown tables with executive summaries"},
+        {"key": "code_output", "label": "Raw code output with technical details", "hint": "Show detailed technical output with code execution details"},
+        {"key": "visual_charts", "label": "Charts and visualizations when possible", "hint": "Create visualizations and charts for data presentation"},
+        {"key": "mixed_approach", "label": "Mix of tables, charts, and summaries", "hint": "Use varied presentation formats: tables, charts, and executive summaries"},
+        {"key": "simple_text", "label": "Simple text responses", "hint": "Provide clear, simple text responses without complex formatting"}
+    ],
+    "communication_styles": [
+        {"key": "detailed_progress", "label": "Show me detailed progress and steps", "hint": "Display all working steps and execution progress with full transparency"},
+        {"key": "silent_execution", "label": "Work quietly, show me final results", "hint": "Execute tasks silently and present final results without progress updates"},
+        {"key": "milestone_updates", "label": "Update me at key milestones only", "hint": "Provide updates at key milestones during longer tasks"},
+        {"key": "interactive", "label": "Ask me questions and confirm decisions", "hint": "Seek confirmation for decisions and ask clarifying questions regularly"}
+    ],
+    "fonts": [
+        {"key": "montserrat", "label": "Montserrat (modern, clean)", "hint": "Use Montserrat as primary font"},
+        {"key": "roboto", "label": "Roboto (readable, professional)", "hint": "Use Roboto as primary font"},
+        {"key": "arial", "label": "Arial (classic, universal)", "hint": "Use Arial as primary font"},
+        {"key": "times", "label": "Times New Roman (traditional, formal)", "hint": "Use Times New Roman as primary font"},
+        {"key": "system_default", "label": "System default font", "hint": "Use system default font for documents"}
+    ],
+    "document_formats": [
+        {"key": "cloud_docs", "label": "Cloud documents (Google Docs, Office 365, etc.)", "hint": "Create documents in cloud-based collaborative format"},
+        {"key": "markdown", "label": "Markdown (portable, version-controllable)", "hint": "Create documents in Markdown format"},
+        {"key": "pdf", "label": "PDF (professional, print-ready)", "hint": "Create documents in PDF format"},
+        {"key": "word", "label": "Microsoft Word (standard business format)", "hint": "Create documents in Word format"},
+        {"key": "plain_text", "label": "Plain text (simple, universal)", "hint": "Create documents in plain text format"}
+    ],
+    "root_directories": [
+        {"key": "home_projects", "label": "Projects folder ({projects})", "hint": "Use {projects} as root with project subdirectories"},
+        {"key": "desktop", "label": "Desktop ({desktop})", "hint": "Use Desktop as primary working directory"},
+        {"key": "documents", "label": "Documents folder ({documents})", "hint": "Use Documents folder as root directory"},
+        {"key": "current_dir", "label": "Current working directory", "hint": "Use current directory as project root"},
+        {"key": "custom_path", "label": "Custom path (I'll specify)", "hint": "Use custom specified root directory"}
+    ],
+    "data_organizations": [
+        {"key": "cookiecutter", "label": "Data science structure (data/, src/, docs/, notebooks/)", "hint": "Use cookiecutter data science project structure"},
+        {"key": "simple_folders", "label": "Simple folders (input/, output/, scripts/)", "hint": "Use simple three-folder organization structure"},
+        {"key": "by_date", "label": "Date-based organization (YYYY-MM-DD folders)", "hint": "Organize files chronologically by date"},
+        {"key": "by_type", "label": "File type organization (csv/, scripts/, reports/)", "hint": "Organize files by type and format"},
+        {"key": "flat_structure", "label": "Flat structure (all files in project root)", "hint": "Keep all project files in single directory"}
+    ],
+    "simple_backup_strategies": [
+        {"key": "always_backup", "label": "Yes, backup all important files automatically", "hint": "Automatically backup important files to your preferred cloud storage"},
+        {"key": "ask_for_backup", "label": "Ask me for each important file", "hint": "Confirm before backing up files to cloud storage"},
+        {"key": "manual_backup", "label": "No automatic backups, I'll handle it manually", "hint": "No automatic cloud backups"},
+        {"key": "selective_backup", "label": "Only backup final deliverables and reports", "hint": "Backup only completed work and final outputs to cloud storage"},
+        {"key": "local_backup", "label": "Local backups only (no cloud)", "hint": "Create local backup copies without cloud storage"}
+    ],
+    "cloud_providers": [
+        {"key": "google_drive", "label": "Google Drive", "hint": "Use Google Drive for cloud backups"},
+        {"key": "onedrive", "label": "Microsoft OneDrive", "hint": "Use OneDrive for cloud backups"},
+        {"key": "dropbox", "label": "Dropbox", "hint": "Use Dropbox for cloud backups"},
+        {"key": "icloud", "label": "iCloud Drive (macOS)", "hint": "Use iCloud Drive for cloud backups"},
+        {"key": "multiple", "label": "Multiple providers", "hint": "Use multiple cloud storage providers"}
+    ],
+    "coding_languages": [
+        {"key": "python_focus", "label": "Python for most programming tasks", "hint": "Prefer Python for data analysis and programming tasks"},
+        {"key": "r_focus", "label": "R for data analysis, Python for other tasks", "hint": "Prefer R for data analysis and Python for other programming tasks"},
+        {"key": "javascript_focus", "label": "JavaScript for web and automation tasks", "hint": "Prefer JavaScript for web development and automation"},
+        {"key": "language_agnostic", "label": "Choose best language for each task", "hint": "Select the most appropriate programming language for each specific task"},
+        {"key": "minimal_code", "label": "Minimize coding, prefer existing tools", "hint": "Use existing tools and minimize custom code development"}
+    ],
+    "comprehensive_output_formats": [
+        {"key": "markdown_rich", "label": "Rich markdown with tables, charts, and executive summaries", "hint": "Use comprehensive markdown formatting with tables, visualizations, and structured summaries"},
+        {"key": "code_focused", "label": "Code blocks with syntax highlighting and technical details", "hint": "Emphasize code examples with proper syntax highlighting and technical implementation details"},
+        {"key": "visual_first", "label": "Charts and visualizations whenever possible", "hint": "Prioritize visual representations, charts, graphs, and diagrams for data presentation"},
+        {"key": "structured_reports", "label": "Professional reports with headers, sections, and appendices", "hint": "Create structured professional documents with clear sections, headers, and organized appendices"},
+        {"key": "interactive_format", "label": "Interactive elements and step-by-step breakdowns", "hint": "Use interactive formatting with step-by-step instructions and engaging elements"}
+    ],
+    "file_organizations": [
+        {"key": "descriptive_naming", "label": "Descriptive names with dates and version numbers", "hint": "Use detailed, descriptive file names with timestamps and version tracking"},
+        {"key": "project_hierarchy", "label": "Organized project folders with clear structure", "hint": "Maintain organized directory structures with logical project hierarchies"},
+        {"key": "date_organized", "label": "Date-based organization with chronological folders", "hint": "Organize files chronologically with date-based folder structures"},
+        {"key": "type_organized", "label": "File type organization (data/, scripts/, docs/, output/)", "hint": "Organize files by type into dedicated folders for different content categories"},
+        {"key": "minimal_structure", "label": "Simple, flat structure with minimal folders", "hint": "Keep file organization simple with minimal folder nesting and flat structures"}
+    ],
+    "comprehensive_backup_strategies": [
+        {"key": "auto_cloud", "label": "Automatic cloud backup for all important files", "hint": "Automatically backup important files to cloud storage"},
+        {"key": "selective_backup", "label": "Selective backup - ask before backing up files", "hint": "Confirm before backing up files to give you control over what gets stored"},
+        {"key": "local_backup", "label": "Local backups only with timestamped copies", "hint": "Create local backup copies with timestamps without cloud storage"},
+        {"key": "manual_control", "label": "Manual backup control - I'll handle it myself", "hint": "No automatic backups - you maintain full control over file backup"}
+    ],
+    "documentation_standards": [
+        {"key": "comprehensive_docs", "label": "Comprehensive documentation with detailed comments", "hint": "Provide extensive documentation with detailed comments explaining all code sections"},
+        {"key": "concise_focused", "label": "Concise, focused documentation for key points only", "hint": "Keep documentation concise and focused on essential information and key decision points"},
+        {"key": "example_heavy", "label": "Example-heavy documentation with use cases", "hint": "Include extensive examples and real-world use cases in all documentation"},
+        {"key": "readme_focused", "label": "Strong README files with setup and usage guides", "hint": "Create comprehensive README files with clear setup instructions and usage examples"},
+        {"key": "inline_comments", "label": "Inline comments explaining logic and decisions", "hint": "Use detailed inline comments to explain logic, decisions, and implementation choices"}
+    ],
+    "analysis_approaches": [
+        {"key": "exploratory_first", "label": "Exploratory analysis and summary statistics first", "hint": "Start with exploratory data analysis and descriptive statistics before modelling"},
+        {"key": "statistical_rigor", "label": "Rigorous statistics with tests and confidence intervals", "hint": "Apply rigorous statistical methods, check assumptions and report confidence intervals"},
+        {"key": "visual_exploration", "label": "Visual exploration first, detailed numbers second", "hint": "Explore data visually with plots before presenting detailed numbers"},
+        {"key": "quick_insights", "label": "Quick, practical insights over statistical depth", "hint": "Focus on quick, actionable insights rather than statistical depth"},
+        {"key": "reproducible_pipeline", "label": "Reproducible scripted pipelines for every analysis", "hint": "Build reproducible, scripted analysis pipelines that can be rerun end to end"}
+    ],
+    "comprehensive_communication_styles": [
+        {"key": "concise_direct", "label": "Concise and direct - lead with the answer", "hint": "Keep responses concise and direct, leading with the answer"},
+        {"key": "detailed_explanations", "label": "Detailed explanations with the reasoning behind them", "hint": "Explain the reasoning behind every answer in detail"},
+        {"key": "teaching_mode", "label": "Teach me as we go with background and context", "hint": "Include background and context so the underlying concepts are clear"},
+        {"key": "executive_summary", "label": "Executive summary first, details on request", "hint": "Lead with an executive summary and offer details on request"},
+        {"key": "conversational", "label": "Friendly, conversational tone", "hint": "Use a friendly, conversational tone"}
+    ],
+    "feedback_approaches": [
+        {"key": "remember_corrections", "label": "Remember my corrections and apply them going forward", "hint": "Remember corrections and apply them consistently in future tasks"},
+        {"key": "suggest_improvements", "label": "Suggest improvements to my approach when you see them", "hint": "Proactively suggest improvements to workflows and approaches"},
+        {"key": "ask_for_feedback", "label": "Ask for feedback after completing major tasks", "hint": "Ask for feedback after completing major tasks"},
+        {"key": "explain_alternatives", "label": "Show alternative approaches I could learn from", "hint": "Point out alternative approaches and explain their trade-offs"},
+        {"key": "minimal_feedback", "label": "Just do the work - no feedback loops", "hint": "Complete tasks without asking for feedback or suggesting changes"}
+    ],
+    "progress_reporting": [
+        {"key": "step_by_step", "label": "Report every step as it happens", "hint": "Report each step as it is completed"},
+        {"key": "milestone_reports", "label": "Short summaries at key milestones", "hint": "Report progress at key milestones with short summaries"},
+        {"key": "percentage_estimates", "label": "Progress percentages and time estimates", "hint": "Give progress percentages and estimated time remaining"},
+        {"key": "final_summary_only", "label": "Only a final summary when finished", "hint": "Work without progress updates and give a final summary when finished"},
+        {"key": "issues_only", "label": "Only tell me when something goes wrong", "hint": "Only report progress when problems or blockers come up"}
+    ],
+    "decision_autonomy": [
+        {"key": "full_autonomy", "label": "Make decisions yourself and tell me afterwards", "hint": "Make decisions independently and explain them afterwards"},
+        {"key": "confirm_major", "label": "Decide small things, confirm major decisions with me", "hint": "Handle routine decisions independently and confirm major decisions first"},
+        {"key": "present_options", "label": "Present options with a recommendation, I'll choose", "hint": "Present options with a clear recommendation and let the user choose"},
+        {"key": "always_ask", "label": "Always ask before making any decision", "hint": "Ask for approval before making any decision"}
+    ],
+    "time_priorities": [
+        {"key": "speed_first", "label": "Fast results - good enough beats perfect", "hint": "Prioritize fast, good-enough results over perfection"},
+        {"key": "balanced", "label": "Balance speed and quality", "hint": "Balance delivery speed with quality"},
+        {"key": "thorough_first", "label": "Thorough work even if it takes longer", "hint": "Prioritize thoroughness and quality even when it takes longer"},
+        {"key": "deadline_driven", "label": "Ask about deadlines and plan around them", "hint": "Ask about deadlines and plan work to meet them"},
+        {"key": "priority_ordered", "label": "Tackle the most important items first", "hint": "Work on the highest-priority items first and flag what can wait"}
+    ],
+    "code_organizations": [
+        {"key": "modular_functions", "label": "Small, modular functions with clear names", "hint": "Write small, modular functions with clear, descriptive names"},
+        {"key": "object_oriented", "label": "Object-oriented design with classes", "hint": "Use object-oriented design with well-defined classes"},
+        {"key": "scripts_notebooks", "label": "Scripts and notebooks for quick iteration", "hint": "Use scripts and notebooks for fast iteration"},
+        {"key": "tested_code", "label": "Unit tests alongside all code", "hint": "Write unit tests alongside code and follow test-driven development"},
+        {"key": "follow_existing", "label": "Follow the conventions already in the project", "hint": "Match the existing project's conventions and structure"}
+    ],
+    "error_handling": [
+        {"key": "full_tracebacks", "label": "Full error messages and tracebacks", "hint": "Show complete error messages and tracebacks"},
+        {"key": "plain_explanation", "label": "Plain-language explanation of what went wrong", "hint": "Explain errors in plain language without raw tracebacks"},
+        {"key": "fix_automatically", "label": "Fix it automatically and tell me what you did", "hint": "Fix errors automatically where possible and summarize the fix"},
+        {"key": "ask_before_fixing", "label": "Explain the problem and ask before fixing", "hint": "Explain the problem and ask before applying a fix"},
+        {"key": "debug_together", "label": "Walk me through debugging step by step", "hint": "Walk through debugging step by step together"}
+    ],
+    "workflow_patterns": [
+        {"key": "automate_repetitive", "label": "Automate anything I do more than once", "hint": "Automate repetitive steps with scripts and reusable tools"},
+        {"key": "plan_then_execute", "label": "Plan the whole task first, then execute", "hint": "Outline a complete plan before starting execution"},
+        {"key": "iterative_small_steps", "label": "Small iterative steps with checkpoints", "hint": "Work in small iterative steps with checkpoints along the way"},
+        {"key": "reuse_templates", "label": "Reuse templates and standard workflows", "hint": "Reuse templates and established workflows wherever possible"},
+        {"key": "manual_steps", "label": "Keep things manual so I stay in control", "hint": "Keep workflows manual and avoid automating steps without approval"}
+    ],
+    "security_privacy": [
+        {"key": "strict_privacy", "label": "Strict - never store or display sensitive data", "hint": "Never store, log or display sensitive data or credentials"},
+        {"key": "mask_sensitive", "label": "Mask sensitive values in all output", "hint": "Mask credentials and personal data in all output"},
+        {"key": "local_only", "label": "Keep all data local, no external services", "hint": "Keep data on this machine and avoid sending it to external services"},
+        {"key": "ask_before_sharing", "label": "Ask before sending data anywhere", "hint": "Ask before uploading or sharing any data"},
+        {"key": "standard_practices", "label": "Standard security practices are fine", "hint": "Follow standard security best practices"}
+    ],
+}
+
+# Editions are ordered lists of categories. A question whose key equals its
+# category key is stored at the top level of the preferences dict; any other
+# question is stored under preferences[category][question]. Questions with a
+# "when" clause are follow-ups that only appear for some earlier answers.
+# "explain" offers an 'explain' answer listing every option's hint, and
+# "confirm_custom" reads a custom preference back for a yes/no confirmation.
+EDITIONS = {
+    "simple": {
+        "name": "Simple Edition",
+        "explain": True,
+        "confirm_custom": True,
+        "categories": [
+            {"key": "output_formats", "name": "Output Formats", "questions": [
+                {"key": "output_formats", "options": "simple_output_formats",
+                 "text": "When I analyze data and show you results, which format feels most useful?"}
+            ]},
+            {"key": "communication_style", "name": "Communication Style", "questions": [
+                {"key": "communication_style", "options": "communication_styles",
+                 "text": "How would you like me to communicate during tasks?"}
+            ]},
+            {"key": "document_formatting", "name": "Document Formatting", "questions": [
+                {"key": "exemplar_files", "type": "text", "required": False,
+                 "text": "Do you have any exemplar files that show your preferred formatting style?"},
+                {"key": "preferred_font", "options": "fonts",
+                 "text": "What's your preferred font for documents?"},
+                {"key": "document_format", "options": "document_formats",
+                 "text": "What's your preferred document format for final deliverables?"}
+            ]},
+            {"key": "file_management", "name": "File Management", "questions": [
+                {"key": "root_directory", "options": "root_directories",
+                 "text": "What should be your default root directory for projects?"},
+                {"key": "custom_root_path", "type": "text", "applies_to": "root_directory",
+                 "hint": "Use {value} as root directory",
+                 "when": {"question": "root_directory", "in": ["custom_path"]},
+                 "text": "Enter your preferred root directory path"},
+                {"key": "data_organization", "options": "data_organizations",
+                 "text": "How should I organize project data and files?"},
+                {"key": "backup_strategy", "options": "simple_backup_strategies",
+                 "text": "Should I automatically create backups in cloud storage?"},
+                {"key": "cloud_provider", "options": "cloud_providers",
+                 "when": {"question": "backup_strategy", "in": ["always_backup", "ask_for_backup", "selective_backup"]},
+                 "text": "Which cloud storage do you prefer?"}
+            ]},
+            {"key": "coding_preferences", "name": "Coding Preferences", "questions": [
+                {"key": "coding_preferences", "options": "coding_languages",
+                 "text": "What are your programming language preferences?"}
+            ]},
+        ],
+    },
+    "comprehensive": {
+        "name": "Comprehensive Edition",
+        "explain": False,
+        "confirm_custom": False,
+        "categories": [
+            {"key": "output_formats", "name": "Output Formats", "questions": [
+                {"key": "output_formats", "options": "comprehensive_output_formats",
+                 "text": "When I present information and analysis, what format style do you prefer?"}
+            ]},
+            {"key": "file_management", "name": "File Management", "questions": [
+                {"key": "organization", "options": "file_organizations",
+                 "text": "How should I organize and name files for your projects?"},
+                {"key": "backup_strategy", "options": "comprehensive_backup_strategies",
+                 "text": "What's your preferred backup strategy?"}
+            ]},
+            {"key": "documentation_standards", "name": "Documentation Standards", "questions": [
+                {"key": "documentation_standards", "options": "documentation_standards",
+                 "text": "What's your preferred approach to documentation and comments?"}
+            ]},
+            {"key": "data_analysis_approach", "name": "Data Analysis Approach", "questions": [
+                {"key": "data_analysis_approach", "options": "analysis_approaches",
+                 "text": "How should I approach data analysis and how deep should the statistics go?"}
+            ]},
+            {"key": "communication_style", "name": "Communication Style", "questions": [
+                {"key": "communication_style", "options": "comprehensive_communication_styles",
+                 "text": "How much detail do you want in my explanations?"}
+            ]},
+            {"key": "feedback_learning", "name": "Feedback & Learning", "questions": [
+                {"key": "feedback_learning", "options": "feedback_approaches",
+                 "text": "How should I handle feedback and adapt to the way you work?"}
+            ]},
+            {"key": "progress_reporting", "name": "Progress Reporting", "questions": [
+                {"key": "progress_reporting", "options": "progress_reporting",
+                 "text": "How should I report progress on longer tasks?"}
+            ]},
+            {"key": "decision_making", "name": "Decision Making", "questions": [
+                {"key": "decision_making", "options": "decision_autonomy",
+                 "text": "How much autonomy should I have when making decisions?"}
+            ]},
+            {"key": "time_management", "name": "Time Management", "questions": [
+                {"key": "time_management", "options": "time_priorities",
+                 "text": "How should I balance speed against thoroughness?"}
+            ]},
+            {"key": "developer_preferences", "name": "Developer Preferences", "questions": [
+                {"key": "developer_preferences", "options": "code_organizations",
+                 "text": "How should I structure and organize code?"}
+            ]},
+            {"key": "error_handling", "name": "Error Handling", "questions": [
+                {"key": "error_handling", "options": "error_handling",
+                 "text": "When something goes wrong, how much detail do you want?"}
+            ]},
+            {"key": "workflow_patterns", "name": "Workflow Patterns", "questions": [
+                {"key": "workflow_patterns", "options": "workflow_patterns",
+                 "text": "How do you prefer to work through multi-step tasks?"}
+            ]},
+            {"key": "security_privacy", "name": "Security & Privacy", "questions": [
+                {"key": "security_privacy", "options": "security_privacy",
+                 "text": "How careful should I be with sensitive data and credentials?"}
+            ]},
+        ],
+    },
+}
+
+CATALOG = {"version": 1, "option_sets": OPTION_SETS, "editions": EDITIONS}
+
+QUESTION_TYPES = ('choice', 'text')
+
+# Bump whenever compile_catalog() output changes shape, so stale caches are ignored
+COMPILED_FORMAT = 3
+
+_compiled = None
+
+def catalog_hash(catalog=None):
+    """Stable hash of the catalog definition, used as the cache key"""
+    canonical = json.dumps(catalog or CATALOG, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def category_fingerprint(category, option_sets):
+    """Hash of one category with its option sets expanded, to detect changes between runs"""
+    expanded = [dict(question, options=option_sets.get(question.get('options')))
+                for question in category['questions']]
+    canonical = json.dumps(expanded, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+def validate_catalog(catalog=None):
+    """Check the catalog for structural errors, raising ValueError on the first one"""
+    catalog = catalog or CATALOG
+    option_sets = catalog['option_sets']
+
+    for set_name, options in option_sets.items():
+        if not options:
+            raise ValueError(f"option set '{set_name}' is empty")
+        seen = set()
+        for option in options:
+            for field in ('key', 'label', 'hint'):
+                if not option.get(field):
+                    raise ValueError(f"option in '{set_name}' is missing '{field}'")
+            if option['key'] in seen:
+                raise ValueError(f"duplicate option key '{option['key']}' in '{set_name}'")
+            if option['key'] == 'custom_preference':
+                raise ValueError(f"'custom_preference' is reserved (in '{set_name}')")
+            seen.add(option['key'])
+
+    for edition_key, edition in catalog['editions'].items():
+        category_keys = set()
+        questions = {}
+        for category in edition['categories']:
+            if category['key'] in category_keys:
+                raise ValueError(f"duplicate category '{category['key']}' in edition '{edition_key}'")
+            category_keys.add(category['key'])
+            if not category.get('questions'):
+                raise ValueError(f"category '{category['key']}' in '{edition_key}' has no questions")
+
+            for question in category['questions']:
+                where = f"{edition_key}/{question['key']}"
+                if question['key'] in questions:
+                    raise ValueError(f"duplicate question '{where}'")
+                if not question.get('text'):
+                    raise ValueError(f"question '{where}' has no text")
+
+                question_type = question.get('type', 'choice')
+                if question_type not in QUESTION_TYPES:
+                    raise ValueError(f"question '{where}' has unknown type '{question_type}'")
+                if question_type == 'choice' and question.get('options') not in option_sets:
+                    raise ValueError(f"question '{where}' references unknown option set '{question.get('options')}'")
+
+                target = question.get('applies_to')
+                if target and target not in questions:
+                    raise ValueError(f"question '{where}' applies to unknown earlier question '{target}'")
+
+                condition = question.get('when')
+                if condition:
+                    parent = questions.get(condition['question'])
+                    if parent is None or parent.get('type', 'choice') != 'choice':
+                        raise ValueError(f"question '{where}' depends on unknown earlier question '{condition['question']}'")
+                    parent_keys = {option['key'] for option in option_sets[parent['options']]}
+                    unknown = set(condition['in']) - parent_keys
+                    if unknown:
+                        raise ValueError(f"question '{where}' depends on unknown options {sorted(unknown)}")
+
+                questions[question['key']] = question
+
+def compile_catalog(catalog=None):
+    """Compile the catalog into flat, indexed lookup tables"""
+    catalog = catalog or CATALOG
+    validate_catalog(catalog)
+    option_sets = {name: tuple(dict(option) for option in options)
+                   for name, options in catalog['option_sets'].items()}
+
+    compiled = {
+        'hash': catalog_hash(catalog),
+        'format': COMPILED_FORMAT,
+        'version': catalog['version'],
+        'editions': {},
+        'categories': {},
+        'questions': {},
+        'options': {},
+        'option_index': {},
+    }
+
+    for edition_key, edition in catalog['editions'].items():
+        compiled['editions'][edition_key] = {
+            'key': edition_key,
+            'name': edition['name'],
+            'explain': edition.get('explain', False),
+            'confirm_custom': edition.get('confirm_custom', False),
+            'categories': tuple(category['key'] for category in edition['categories']),
+            'questions': tuple(question['key'] for category in edition['categories']
+                               for question in category['questions']),
+        }
+        for number, category in enumerate(edition['categories'], 1):
+            compiled['categories'][(edition_key, category['key'])] = {
+                'key': category['key'],
+                'name': category['name'],
+                'number': number,
+                'questions': tuple(question['key'] for question in category['questions']),
+                'fingerprint': category_fingerprint(category, catalog['option_sets']),
+            }
+            for question in category['questions']:
+                entry = dict(question)
+                entry['type'] = question.get('type', 'choice')
+                entry['category'] = category['key']
+                entry['required'] = question.get('required', True)
+                entry['allow_custom'] = question.get('allow_custom', True)
+                # Top-level questions share their category's key
+                entry['flat'] = question['key'] == category['key']
+                if 'when' in question:
+                    entry['when'] = {'question': question['when']['question'],
+                                     'in': frozenset(question['when']['in'])}
+                key = (edition_key, question['key'])
+                compiled['questions'][key] = entry
+                if entry['type'] == 'choice':
+                    options = option_sets[question['options']]
+                    entry['options'] = question['options']
+                    compiled['options'][key] = options
+                    compiled['option_index'][key] = {option['key']: option for option in options}
+
+    return compiled
+
+def get_cache_dir():
+    """Directory for compiled caches (override with GOOSE_HINTS_CACHE_DIR)"""
+    override = os.environ.get('GOOSE_HINTS_CACHE_DIR')
+    if override:
+        return Path(override)
+    return Path.home() / "goose_hints" / ".cache"
+
+def _read_cache(path, expected_hash):
+    # The hash checks below only catch stale caches; a pickle is trusted as
+    # code, so the cache must sit in a directory only the user can write to.
+    # Files another user owns or could have written are never loaded.
+    try:
+        with open(path, 'rb') as f:
+            if hasattr(os, 'getuid'):
+                stat = os.fstat(f.fileno())
+                if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+                    return None
+            compiled = pickle.load(f)  # nosec B301 - user-owned cache file, checked above
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(compiled, dict) or compiled.get('hash') != expected_hash \
+            or compiled.get('format') != COMPILED_FORMAT:
+        return None
+    return compiled
+
+def _write_cache(path, compiled):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix='.catalog-', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, str(path))
+    except OSError:
+        # A read-only home directory only costs us the cache
+        pass
+
+def load_catalog(use_cache=True):
+    """Return the compiled catalog, loading it from the on-disk cache when possible"""
+    global _compiled
+    if _compiled is not None:
+        return _compiled
+
+    expected_hash = catalog_hash()
+    cache_path = get_cache_dir() / f"catalog_{expected_hash[:16]}_v{COMPILED_FORMAT}.pickle"
+    compiled = _read_cache(cache_path, expected_hash) if use_cache else None
+    if compiled is None:
+        compiled = compile_catalog()
+        if use_cache:
+            _write_cache(cache_path, compiled)
+
+    _compiled = compiled
+    return compiled
+
+def get_question(edition, question_key):
+    """Compiled question entry for an edition"""
+    return load_catalog()['questions'][(edition, question_key)]
+
+def get_options(edition, question_key):
+    """Option tuple for a choice question (shared; copy an option before changing it)"""
+    return load_catalog()['options'][(edition, question_key)]
+
+def get_option(edition, question_key, option_key):
+    """Look up a single option by key, or None"""
+    return load_catalog()['option_index'][(edition, question_key)].get(option_key)
+
+def get_category(edition, category_key):
+    """Compiled category entry for an edition"""
+    return load_catalog()['categories'][(edition, category_key)]
+
+def get_category_options(edition, category_key):
+    """All choice options in a category, keyed by question"""
+    catalog = load_catalog()
+    return {question_key: catalog['options'][(edition, question_key)]
+            for question_key in catalog['categories'][(edition, category_key)]['questions']
+            if (edition, question_key) in catalog['options']}
+
+def iter_questions(edition):
+    """Yield compiled questions for an edition in asking order"""
+    catalog = load_catalog()
+    for question_key in catalog['editions'][edition]['questions']:
+        yield catalog['questions'][(edition, question_key)]
+
+def format_options(options, platform_info):
+    """Fill platform placeholders into option labels and hints"""
+    values = {name: platform_info[name] for name in ('home', 'projects', 'desktop', 'documents')}
+    return [dict(option, label=option['label'].format(**values), hint=option['hint'].format(**values))
+            for option in options]
+
+if __name__ == "__main__":
+    compiled = load_catalog()
+    print(f"🦆 Catalog {compiled['hash'][:16]} (version {compiled['version']})")
+    for edition in compiled['editions'].values():
+        print(f"✅ {edition['name']}: {len(edition['categories'])} categories, {len(edition['questions'])} questions")
+    print(f"💾 Cache directory: {get_cache_dir()}")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Command Line
+One entry point for every tool: goose-hints build|render|compile|install|batch|serve|store|transcript.
+Only this module, argparse and the chosen subcommand's modules are imported,
+so short commands such as rendering saved preferences start quickly.
+
+    python3 src/goose_hints_cli.py build --edition comprehensive --resume
+    python3 src/goose_hints_cli.py render --output ~/goose_hints/current.txt
+"""
+
+import argparse
+import sys
+from importlib import import_module
+
+# Edition -> builder module; imported only when that edition is built
+BUILDERS = {
+    'simple': 'goose_hints_builder_simple',
+    'comprehensive': 'goose_hints_builder_comprehensive',
+}
+
+def build_command(argv):
+    parser = argparse.ArgumentParser(prog='goose-hints build', add_help=False)
+    parser.add_argument('--edition', choices=sorted(BUILDERS), default='simple')
+    args, rest = parser.parse_known_args(argv)
+    return import_module(BUILDERS[args.edition]).main(rest)
+
+def render_command(argv):
+    parser = argparse.ArgumentParser(prog='goose-hints render',
+                                     description="Render saved preferences without asking any questions")
+    parser.add_argument('--edition', choices=sorted(BUILDERS), default='simple')
+    parser.add_argument('--output', help="Write the hints to this file instead of stdout")
+    parser.add_argument('--home', help="Home directory holding goose_hints/ (default: your home)")
+    args = parser.parse_args(argv)
+
+    from goose_hints_platform import get_user_platform_info
+    from goose_hints_render import write_hints
+    from goose_hints_state import load_state
+
+    platform_info = get_user_platform_info(home=args.home)
+    state = load_state(platform_info, args.edition)
+    if state is None:
+        print(f"No saved {args.edition} preferences - run 'goose-hints build --edition {args.edition}' first",
+              file=sys.stderr)
+        return 1
+
+    if args.output:
+        from goose_hints_storage import atomic_write
+        atomic_write(args.output, lambda f: write_hints(f, state['preferences'], platform_info, args.output,
+                                                        args.edition))
+        print(f"💾 Hints written to {args.output}")
+    else:
+        write_hints(sys.stdout, state['preferences'], platform_info, '(stdout)', args.edition)
+    return 0
+
+# Subcommand -> (help, handler function or module whose main(argv) handles it)
+COMMANDS = {
+    'build': ("Answer the questions and write your hints file", build_command),
+    'render': ("Render your saved preferences without asking anything", render_command),
+    'batch': ("Generate hints for many users from an answers file", 'goose_hints_batch'),
+    'serve': ("Serve the question flow to Help-menu sessions over HTTP", 'goose_hints_service'),
+    'store': ("Find, list and prune generated hints files", 'goose_hints_store'),
+    'transcript': ("Replay or inspect recorded sessions (record with build --record)", 'goose_hints_transcript'),
+    'stats': ("Build answer statistics for build --adaptive", 'goose_hints_stats'),
+    'compile': ("Compile saved preferences into minimal, token-budgeted hints", 'goose_hints_compile'),
+    'install': ("Write saved preferences into Goose's global hints and memory", 'goose_hints_install'),
+    'projects': ("Write saved preferences into every project's .goosehints", 'goose_hints_projects'),
+    'watch': ("Keep Goose hints, memory and project hints in sync as preferences change", 'goose_hints_watch'),
+    'analytics': ("Analyze many users' preferences and suggest a team baseline", 'goose_hints_analytics'),
+    'parse': ("Turn existing hints files back into structured preferences", 'goose_hints_parse'),
+    'telemetry': ("Rank questions by time to answer (record with build --telemetry)", 'goose_hints_telemetry'),
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    parser = argparse.ArgumentParser(
+        prog='goose-hints', description="Goose Hints Builder",
+        epilog="\n".join(f"  {name:<11} {help_text}" for name, (help_text, _) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', choices=list(COMMANDS), metavar='command',
+                        help="one of: " + ", ".join(COMMANDS))
+    parser.add_argument('args', nargs=argparse.REMAINDER, help="arguments for the command")
+    args = parser.parse_args(argv[:1])
+
+    handler = COMMANDS[args.command][1]
+    if isinstance(handler, str):
+        handler = import_module(handler).main
+    return handler(argv[1:]) or 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Hints Compiler
+The hints file is injected into Goose's context on every request, so every
+token it carries is paid for on every call. This compiles preferences into
+the smallest equivalent directive set: the boilerplate sections (features,
+integration instructions, file location) and category headings are left
+out, duplicated directives are dropped, follow-up answers are folded into
+the directive they refine, and directives sharing a leading verb are merged
+into one line. If the result is still over the token budget, the directives
+closest to Goose's default behaviour go first.
+
+    python src/goose_hints_compile.py --edition comprehensive --budget 250
+"""
+
+import argparse
+import re
+import sys
+
+from goose_hints_render import is_option, render_hints, title_case
+
+DEFAULT_BUDGET = 400
+
+# Follow-up question -> (question it refines, phrase in that hint replaced by the follow-up's label)
+REFINEMENTS = {
+    'cloud_provider': ('backup_strategy', re.compile(r'(your preferred )?cloud storage')),
+}
+# Options that only restate what Goose does anyway; dropped first when over budget
+LOW_PRIORITY = {'system_default', 'language_agnostic', 'balanced', 'standard_practices', 'mixed_approach'}
+# Text answers that are not directives on their own
+SKIPPED_TEXT = {'exemplar_files'}
+
+WORD = re.compile(r"\w+|[^\w\s]")
+CONTENT_WORD = re.compile(r"[a-z0-9]+")
+STOP_WORDS = {'a', 'an', 'and', 'the', 'to', 'for', 'in', 'of', 'with', 'as', 'on', 'all', 'your', 'my'}
+
+def count_tokens(text):
+    """Estimated LLM tokens: one per punctuation mark and per six characters of each word
+
+    Close to BPE tokenizers on English prose and paths without needing one installed.
+    """
+    return sum((len(token) + 5) // 6 if token[0].isalnum() or token[0] == '_' else 1
+               for token in WORD.findall(text))
+
+def iter_answers(preferences):
+    """(question key, value) for every answer, nested groups flattened"""
+    for category, prefs in preferences.items():
+        if prefs is None:
+            continue
+        if is_option(prefs) or not isinstance(prefs, dict):
+            yield category, prefs
+            continue
+        for key, value in prefs.items():
+            if isinstance(value, dict) and not is_option(value):
+                for item in iter_answers({key: value}):
+                    yield item
+            elif value is not None:
+                yield key, value
+
+def collect_directives(preferences):
+    """Directives as [text, priority, question key]; lower priority numbers are kept longest
+
+    Custom preferences and free-text answers rank above catalog options,
+    which rank above the options listed in LOW_PRIORITY.
+    """
+    answers = list(iter_answers(preferences))
+    options = {key: value for key, value in answers if is_option(value)}
+    directives = []
+    for key, value in answers:
+        if is_option(value):
+            refines = REFINEMENTS.get(key)
+            if refines and value.get('key') not in ('custom_preference', 'multiple') \
+                    and refines[1].search(options.get(refines[0], {}).get('hint', '')):
+                continue
+            text = value['hint']
+            for follow_up, (parent, phrase) in REFINEMENTS.items():
+                follow = options.get(follow_up)
+                if parent == key and follow and follow.get('key') not in ('custom_preference', 'multiple'):
+                    text = phrase.sub(follow['label'], text, count=1)
+            priority = 0 if value.get('key') == 'custom_preference' else 2 if value.get('key') in LOW_PRIORITY else 1
+            directives.append([text, priority, key])
+        elif key not in SKIPPED_TEXT and str(value).strip():
+            # Free text such as exemplar_style may hold several directives separated by '; '
+            directives.extend([part.strip(), 0, key] for part in str(value).split(';') if part.strip())
+    return dedupe_directives(directives)
+
+def _content_words(text):
+    return {word for word in CONTENT_WORD.findall(text.lower()) if word not in STOP_WORDS}
+
+def dedupe_directives(directives):
+    """Drop directives whose content words are all covered by another directive"""
+    words = [_content_words(text) for text, _, _ in directives]
+    kept = []
+    for i, directive in enumerate(directives):
+        covered = any(j != i and words[i] <= words[j] and (words[i] != words[j] or j < i)
+                      for j in range(len(directives)))
+        if not covered:
+            kept.append(directive)
+    return kept
+
+def merge_directives(texts):
+    """Join directives that start with the same verb into one line, in first-seen order"""
+    groups = {}
+    for text in texts:
+        verb, _, rest = text.partition(' ')
+        if rest:
+            groups.setdefault(verb, []).append(rest)
+        else:
+            groups.setdefault(text, [])
+    return [f"{verb} {'; '.join(rests)}" if rests else verb for verb, rests in groups.items()]
+
+def format_directives(directives, platform_info):
+    lines = [f"# Goose preferences ({platform_info['system']})"]
+    lines.extend(f"- {text}" for text in merge_directives([text for text, _, _ in directives]))
+    return "\n".join(lines) + "\n"
+
+def compile_hints(preferences, platform_info, edition='simple', budget=DEFAULT_BUDGET):
+    """Compile preferences into a compact directive set under a token budget
+
+    Returns {'text', 'tokens_before', 'tokens_after', 'directives', 'dropped'};
+    tokens_before counts the full rendered hints document. budget=None
+    means no limit.
+    """
+    directives = collect_directives(preferences)
+    text = format_directives(directives, platform_info)
+    dropped = []
+    while budget is not None and count_tokens(text) > budget and directives:
+        # Lowest priority first; among equals the latest directive goes
+        victim = max(range(len(directives)), key=lambda i: (directives[i][1], i))
+        dropped.append(directives.pop(victim)[2])
+        text = format_directives(directives, platform_info)
+    before = render_hints(preferences, platform_info, '(compiled)', edition)
+    return {
+        'text': text,
+        'tokens_before': count_tokens(before),
+        'tokens_after': count_tokens(text),
+        'directives': len(directives),
+        'dropped': dropped,
+    }
+
+def describe_result(result):
+    saved = result['tokens_before'] - result['tokens_after']
+    line = (f"📉 {result['tokens_before']} → {result['tokens_after']} tokens "
+            f"({saved / max(1, result['tokens_before']):.0%} smaller, {result['directives']} directives)")
+    if result['dropped']:
+        line += f"; over budget, left out: {', '.join(title_case(key) for key in result['dropped'])}"
+    return line
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile saved preferences into a minimal hints text")
+    parser.add_argument('--edition', choices=['simple', 'comprehensive'], default='simple')
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET,
+                        help=f"Maximum estimated tokens (default {DEFAULT_BUDGET}; 0 for no limit)")
+    parser.add_argument('--output', help="Write the compiled hints to this file instead of stdout")
+    parser.add_argument('--home', help="Home directory holding goose_hints/ (default: your home)")
+    args = parser.parse_args(argv)
+
+    from goose_hints_platform import get_user_platform_info
+    from goose_hints_state import load_state
+
+    platform_info = get_user_platform_info(home=args.home)
+    state = load_state(platform_info, args.edition)
+    if state is None:
+        print(f"No saved {args.edition} preferences - run 'goose-hints build --edition {args.edition}' first",
+              file=sys.stderr)
+        return 1
+    result = compile_hints(state['preferences'], platform_info, args.edition, args.budget or None)
+    if args.output:
+        from goose_hints_storage import atomic_write
+        atomic_write(args.output, result['text'])
+        print(f"💾 Compiled hints written to {args.output}", file=sys.stderr)
+    else:
+        sys.stdout.write(result['text'])
+    print(describe_result(result), file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Question Engine
+One explicit state machine that runs either edition's question flow straight
+from the catalog, including conditional follow-ups. A session never blocks on
+input(): prompt text comes from a view, submit() consumes one line the user
+typed and answer() takes an already resolved answer, so the terminal
+builders, the HTTP service and batch jobs all drive the same engine. Retries
+(invalid input, an empty or rejected custom preference) are state changes
+rather than recursive calls, so a session holds the same small amount of
+state however long it runs.
+
+Given answer statistics (goose_hints_stats.py) a session asks the most
+informative question next instead of following catalog order, and answers
+the statistics predict confidently enough are held back and offered together
+for the user to accept or override in bulk.
+"""
+
+from collections import namedtuple
+
+from goose_hints_catalog import get_category, load_catalog
+from goose_hints_flow import build_preferences, custom_option, pending_questions, progress, question_options, \
+    resolve_answer
+from goose_hints_journal import SessionInterrupted
+from goose_hints_screen import choose_screen
+from goose_hints_telemetry import start_tracking
+
+# Session states
+CHOOSE = 'choose'    # waiting for an option number
+CUSTOM = 'custom'    # waiting for a custom preference description
+CONFIRM = 'confirm'  # waiting for yes/no on the custom preference just described
+TEXT = 'text'        # waiting for a free-text answer
+REVIEW = 'review'    # waiting for the user to accept or override predicted answers
+DONE = 'done'
+
+# Outcome kinds returned by QuestionSession.submit()
+EXPLAIN = 'explain'    # value: the options, whose hints should be shown
+INVALID = 'invalid'    # value: message for the user; same question again
+CUSTOMIZE = 'custom'   # moved on to describing a custom preference
+CONFIRMING = 'confirm'  # value: the custom text to read back
+RETRY = 'retry'        # custom preference rejected; describe it again
+ACCEPTED = 'accepted'  # value: the resolved answer; the session has moved on
+PREFILLED = 'prefilled'  # value: {question key: answer} for the predicted answers accepted
+
+CONFIRM_ANSWERS = ['yes', 'y', 'correct', 'right']
+ACCEPT_ALL_ANSWERS = ['', 'yes', 'y', 'all', 'ok']
+
+Outcome = namedtuple('Outcome', ['kind', 'value'])
+
+class QuestionSession:
+    """Question flow state for one user: the answers so far and where the current question stands
+
+    categories limits the session to some of the edition's categories (the
+    --update flow); answers seeds it with earlier answers (a resumed journal).
+    Answers are stored per question key exactly as the journal records them.
+    stats (an AnswerStats) switches on adaptive order and predicted answers.
+    defaults preselects options ({question key: option key}, e.g. from the
+    environment probe) that an empty answer accepts.
+    """
+
+    __slots__ = ('edition', 'platform_info', 'categories', 'answers', 'explain', 'confirm_custom',
+                 'question', 'state', 'pending', 'stats', 'suggested', 'overridden', 'defaults')
+
+    def __init__(self, edition, platform_info, categories=None, answers=None, stats=None, defaults=None):
+        entry = load_catalog()['editions'][edition]
+        self.edition = edition
+        self.platform_info = platform_info
+        self.categories = frozenset(categories) if categories is not None else None
+        self.answers = dict(answers or {})
+        self.explain = entry['explain']
+        self.confirm_custom = entry['confirm_custom']
+        self.question = None
+        self.state = DONE
+        self.pending = None
+        self.stats = stats
+        self.defaults = defaults or {}
+        # Predicted answers awaiting review, and questions the user chose to answer themselves
+        self.suggested = {}
+        self.overridden = set()
+        self._advance()
+
+    def _advance(self):
+        self.pending = None
+        if self.stats is None:
+            self.question = next(pending_questions(self.edition, self.answers, self.categories), None)
+        else:
+            self.question = self._next_adaptive()
+        if self.question is not None:
+            self.state = CHOOSE if self.question['type'] == 'choice' else TEXT
+        else:
+            self.state = REVIEW if self.suggested else DONE
+
+    def _next_adaptive(self):
+        pending = list(pending_questions(self.edition, self.answers, self.categories))
+        if not pending:
+            self.suggested = {}
+            return None
+        # A follow-up is asked straight after the answer that called for it
+        for question in pending:
+            if question.get('when') and question['type'] != 'choice':
+                return question
+
+        candidates = {question['key'] for question in pending
+                      if question['type'] == 'choice' and question['key'] not in self.overridden}
+        self.suggested = {}
+        for question_key, (option_key, probability) in self.stats.predict(self.answers, candidates).items():
+            question = next(question for question in pending if question['key'] == question_key)
+            option = next((option for option in question_options(self.edition, question, self.platform_info)
+                           if option['key'] == option_key), None)
+            if option is not None:
+                self.suggested[question_key] = (option, probability)
+
+        remaining = [question for question in pending if question['key'] not in self.suggested]
+        if not remaining:
+            return None
+        follow_ups = [question for question in remaining if question.get('when')]
+        return follow_ups[0] if follow_ups else self.stats.most_informative(remaining)
+
+    def _accept(self, value):
+        self.answers[self.question['key']] = value
+        self._advance()
+        return Outcome(ACCEPTED, value)
+
+    @property
+    def done(self):
+        return self.state == DONE
+
+    @property
+    def options(self):
+        """Options for the current choice question with platform placeholders filled in"""
+        if self.question is None or self.question['type'] != 'choice':
+            return []
+        return question_options(self.edition, self.question, self.platform_info)
+
+    @property
+    def default_number(self):
+        """1-based number of the preselected option for the current question, or None"""
+        option_key = self.defaults.get(self.question['key']) if self.state == CHOOSE else None
+        if option_key is None:
+            return None
+        for number, option in enumerate(self.options, 1):
+            if option['key'] == option_key:
+                return number
+        return None
+
+    @property
+    def category(self):
+        """Compiled category entry of the current question"""
+        return get_category(self.edition, self.question['category'])
+
+    @property
+    def suggestions(self):
+        """Predicted answers awaiting review as (question, option, probability), in catalog order"""
+        return [(question, self.suggested[question['key']][0], self.suggested[question['key']][1])
+                for question in pending_questions(self.edition, self.answers, self.categories)
+                if question['key'] in self.suggested]
+
+    @property
+    def total_categories(self):
+        return len(load_catalog()['editions'][self.edition]['categories'])
+
+    def submit(self, response):
+        """Advance the state machine by one line of user input; returns an Outcome"""
+        if self.state == DONE:
+            raise ValueError("all questions are already answered")
+
+        if self.state == REVIEW:
+            text = response.strip().lower()
+            if text in ACCEPT_ALL_ANSWERS:
+                return Outcome(PREFILLED, self.accept_suggestions())
+            count = len(self.suggested)
+            numbers = text.replace(',', ' ').split()
+            if not all(number.isdigit() and 1 <= int(number) <= count for number in numbers):
+                return Outcome(INVALID, f"Please press Enter to accept all, or list numbers between 1 and {count}")
+            suggestions = self.suggestions
+            override = [suggestions[int(number) - 1][0]['key'] for number in numbers]
+            return Outcome(PREFILLED, self.accept_suggestions(override))
+
+        if self.state == TEXT:
+            try:
+                return self._accept(resolve_answer(self.edition, self.question, response, self.platform_info))
+            except ValueError:
+                return Outcome(INVALID, "Please enter a value.")
+
+        if self.state == CUSTOM:
+            text = response.strip()
+            if not text:
+                return Outcome(INVALID, "Please provide a preference description.")
+            if not self.confirm_custom:
+                return self._accept(custom_option(text))
+            self.state, self.pending = CONFIRM, text
+            return Outcome(CONFIRMING, text)
+
+        if self.state == CONFIRM:
+            if response.strip().lower() in CONFIRM_ANSWERS:
+                return self._accept(custom_option(self.pending))
+            self.state, self.pending = CUSTOM, None
+            return Outcome(RETRY, None)
+
+        options = self.options
+        text = response.strip().lower()
+        if not text and self.default_number is not None:
+            text = str(self.default_number)
+        if self.explain and text == 'explain':
+            return Outcome(EXPLAIN, options)
+        try:
+            choice_num = int(text)
+        except ValueError:
+            return Outcome(INVALID, "Please enter a number or 'explain'" if self.explain else "Please enter a number")
+        if 1 <= choice_num <= len(options):
+            return self._accept(options[choice_num - 1])
+        if self.question['allow_custom'] and choice_num == len(options) + 1:
+            self.state = CUSTOM
+            return Outcome(CUSTOMIZE, None)
+        max_choice = len(options) + (1 if self.question['allow_custom'] else 0)
+        return Outcome(INVALID, f"Please choose a number between 1 and {max_choice}")
+
+    def answer(self, value):
+        """Answer the current question with a raw value (option key, number, {'custom': ...} or text)
+
+        Any custom preference in progress is dropped. Returns the resolved
+        answer; raises ValueError for answers that do not fit the question.
+        """
+        if self.state == DONE:
+            raise ValueError("all questions are already answered")
+        if self.state == REVIEW:
+            raise ValueError("predicted answers are waiting to be reviewed")
+        return self._accept(resolve_answer(self.edition, self.question, value, self.platform_info)).value
+
+    def accept_suggestions(self, override=()):
+        """Accept every predicted answer except the questions in override, which are asked instead
+
+        Returns {question key: answer} for the answers accepted.
+        """
+        if self.state != REVIEW:
+            raise ValueError("there are no predicted answers to review")
+        self.overridden.update(override)
+        accepted = {question_key: option for question_key, (option, _) in self.suggested.items()
+                    if question_key not in self.overridden}
+        self.answers.update(accepted)
+        self._advance()
+        return accepted
+
+    def progress(self):
+        """(answered, applicable) question counts"""
+        return progress(self.edition, self.answers, self.categories)
+
+    def preferences(self):
+        """Preferences for the session's categories, shaped like the builders' output"""
+        preferences = build_preferences(self.edition, self.answers)
+        if self.categories is None:
+            return preferences
+        return {category: prefs for category, prefs in preferences.items() if category in self.categories}
+
+class TerminalView:
+    """How a session looks in the terminal; builders subclass it for edition-specific touches"""
+
+    # Show the options again after 'explain' or an invalid answer
+    repeat_options = False
+
+    def show_category(self, session):
+        category = session.category
+        print(f"\n🎯 **Category {category['number']} of {session.total_categories}: {category['name']}**")
+
+    def show_question(self, session):
+        print(f"\n📋 **{session.question['text']}**")
+        if session.state != CHOOSE:
+            return
+        print("\nOptions:")
+        options = session.options
+        default = session.default_number
+        for i, option in enumerate(options, 1):
+            print(f"  {i}. {option['label']}" + ("  ← detected" if i == default else ""))
+        if session.question['allow_custom']:
+            print(f"  {len(options) + 1}. Something else (I'll specify my own preference)")
+
+    def show_review(self, session):
+        print("\n🔮 **Based on your answers so far, I can fill these in for you:**")
+        for i, (question, option, probability) in enumerate(session.suggestions, 1):
+            print(f"  {i}. {question['text']}")
+            print(f"     → {option['label']} ({probability:.0%} of similar answers)")
+
+    def prompt(self, session):
+        if session.state == REVIEW:
+            return "\n👤 Press Enter to accept them all, or list the ones to answer yourself (e.g. 1,3): "
+        if session.state == CUSTOM:
+            return "\n👤 Your preference: "
+        if session.state == CONFIRM:
+            return "\n👤 Is this correct? (yes/no): "
+        if session.state == TEXT:
+            return f"\n👤 {session.question['text']}: "
+        max_choice = len(session.options) + (1 if session.question['allow_custom'] else 0)
+        default = session.default_number
+        if default is not None:
+            extra = f"Enter for {default}, or 'explain' for details" if session.explain else f"Enter for {default}"
+            return f"\n👤 Choose 1-{max_choice} ({extra}): "
+        if session.explain:
+            return f"\n👤 Choose 1-{max_choice} (or 'explain' for details): "
+        return f"\n👤 Choose 1-{max_choice}: "
+
+    def show_outcome(self, session, question, outcome):
+        if outcome.kind == EXPLAIN:
+            print("\n🦆 Here's what each option means:")
+            for i, option in enumerate(outcome.value, 1):
+                print(f"  {i}. {option['label']}")
+                print(f"     → This would make me: {option['hint']}")
+            if question['allow_custom']:
+                print(f"  {len(outcome.value) + 1}. Something else")
+                print("     → You can specify your own custom preference")
+        elif outcome.kind == INVALID:
+            print(outcome.value)
+        elif outcome.kind == CUSTOMIZE:
+            print(f"\n💭 **Custom Preference for:** {question['text']}")
+            print("Please describe how you'd like me to handle this:")
+        elif outcome.kind == CONFIRMING:
+            print("\n🤔 To make sure I understand correctly:")
+            print(f"You want me to: {outcome.value}")
+        elif outcome.kind == RETRY:
+            print("Let's try again...")
+        elif outcome.kind == ACCEPTED:
+            self.accepted(session, question, outcome.value)
+        elif outcome.kind == PREFILLED:
+            print(f"\n✅ Filled in {len(outcome.value)} answers for you")
+
+    def accepted(self, session, question, value):
+        if question['type'] != 'choice':
+            return
+        if value['key'] == 'custom_preference':
+            print(f"\n✅ Perfect! I'll {value['hint'].lower()}")
+        else:
+            print(f"\n✅ Got it! I'll {value['hint'].lower()}")
+
+    def cancelled(self, session):
+        print("\n\n👋 Setup cancelled. You can run this anytime!")
+
+def run_terminal(session, view=None, journal=None, screen=None):
+    """Drive a session from the terminal until every question is answered
+
+    Each step is drawn on screen (the preferred one for this terminal by
+    default, see goose_hints_screen) and read through ask_user(). Each
+    accepted answer is appended to the journal as soon as it is given, and
+    timing events go to the active telemetry exporter, if any. Ctrl-C raises
+    SessionInterrupted with the journal intact. Returns the session's
+    preferences.
+    """
+    view = view or TerminalView()
+    screen = screen or choose_screen()
+    tracker = start_tracking(session.edition)
+    category = shown = None
+    with screen:
+        while not session.done:
+            question = session.question
+            new_category = question is not None and question['category'] != category
+            new_question = question is not None and question['key'] != shown
+            screen.present(session, view, new_category, new_question)
+            if question is not None:
+                category, shown = question['category'], question['key']
+            if tracker is not None:
+                tracker.shown(question)
+                tracker.waiting()
+            try:
+                response = screen.read(session, view.prompt(session), question['text'] if question else None)
+            except KeyboardInterrupt:
+                view.cancelled(session)
+                raise SessionInterrupted(question['key'] if question else session.state)
+            if tracker is not None:
+                tracker.answered()
+            outcome = session.submit(response)
+            view.show_outcome(session, question, outcome)
+            if journal is not None:
+                if outcome.kind == ACCEPTED:
+                    journal.append(question['key'], outcome.value)
+                elif outcome.kind == PREFILLED:
+                    for question_key, value in outcome.value.items():
+                        journal.append(question_key, value)
+            if tracker is not None:
+                tracker.outcome(question, outcome.kind, outcome.value)
+    return session.preferences()
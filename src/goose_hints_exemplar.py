@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Exemplar Style Extractor
+Reads the exemplar documents a user points to and works out the style they
+show: fonts, heading structure and deliverable format. Markdown is read line
+by line, DOCX parts are streamed out of the zip and parsed incrementally, and
+PDFs are memory-mapped and scanned for font resources, so large files never
+have to fit in memory. Files are analyzed on a small thread pool and results
+are cached by path, size and modification time; a re-run only opens files
+that changed.
+
+    python src/goose_hints_exemplar.py ~/Documents/report.docx ~/Documents/notes.md
+"""
+
+import json
+import mmap
+import os
+import re
+import sys
+import zipfile
+import zlib
+from collections import Counter
+from pathlib import Path
+
+from goose_hints_probe import FONT_FAMILIES
+
+try:
+    from defusedxml.ElementTree import iterparse
+except ImportError:
+    # The stdlib parser never fetches external entities and expat 2.4.1+ (bundled
+    # with every supported Python) limits entity expansion; members are also
+    # size-capped before they are parsed (see _open_member)
+    from xml.etree.ElementTree import iterparse  # nosec B405
+
+EXTRACTOR_VERSION = 1
+DEFAULT_WORKERS = 4
+# Largest DOCX part, and largest inflated PDF object stream, that is read
+MAX_MEMBER_BYTES = 64 * 1024 * 1024
+MAX_STREAM_BYTES = 16 * 1024 * 1024
+
+# File suffix -> document_format option key
+FORMATS = {
+    '.md': 'markdown',
+    '.markdown': 'markdown',
+    '.docx': 'word',
+    '.pdf': 'pdf',
+    '.txt': 'plain_text',
+}
+
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+DRAWING_NS = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+
+MARKDOWN_HEADING = re.compile(r'^(#{1,6})\s+(\S.*)$')
+NUMBERED_HEADING = re.compile(r'^(\d+(\.\d+)*\.?|[IVX]+\.)\s')
+CSS_FONT = re.compile(r'font-family\s*:\s*["\']?([^;,"\'\n]+)', re.IGNORECASE)
+PDF_FONT = re.compile(rb'/BaseFont\s*/([^\s/\[\]<>()]+)')
+PDF_PAGE = re.compile(rb'/Type\s*/Page(?![A-Za-z])')
+PDF_OBJECT_STREAM = re.compile(rb'/Type\s*/ObjStm[^>]*>>\s*stream\r?\n')
+FONT_SUFFIXES = re.compile(r'(PSMT|PS|MT)$')
+
+def new_style(path, document_format):
+    return {'path': str(path), 'format': document_format, 'fonts': Counter(), 'headings': Counter(),
+            'numbered_headings': 0, 'tables': 0, 'pages': 0, 'font_size': None}
+
+def font_family(name):
+    """'ABCDEF+Calibri-Bold' -> 'Calibri', 'TimesNewRomanPSMT' -> 'TimesNewRoman'"""
+    name = name.split('+', 1)[-1] if re.match(r'^[A-Z]{6}\+', name) else name
+    return FONT_SUFFIXES.sub('', re.split(r'[-,]', name, 1)[0]).strip()
+
+def extract_markdown(path):
+    """Heading levels, numbering, tables and any CSS font-family, one line at a time"""
+    style = new_style(path, FORMATS.get(Path(path).suffix.lower(), 'markdown'))
+    fenced = False
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.lstrip().startswith('```'):
+                fenced = not fenced
+                continue
+            if fenced:
+                continue
+            heading = MARKDOWN_HEADING.match(line)
+            if heading:
+                style['headings'][len(heading.group(1))] += 1
+                if NUMBERED_HEADING.match(heading.group(2)):
+                    style['numbered_headings'] += 1
+            elif re.match(r'^\s*\|?\s*:?-{3,}', line) and '|' in line:
+                style['tables'] += 1
+            for font in CSS_FONT.findall(line):
+                style['fonts'][font.strip()] += 1
+    return style
+
+def _open_member(archive, name):
+    """Open a zip member for streaming, refusing ones that inflate past MAX_MEMBER_BYTES
+
+    ZipExtFile stops at the declared size, so checking it bounds what is read.
+    """
+    info = archive.getinfo(name)
+    if info.file_size > MAX_MEMBER_BYTES:
+        raise ValueError(f"{name} inflates to {info.file_size} bytes, more than the {MAX_MEMBER_BYTES} read")
+    return archive.open(info)
+
+def _docx_theme_fonts(archive, names):
+    """Theme major/minor latin typefaces, for runs that refer to the theme"""
+    fonts = {}
+    theme = next((name for name in names if name.startswith('word/theme/')), None)
+    if theme is None:
+        return fonts
+    with _open_member(archive, theme) as f:
+        for _, element in iterparse(f):  # nosec B314 - defusedxml when installed; see the import
+            if element.tag in (DRAWING_NS + 'majorFont', DRAWING_NS + 'minorFont'):
+                latin = element.find(DRAWING_NS + 'latin')
+                if latin is not None and latin.get('typeface'):
+                    fonts['major' if element.tag.endswith('majorFont') else 'minor'] = latin.get('typeface')
+                element.clear()
+    return fonts
+
+def _run_font(fonts_element, theme_fonts):
+    font = fonts_element.get(WORD_NS + 'ascii') or fonts_element.get(WORD_NS + 'hAnsi')
+    if font:
+        return font
+    theme = fonts_element.get(WORD_NS + 'asciiTheme') or ''
+    return theme_fonts.get('major' if theme.startswith('major') else 'minor') if theme else None
+
+def extract_docx(path):
+    """Fonts from styles and runs, heading styles and tables, streamed out of the zip"""
+    style = new_style(path, 'word')
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+        theme_fonts = _docx_theme_fonts(archive, names)
+        heading_styles = {}
+        if 'word/styles.xml' in names:
+            with _open_member(archive, 'word/styles.xml') as f:
+                for _, element in iterparse(f):  # nosec B314 - defusedxml when installed; see the import
+                    if element.tag == WORD_NS + 'rPrDefault':
+                        fonts_element = element.find(f'.//{WORD_NS}rFonts')
+                        size = element.find(f'.//{WORD_NS}sz')
+                        font = _run_font(fonts_element, theme_fonts) if fonts_element is not None else None
+                        if font:
+                            style['fonts'][font] += 1
+                        if size is not None and (size.get(WORD_NS + 'val') or '').isdigit():
+                            style['font_size'] = int(size.get(WORD_NS + 'val')) / 2
+                    elif element.tag == WORD_NS + 'style' and element.get(WORD_NS + 'type') == 'paragraph':
+                        level = element.find(f'.//{WORD_NS}outlineLvl')
+                        if level is not None and (level.get(WORD_NS + 'val') or '').isdigit():
+                            heading_styles[element.get(WORD_NS + 'styleId')] = int(level.get(WORD_NS + 'val')) + 1
+                        element.clear()
+        if 'word/document.xml' not in names:
+            return style
+        with _open_member(archive, 'word/document.xml') as f:
+            for _, element in iterparse(f):  # nosec B314 - defusedxml when installed; see the import
+                if element.tag == WORD_NS + 'rFonts':
+                    font = _run_font(element, theme_fonts)
+                    if font:
+                        style['fonts'][font] += 1
+                elif element.tag == WORD_NS + 'tbl':
+                    style['tables'] += 1
+                    element.clear()
+                elif element.tag == WORD_NS + 'p':
+                    style_id = element.find(f'{WORD_NS}pPr/{WORD_NS}pStyle')
+                    style_id = style_id.get(WORD_NS + 'val') if style_id is not None else None
+                    heading = re.match(r'^Heading(\d)$', style_id or '')
+                    level = heading_styles.get(style_id) or (int(heading.group(1)) if heading else None)
+                    if level:
+                        style['headings'][level] += 1
+                        text = ''.join(t.text or '' for t in element.iter(WORD_NS + 't'))
+                        if NUMBERED_HEADING.match(text) or element.find(f'{WORD_NS}pPr/{WORD_NS}numPr') is not None:
+                            style['numbered_headings'] += 1
+                    element.clear()
+    return style
+
+def extract_pdf(path):
+    """Font resources and page count from a memory-mapped PDF
+
+    Fonts declared inside compressed object streams (PDF 1.5+) are found by
+    inflating those streams one at a time; streams that would inflate past
+    MAX_STREAM_BYTES are skipped.
+    """
+    style = new_style(path, 'pdf')
+    if os.path.getsize(path) == 0:
+        return style
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for match in PDF_FONT.finditer(data):
+            style['fonts'][font_family(match.group(1).decode('latin-1'))] += 1
+        style['pages'] = sum(1 for _ in PDF_PAGE.finditer(data))
+        for match in PDF_OBJECT_STREAM.finditer(data):
+            end = data.find(b'endstream', match.end())
+            if end < 0:
+                continue
+            inflater = zlib.decompressobj()
+            try:
+                objects = inflater.decompress(data[match.end():end], MAX_STREAM_BYTES)
+            except zlib.error:
+                continue
+            if inflater.unconsumed_tail:
+                continue
+            for font in PDF_FONT.finditer(objects):
+                style['fonts'][font_family(font.group(1).decode('latin-1'))] += 1
+            style['pages'] += sum(1 for _ in PDF_PAGE.finditer(objects))
+    return style
+
+EXTRACTORS = {
+    'markdown': extract_markdown,
+    'plain_text': extract_markdown,
+    'word': extract_docx,
+    'pdf': extract_pdf,
+}
+
+def extract_style(path):
+    """Style summary of one exemplar file; {'path', 'error'} if it cannot be read"""
+    document_format = FORMATS.get(Path(path).suffix.lower())
+    if document_format is None:
+        return {'path': str(path), 'error': f"unsupported file type '{Path(path).suffix}'"}
+    try:
+        style = EXTRACTORS[document_format](path)
+    except (OSError, ValueError, zipfile.BadZipFile, SyntaxError, RuntimeError, NotImplementedError) as e:
+        # ElementTree's ParseError is a SyntaxError; zipfile raises RuntimeError for
+        # encrypted members and NotImplementedError for unsupported compression
+        return {'path': str(path), 'error': str(e)}
+    style['fonts'] = dict(style['fonts'].most_common())
+    style['headings'] = {str(level): count for level, count in sorted(style['headings'].items())}
+    return style
+
+def cache_path(platform_info):
+    return Path(platform_info['home']) / "goose_hints" / ".cache" / "exemplar_styles.json"
+
+def _load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('extractor') != EXTRACTOR_VERSION:
+        return {}
+    return cache.get('files', {})
+
+def parse_exemplar_paths(value):
+    """Expanded paths from the comma-separated exemplar_files answer"""
+    return [str(Path(os.path.expandvars(part.strip().strip('"\''))).expanduser())
+            for part in str(value or '').split(',') if part.strip()]
+
+def analyze_exemplars(paths, platform_info=None, workers=DEFAULT_WORKERS):
+    """Style summaries for the given files, in order
+
+    Unchanged files (same size and mtime) come from the cache in
+    ~/goose_hints/.cache/ when platform_info is given; the rest are read on
+    a pool of at most `workers` threads, each streaming one file at a time.
+    """
+    cache_file = cache_path(platform_info) if platform_info is not None else None
+    cached = _load_cache(cache_file) if cache_file is not None else {}
+    styles = {}
+    keys = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError as e:
+            styles[path] = {'path': path, 'error': e.strerror or str(e)}
+            continue
+        keys[path] = [stat.st_size, stat.st_mtime_ns]
+        entry = cached.get(os.path.abspath(path))
+        if entry is not None and entry.get('key') == keys[path]:
+            styles[path] = entry['style']
+
+    todo = [path for path in keys if path not in styles]
+    if len(todo) == 1:
+        styles[todo[0]] = extract_style(todo[0])
+    elif todo:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            styles.update(zip(todo, pool.map(extract_style, todo)))
+
+    fresh = {os.path.abspath(path): {'key': keys[path], 'style': styles[path]}
+             for path in todo if 'error' not in styles[path]}
+    if cache_file is not None and fresh:
+        cached.update(fresh)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            from goose_hints_storage import atomic_write
+            atomic_write(cache_file, json.dumps({'extractor': EXTRACTOR_VERSION, 'files': cached}) + "\n")
+        except OSError:
+            pass
+    return [styles[path] for path in paths]
+
+def summarize_styles(styles):
+    """Combine per-file styles: fonts by use, the most common format, heading depth"""
+    fonts, formats, headings = Counter(), Counter(), Counter()
+    numbered = total_headings = tables = 0
+    sizes = Counter()
+    for style in styles:
+        if 'error' in style:
+            continue
+        fonts.update(style['fonts'])
+        formats[style['format']] += 1
+        headings.update({int(level): count for level, count in style['headings'].items()})
+        numbered += style['numbered_headings']
+        total_headings += sum(style['headings'].values())
+        tables += style['tables']
+        if style.get('font_size'):
+            sizes[style['font_size']] += 1
+    return {
+        'files': sum(1 for style in styles if 'error' not in style),
+        'fonts': [font for font, _ in fonts.most_common()],
+        'format': formats.most_common(1)[0][0] if formats else None,
+        'heading_depth': max(headings) if headings else 0,
+        'numbered_headings': total_headings > 0 and numbered * 2 >= total_headings,
+        'tables': tables,
+        'font_size': sizes.most_common(1)[0][0] if sizes else None,
+    }
+
+def catalog_font(fonts):
+    """preferred_font option key for the most used font that is in the catalog, or None"""
+    for font in fonts:
+        name = font.lower().replace(' ', '')
+        for key, families in FONT_FAMILIES.items():
+            if any(name.startswith(family) for family in families):
+                return key
+    return None
+
+def exemplar_defaults(summary):
+    """{question key: option key} preselections for the font and deliverable questions"""
+    defaults = {}
+    font = catalog_font(summary['fonts'])
+    if font:
+        defaults['preferred_font'] = font
+    if summary['format']:
+        defaults['document_format'] = summary['format']
+    return defaults
+
+def exemplar_hints(summary):
+    """Concrete formatting hints drawn from the exemplars"""
+    hints = []
+    if summary['fonts']:
+        size = f" at {summary['font_size']:g}pt" if summary['font_size'] else ""
+        hints.append(f"Match the exemplar typography: {', '.join(summary['fonts'][:3])}{size}")
+    if summary['heading_depth']:
+        numbering = "numbered " if summary['numbered_headings'] else ""
+        hints.append(f"Structure documents with up to {summary['heading_depth']} levels of {numbering}headings")
+    if summary['tables']:
+        hints.append("Present comparisons and figures in tables as the exemplars do")
+    return hints
+
+if __name__ == "__main__":
+    from goose_hints_platform import get_user_platform_info
+    found = analyze_exemplars(parse_exemplar_paths(','.join(sys.argv[1:])), get_user_platform_info())
+    summary = summarize_styles(found)
+    print(json.dumps({'files': found, 'summary': summary, 'defaults': exemplar_defaults(summary),
+                      'hints': exemplar_hints(summary)}, indent=2))
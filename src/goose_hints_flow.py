@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Question Flow
+Non-blocking helpers that walk an edition's catalog questions from a dict of
+answers: which question comes next, how a raw answer resolves to an option,
+and how the answers assemble into the same preferences dict the interactive
+builders produce.
+"""
+
+from goose_hints_catalog import format_options, get_options, iter_questions, load_catalog
+
+# Text answers that mean "nothing to record"
+EMPTY_TEXT_ANSWERS = ['none', 'no', '']
+
+def custom_option(text):
+    """Option dict for a user-specified custom preference"""
+    return {'key': 'custom_preference', 'label': f"Custom: {text}", 'hint': text}
+
+def is_asked(question, answers):
+    """True if a question applies given the answers so far"""
+    condition = question.get('when')
+    if not condition:
+        return True
+    parent = answers.get(condition['question'])
+    return isinstance(parent, dict) and parent.get('key') in condition['in']
+
+def pending_questions(edition, answers, categories=None):
+    """Applicable questions without an answer yet, in catalog order
+
+    categories limits the flow to a subset of the edition's categories.
+    """
+    for question in iter_questions(edition):
+        if categories is not None and question['category'] not in categories:
+            continue
+        if question['key'] not in answers and is_asked(question, answers):
+            yield question
+
+def next_question(edition, answers, categories=None):
+    """First applicable question without an answer, or None when the flow is complete"""
+    return next(pending_questions(edition, answers, categories), None)
+
+def question_options(edition, question, platform_info):
+    """Options for a choice question with platform placeholders filled in"""
+    return format_options(get_options(edition, question['key']), platform_info)
+
+def resolve_answer(edition, question, value, platform_info):
+    """Resolve a raw answer (option key, 1-based number, custom text) for a question
+
+    Raises ValueError for answers that do not fit the question.
+    """
+    if question['type'] == 'text':
+        text = '' if value is None else str(value).strip()
+        if question['required'] and not text:
+            raise ValueError(f"'{question['key']}' needs a value")
+        return text
+
+    if value is None or value == '':
+        raise ValueError(f"missing answer for '{question['key']}'")
+
+    if isinstance(value, dict):
+        custom = str(value.get('custom', '')).strip()
+        if not custom:
+            raise ValueError(f"empty custom preference for '{question['key']}'")
+        return custom_option(custom)
+
+    text = str(value).strip()
+    if text.lower().startswith('custom:'):
+        custom = text[len('custom:'):].strip()
+        if not custom:
+            raise ValueError(f"empty custom preference for '{question['key']}'")
+        return custom_option(custom)
+
+    options = question_options(edition, question, platform_info)
+    if text.isdigit():
+        choice_num = int(text)
+        if 1 <= choice_num <= len(options):
+            return options[choice_num - 1]
+        raise ValueError(f"choice {choice_num} out of range 1-{len(options)} for '{question['key']}'")
+
+    for option in options:
+        if option['key'] == text:
+            return option
+    raise ValueError(f"unknown option '{text}' for '{question['key']}'")
+
+def build_preferences(edition, answers):
+    """Assemble resolved answers into the nested preferences dict"""
+    catalog = load_catalog()
+    preferences = {}
+    for category in catalog['editions'][edition]['categories']:
+        group = {}
+        for question_key in catalog['categories'][(edition, category)]['questions']:
+            question = catalog['questions'][(edition, question_key)]
+            if question_key not in answers or not is_asked(question, answers):
+                continue
+            value = answers[question_key]
+            if question.get('applies_to'):
+                # Follow-up text that refines an earlier option's hint
+                target = group.get(question['applies_to'])
+                if target is not None and value:
+                    group[question['applies_to']] = dict(target, hint=question['hint'].format(value=value))
+                continue
+            if question['type'] == 'text' and str(value).lower() in EMPTY_TEXT_ANSWERS:
+                continue
+            if question['flat']:
+                preferences[category] = value
+            else:
+                group[question_key] = value
+        if group:
+            preferences[category] = group
+    return preferences
+
+def progress(edition, answers, categories=None):
+    """(answered, applicable) question counts for progress display"""
+    applicable = [question for question in iter_questions(edition)
+                  if (categories is None or question['category'] in categories) and is_asked(question, answers)]
+    answered = sum(1 for question in applicable if question['key'] in answers)
+    return answered, len(applicable)
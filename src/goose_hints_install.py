@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Goose Installer
+Writes preferences straight into Goose instead of asking the user to copy
+them: a managed section of the global hints file (~/.config/goose/.goosehints)
+and tagged entries in Goose's global memory (memory/preferences.txt). Both
+are merged by category - categories being installed replace their earlier
+version, everything else in the files (the user's own hints and memories,
+categories not being updated) is kept. Each file is read, merged and
+replaced with one atomic write while holding an advisory lock, so concurrent
+installs never lose each other's changes and Goose never reads a partial
+file. For fleet provisioning many home directories are installed at once on
+a thread pool.
+
+    python src/goose_hints_install.py                        # your saved preferences
+    python src/goose_hints_install.py --home /home/a /home/b --workers 16
+    python src/goose_hints_install.py --answers team.jsonl   # batch-mode answer records
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+from goose_hints_render import iter_category_lines, title_case
+from goose_hints_storage import atomic_write, file_lock
+
+TARGETS = ('hints', 'memory')
+MEMORY_CATEGORY = 'preferences'
+MEMORY_TAG = 'goose-hints'
+DEFAULT_WORKERS = 8
+
+BLOCK_BEGIN = "<!-- goose-hints-builder:begin -->"
+BLOCK_END = "<!-- goose-hints-builder:end -->"
+BLOCK_HEADING = "## Personal preferences (managed by Goose Hints Builder)"
+SECTION = re.compile(r'^### (.+?) <!-- (\w+) -->$', re.MULTILINE)
+
+def goose_config_dir(platform_info):
+    """Goose's configuration directory inside a home directory"""
+    home = Path(platform_info['home'])
+    if platform_info['system'] == "Windows":
+        return home / "AppData" / "Roaming" / "Block" / "goose" / "config"
+    return home / ".config" / "goose"
+
+def target_paths(platform_info):
+    config = goose_config_dir(platform_info)
+    return {'hints': config / ".goosehints", 'memory': config / "memory" / f"{MEMORY_CATEGORY}.txt"}
+
+def category_sections(preferences):
+    """{category: [directive lines]} for the categories that have any answer"""
+    sections = {}
+    for category, prefs in preferences.items():
+        lines = [line.rstrip('\n')[2:] for line in iter_category_lines(prefs)]
+        if lines:
+            sections[category] = lines
+    return sections
+
+def managed_block(text):
+    """The managed section of a hints file, markers included, or None if it has none"""
+    start, end = text.find(BLOCK_BEGIN), text.find(BLOCK_END)
+    if start >= 0 and end > start:
+        return text[start:end + len(BLOCK_END)]
+    return None
+
+def merge_goosehints(text, sections, replace=False, remove=()):
+    """Global hints text with the managed section merged by category
+
+    Categories in remove are dropped from the managed section; with
+    replace=True it holds exactly the given categories. Text outside it is
+    kept either way.
+    """
+    start, end = text.find(BLOCK_BEGIN), text.find(BLOCK_END)
+    existing = {}
+    if start >= 0 and end > start:
+        block = text[start + len(BLOCK_BEGIN):end]
+        matches = list(SECTION.finditer(block))
+        for i, match in enumerate(matches):
+            body = block[match.end():matches[i + 1].start() if i + 1 < len(matches) else len(block)]
+            existing[match.group(2)] = (match.group(1), body.strip('\n'))
+        before, after = text[:start].rstrip('\n'), text[end + len(BLOCK_END):].lstrip('\n')
+    else:
+        before, after = text.rstrip('\n'), ''
+
+    merged = {} if replace else {category: entry for category, entry in existing.items() if category not in remove}
+    merged.update({category: (title_case(category), "\n".join(f"- {line}" for line in lines))
+                   for category, lines in sections.items()})
+    block = [BLOCK_BEGIN, BLOCK_HEADING]
+    for category, (title, body) in merged.items():
+        block.extend(["", f"### {title} <!-- {category} -->", body])
+    block.append(BLOCK_END)
+    parts = [part for part in (before, "\n".join(block), after.rstrip('\n')) if part]
+    return "\n\n".join(parts) + "\n"
+
+def merge_memory(text, sections, remove=()):
+    """Memory category text with one tagged entry per category, merged by category
+
+    Goose memory files hold entries separated by blank lines, each optionally
+    starting with a '# tag tag' line. Entries tagged goose-hints <category>
+    are replaced when that category is installed and dropped when it is in
+    remove; all others are kept.
+    """
+    kept, positions = [], {}
+    for entry in (entry.strip('\n') for entry in text.split('\n\n')):
+        if not entry:
+            continue
+        tags = entry.split('\n', 1)[0].lstrip('# ').split() if entry.startswith('#') else []
+        if MEMORY_TAG in tags and len(tags) > 1:
+            if tags[1] in remove:
+                continue
+            positions[tags[1]] = len(kept)
+        kept.append(entry)
+
+    for category, lines in sections.items():
+        entry = f"# {MEMORY_TAG} {category}\n{title_case(category)}: " + " ".join(
+            line if line.endswith('.') else line + "." for line in lines)
+        if category in positions:
+            kept[positions[category]] = entry
+        else:
+            kept.append(entry)
+    return "".join(entry + "\n\n" for entry in kept)
+
+MERGERS = {'hints': merge_goosehints, 'memory': merge_memory}
+
+def install_preferences(preferences, platform_info, targets=TARGETS, remove=()):
+    """Merge preferences into Goose's hints and memory files
+
+    Categories in remove are taken out of both. Returns
+    {target: (path, changed)}; unchanged files are not rewritten.
+    """
+    sections = category_sections(preferences)
+    results = {}
+    for target, path in target_paths(platform_info).items():
+        if target not in targets:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(path):
+            try:
+                current = path.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                current = ''
+            merged = MERGERS[target](current, sections, remove=remove)
+            changed = merged != current
+            if changed:
+                atomic_write(path, merged)
+        results[target] = (path, changed)
+    return results
+
+def install_and_report(preferences, platform_info, targets=TARGETS):
+    """install_preferences() for the builders' --install, reporting to the terminal"""
+    try:
+        results = install_preferences(preferences, platform_info, targets)
+    except (OSError, TimeoutError) as e:
+        print(f"\n⚠️  Could not add your preferences to Goose: {e}")
+        return None
+    print("\n🦆 **Added to Goose:**")
+    for line in describe_install(results):
+        print(f"✅ {line}")
+    return results
+
+def _install_job(job, targets):
+    platform_info, preferences = job
+    try:
+        return platform_info['home'], install_preferences(preferences, platform_info, targets), None
+    except Exception as e:
+        return platform_info['home'], None, f"{type(e).__name__}: {e}"
+
+def install_homes(jobs, targets=TARGETS, workers=DEFAULT_WORKERS, max_pending=None):
+    """Install many (platform_info, preferences) jobs in parallel
+
+    jobs is consumed lazily: at most max_pending (default workers * 2) are
+    submitted but not yet finished, so huge job streams are never held in
+    memory. Returns {'installed', 'unchanged', 'failed', 'failures':
+    [(home, error)], 'elapsed'}.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    started = time.perf_counter()
+    max_pending = max_pending or workers * 2
+    summary = {'installed': 0, 'unchanged': 0, 'failed': 0, 'failures': []}
+
+    def collect(home, results, error):
+        if error is not None:
+            summary['failed'] += 1
+            summary['failures'].append((str(home), error))
+        elif any(changed for _, changed in results.values()):
+            summary['installed'] += 1
+        else:
+            summary['unchanged'] += 1
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for job in jobs:
+            pending.add(pool.submit(_install_job, job, targets))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(*future.result())
+        for future in pending:
+            collect(*future.result())
+    summary['elapsed'] = time.perf_counter() - started
+    return summary
+
+def describe_install(results):
+    """Lines telling the user where their preferences went"""
+    names = {'hints': "Global hints", 'memory': "Goose memory"}
+    return [f"{names[target]}: {path}" + ("" if changed else " (already up to date)")
+            for target, (path, changed) in results.items()]
+
+def iter_state_jobs(homes, edition):
+    """(platform_info, preferences) from each home's saved preferences; homes without any are reported"""
+    from goose_hints_platform import get_user_platform_info
+    from goose_hints_state import load_state
+    for home in homes:
+        platform_info = get_user_platform_info(home=home)
+        state = load_state(platform_info, edition)
+        if state is None:
+            print(f"⚠️  No saved {edition} preferences in {platform_info['home']} - skipped", file=sys.stderr)
+            continue
+        yield platform_info, state['preferences']
+
+def iter_answer_jobs(path):
+    """(platform_info, preferences) for each batch-mode answer record that names a home"""
+    from goose_hints_batch import iter_records, resolve_record
+    from goose_hints_platform import get_user_platform_info
+    for line_number, record in iter_records(path):
+        if not isinstance(record, dict) or not record.get('home'):
+            print(f"⚠️  Line {line_number}: needs a 'home' to install into - skipped", file=sys.stderr)
+            continue
+        platform_info = get_user_platform_info(home=record['home'], system=record.get('system'))
+        try:
+            yield platform_info, resolve_record(record, platform_info)
+        except ValueError as e:
+            print(f"⚠️  Line {line_number}: {e} - skipped", file=sys.stderr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write preferences into Goose's global hints and memory")
+    parser.add_argument('--edition', choices=['simple', 'comprehensive'], default='simple')
+    parser.add_argument('--home', nargs='+', default=[None], help="Home directories to install into (default: yours)")
+    parser.add_argument('--answers', help="Install from batch-mode answer records (each needs a 'home')")
+    parser.add_argument('--target', choices=['hints', 'memory', 'both'], default='both')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args(argv)
+    targets = TARGETS if args.target == 'both' else (args.target,)
+
+    jobs = iter_answer_jobs(args.answers) if args.answers else iter_state_jobs(args.home, args.edition)
+    summary = install_homes(jobs, targets, max(1, args.workers))
+    print(f"✅ {summary['installed']} installed, {summary['unchanged']} already up to date, "
+          f"{summary['failed']} failed in {summary['elapsed']:.2f}s")
+    for home, error in summary['failures'][:20]:
+        print(f"   ❌ {home}: {error}")
+    return 1 if summary['failed'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
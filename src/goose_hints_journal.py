@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Session Journal
+Append-only journal of the answers given in an interactive session. Every
+answer is one JSON line appended and flushed as soon as it is given, so an
+interrupted session (Ctrl-C, closed terminal, dropped SSH connection) can be
+picked up again with --resume at the first unanswered question. Notes keep
+what the builder derived from an answer (the style read from exemplar files,
+the layout of the root directory) so a resumed session does not lose it.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from goose_hints_transcript import ask_user
+
+JOURNAL_VERSION = 1
+
+class SessionInterrupted(Exception):
+    """Raised when the user cancels a question; answers so far stay in the journal"""
+
+def journal_path(platform_info, edition):
+    """Location of the in-progress session journal for an edition"""
+    return Path(platform_info['home']) / "goose_hints" / f"{edition}_session.journal"
+
+def read_journal(path):
+    """Replay a journal file
+
+    Returns (header, answers, notes, good_bytes) where good_bytes is the
+    length of the intact prefix; a torn final line from a crash mid-write is
+    ignored.
+    Returns None if the file is missing or has no valid header.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    header = None
+    answers, notes = {}, {}
+    good_bytes = 0
+    for line in data.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            break
+        try:
+            entry = json.loads(line.decode('utf-8'))
+            if header is not None:
+                if 'n' in entry:
+                    notes[entry['n']] = entry['v']
+                else:
+                    answers[entry['q']] = entry['v']
+        except (ValueError, KeyError, TypeError):
+            break
+        if header is None:
+            if not isinstance(entry, dict) or entry.get('journal') != JOURNAL_VERSION:
+                return None
+            header = entry
+        good_bytes += len(line)
+
+    if header is None:
+        return None
+    return header, answers, notes, good_bytes
+
+class SessionJournal:
+    """Open journal for the running session; use start() or resume() to create one"""
+
+    def __init__(self, path, header, answers, fsync=False, notes=None):
+        self.path = Path(path)
+        self.header = header
+        self.answers = answers
+        self.notes = notes if notes is not None else {}
+        self.fsync = fsync
+        self._file = None
+
+    @classmethod
+    def start(cls, platform_info, edition, categories, update=False, fsync=False):
+        """Begin a new journal, replacing any earlier one for the edition"""
+        path = journal_path(platform_info, edition)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        header = {
+            'journal': JOURNAL_VERSION,
+            'edition': edition,
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'categories': list(categories),
+            'update': update,
+        }
+        journal = cls(path, header, {}, fsync)
+        journal._file = open(path, 'wb')
+        journal._write(header)
+        return journal
+
+    @classmethod
+    def resume(cls, platform_info, edition, fsync=False):
+        """Reopen an interrupted journal for appending, or None if there is none"""
+        path = journal_path(platform_info, edition)
+        replayed = read_journal(path)
+        if replayed is None:
+            return None
+        header, answers, notes, good_bytes = replayed
+        if header.get('edition') != edition:
+            return None
+        journal = cls(path, header, answers, fsync, notes)
+        journal._file = open(path, 'r+b')
+        # Drop a torn last line so the next append starts on a clean line
+        journal._file.truncate(good_bytes)
+        journal._file.seek(good_bytes)
+        return journal
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False).encode('utf-8') + b"\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def append(self, question_key, value):
+        """Record one answer with a single appended line"""
+        self._write({'q': question_key, 'v': value})
+        self.answers[question_key] = value
+
+    def note(self, name, value):
+        """Record something derived from an answer, replacing an earlier note of that name"""
+        self._write({'n': name, 'v': value})
+        self.notes[name] = value
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """Close and delete the journal once the session has been saved"""
+        self.close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def has_journal(platform_info, edition):
+    """True if an interrupted session can be resumed for the edition"""
+    return read_journal(journal_path(platform_info, edition)) is not None
+
+def offer_resume(platform_info, edition, resume=False):
+    """Reopen an interrupted session's journal when resuming
+
+    With resume=False an existing journal is still offered to the user
+    before a new session replaces it. Returns the journal or None.
+    """
+    if not resume:
+        if not has_journal(platform_info, edition):
+            return None
+        response = ask_user("\n👤 You have an unfinished session. Continue where you left off? (yes/no): ").strip().lower()
+        if response not in ['yes', 'y', 'sure', 'ok']:
+            return None
+
+    try:
+        journal = SessionJournal.resume(platform_info, edition)
+    except OSError as e:
+        print(f"\n⚠️  Could not reopen the unfinished session: {e}")
+        return None
+    if journal is None:
+        print("\n📂 No unfinished session found - let's start a new one.")
+        return None
+    print(f"\n📂 Resuming the session from {journal.header['started_at']} "
+          f"with {len(journal.answers)} answers already given.")
+    return journal
+
+def begin_journal(platform_info, edition, categories, update=False):
+    """Start journaling a new session; returns None (answers are not journaled) if that fails"""
+    try:
+        return SessionJournal.start(platform_info, edition, categories, update)
+    except OSError as e:
+        print(f"\n⚠️  Could not create a session journal, answers won't survive an interruption: {e}")
+        return None
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Project Layout Scanner
+Works out how the user actually organizes projects instead of relying on
+self-report. The projects root is walked with os.scandir to a fixed depth,
+each project folder is classified against the five data_organization
+schemes (cookiecutter, simple folders, by date, by type, flat), and the
+dominant scheme is reported with a confidence before the question is asked.
+
+Large roots stay fast: only the most recently modified projects are
+sampled, each project stops being listed after a fixed number of entries,
+the scan stops early once one scheme clearly dominates, and results are
+cached per project keyed by the mtimes of the directories that were read,
+so a re-run only lists projects that changed.
+
+    python src/goose_hints_layout.py ~/Projects
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+SCAN_VERSION = 1
+DEFAULT_WORKERS = 8
+MAX_DEPTH = 2
+MAX_PROJECTS = 200
+MAX_ENTRIES = 2000
+# Stop once this many projects are classified and one scheme holds this share
+EARLY_EXIT_PROJECTS = 24
+EARLY_EXIT_SHARE = 0.8
+# Report a dominant scheme only with this many projects and this confidence
+MIN_PROJECTS = 3
+MIN_CONFIDENCE = 0.5
+
+SCHEMES = ['cookiecutter', 'simple_folders', 'by_date', 'by_type', 'flat_structure']
+
+# Simple Edition scheme -> Comprehensive Edition organization option
+COMPREHENSIVE_SCHEMES = {
+    'cookiecutter': 'project_hierarchy',
+    'simple_folders': 'project_hierarchy',
+    'by_date': 'date_organized',
+    'by_type': 'type_organized',
+    'flat_structure': 'minimal_structure',
+}
+
+COOKIECUTTER_DIRS = {'data', 'src', 'docs', 'notebooks', 'models', 'references', 'reports'}
+SIMPLE_DIRS = {'input', 'inputs', 'output', 'outputs', 'scripts'}
+TYPE_DIRS = {'csv', 'xlsx', 'excel', 'json', 'pdf', 'pdfs', 'scripts', 'code', 'reports', 'images', 'figures',
+             'plots', 'charts', 'slides', 'presentations', 'spreadsheets', 'documents', 'docs', 'sql', 'r',
+             'python', 'notebooks', 'data', 'raw', 'audio', 'video', 'photos'}
+IGNORED_DIRS = {'__pycache__', 'node_modules', 'venv', 'env', 'site-packages', 'build', 'dist'}
+DATE_NAME = re.compile(r'^(19|20)\d{2}([-_.]?(0[1-9]|1[0-2]))?([-_.]?(0[1-9]|[12]\d|3[01]))?([-_ ].*)?$')
+
+def list_directory(path, budget):
+    """(subdirectory names, file names, mtime_ns) for one directory, at most budget entries"""
+    dirs, files = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if len(dirs) + len(files) >= budget:
+                break
+            if entry.name.startswith('.'):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.lower() not in IGNORED_DIRS:
+                        dirs.append(entry.name)
+                else:
+                    files.append(entry.name)
+            except OSError:
+                continue
+    return dirs, files, os.stat(path).st_mtime_ns
+
+def scan_project(path, max_depth=MAX_DEPTH, max_entries=MAX_ENTRIES):
+    """Directory listing of one project to max_depth levels, capped at max_entries entries
+
+    Returns {'dirs': {relative dir: mtime_ns}, 'tree': {relative dir: [subdirs, files]}}.
+    """
+    tree, mtimes = {}, {}
+    queue = [('', 1)]
+    budget = max_entries
+    while queue and budget > 0:
+        relative, depth = queue.pop(0)
+        try:
+            dirs, files, mtime = list_directory(os.path.join(path, relative), budget)
+        except OSError:
+            continue
+        budget -= len(dirs) + len(files)
+        tree[relative], mtimes[relative] = [dirs, files], mtime
+        if depth < max_depth:
+            queue.extend((os.path.join(relative, name), depth + 1) for name in dirs)
+    return {'dirs': mtimes, 'tree': tree}
+
+def _dominant_extension_share(files):
+    extensions = Counter(os.path.splitext(name)[1].lower() for name in files if '.' in name)
+    return extensions.most_common(1)[0][1] / len(files) if extensions and files else 0.0
+
+def classify_project(name, listing):
+    """The scheme a scanned project follows, or None if it fits none of them"""
+    top_dirs, top_files = listing['tree'].get('', [[], []])
+    lowered = {directory.lower() for directory in top_dirs}
+
+    if len(lowered & COOKIECUTTER_DIRS) >= 3 and 'data' in lowered:
+        return 'cookiecutter'
+    if len(lowered & SIMPLE_DIRS) >= 2 and lowered & {'input', 'inputs', 'output', 'outputs'}:
+        return 'simple_folders'
+    if top_dirs and sum(1 for directory in top_dirs if DATE_NAME.match(directory)) * 2 > len(top_dirs):
+        return 'by_date'
+    # By type: folders named after content types, or each folder holding one kind of file
+    typed = sum(1 for directory in top_dirs
+                if directory.lower() in TYPE_DIRS
+                or (len(listing['tree'].get(directory, [[], []])[1]) >= 2
+                    and _dominant_extension_share(listing['tree'][directory][1]) >= 0.8))
+    if len(top_dirs) >= 2 and typed * 3 >= len(top_dirs) * 2:
+        return 'by_type'
+    if top_files and len(top_dirs) <= 1 and len(top_files) >= 3 * max(1, len(top_dirs)):
+        return 'flat_structure'
+    if DATE_NAME.match(name):
+        return 'by_date'
+    return None
+
+def _still_valid(project, entry):
+    """A cached entry holds while every directory it read has the same mtime"""
+    try:
+        return all(os.stat(os.path.join(project, relative)).st_mtime_ns == mtime
+                   for relative, mtime in entry['dirs'].items())
+    except OSError:
+        return False
+
+def cache_path(platform_info):
+    return Path(platform_info['home']) / "goose_hints" / ".cache" / "project_layout.json"
+
+def _load_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('scan') != SCAN_VERSION:
+        return {}
+    return cache.get('projects', {})
+
+def list_projects(root, max_projects=MAX_PROJECTS):
+    """Project folders under root, most recently modified first, at most max_projects"""
+    projects = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            try:
+                if not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False):
+                    projects.append((entry.stat(follow_symlinks=False).st_mtime_ns, entry.path))
+            except OSError:
+                continue
+    projects.sort(reverse=True)
+    return [path for _, path in projects[:max_projects]], len(projects)
+
+def _scan_and_classify(project):
+    listing = scan_project(project)
+    return {'dirs': listing['dirs'], 'scheme': classify_project(os.path.basename(project), listing)}
+
+def scan_root(root, platform_info=None, workers=DEFAULT_WORKERS, max_projects=MAX_PROJECTS):
+    """Classify the projects under root and report the dominant organization scheme
+
+    Returns {'root', 'scheme', 'confidence', 'counts', 'projects_scanned',
+    'projects_total', 'cached', 'elapsed_ms'}; scheme is None when no scheme
+    is dominant enough. With platform_info, per-project results are cached
+    in ~/goose_hints/.cache/ and reused while their directory mtimes hold.
+    """
+    started = time.perf_counter()
+    root = str(Path(root).expanduser())
+    try:
+        projects, total = list_projects(root, max_projects)
+    except OSError:
+        projects, total = [], 0
+
+    cache_file = cache_path(platform_info) if platform_info is not None else None
+    cached = _load_cache(cache_file) if cache_file is not None else {}
+    results = {project: cached[project] for project in projects
+               if project in cached and _still_valid(project, cached[project])}
+    reused = len(results)
+    counts = Counter(entry['scheme'] for entry in results.values() if entry['scheme'])
+
+    def decided():
+        classified = sum(counts.values())
+        return classified >= EARLY_EXIT_PROJECTS and counts.most_common(1)[0][1] >= EARLY_EXIT_SHARE * classified
+
+    todo = [project for project in projects if project not in results]
+    if todo and not decided():
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            # Batches of a few projects per worker, so the scan can stop early between them
+            step = workers * 2
+            for start in range(0, len(todo), step):
+                batch = todo[start:start + step]
+                for project, entry in zip(batch, pool.map(_scan_and_classify, batch)):
+                    results[project] = entry
+                    if entry['scheme']:
+                        counts[entry['scheme']] += 1
+                if decided():
+                    break
+
+    if cache_file is not None and len(results) > reused:
+        cached.update(results)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            from goose_hints_storage import atomic_write
+            atomic_write(cache_file, json.dumps({'scan': SCAN_VERSION, 'projects': cached}) + "\n")
+        except OSError:
+            pass
+
+    scheme, confidence = None, 0.0
+    if counts and len(results) >= MIN_PROJECTS:
+        leader, count = counts.most_common(1)[0]
+        confidence = count / len(results)
+        if confidence >= MIN_CONFIDENCE:
+            scheme = leader
+    return {
+        'root': root,
+        'scheme': scheme,
+        'confidence': round(confidence, 3),
+        'counts': {key: counts[key] for key in SCHEMES if counts[key]},
+        'projects_scanned': len(results),
+        'projects_total': total,
+        'cached': reused,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+    }
+
+def root_path(option_key, platform_info):
+    """Directory for a root_directory option key (None for custom_path)"""
+    return {
+        'home_projects': platform_info['projects'],
+        'desktop': platform_info['desktop'],
+        'documents': platform_info['documents'],
+        'current_dir': Path.cwd(),
+    }.get(option_key)
+
+if __name__ == "__main__":
+    from goose_hints_platform import get_user_platform_info
+    platform_info = get_user_platform_info()
+    print(json.dumps(scan_root(sys.argv[1] if len(sys.argv) > 1 else platform_info['projects'], platform_info),
+                     indent=2))
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Hints Parser
+Turns rendered hints files back into structured preferences. Each file is
+read once, line by line: the header gives the edition, platform and home
+directory, every '### Category:' section is matched to its catalog category
+and each '- hint' line to the option whose hint it is (exact lookups, with
+patterns only for hints that contain a path), falling back to a custom
+preference. Files written before single-answer categories rendered their
+hint (raw 'key:' / 'label:' / 'hint:' lines) are understood too.
+
+Whole directories are parsed in parallel on a process pool. The output is
+batch-mode answer records, so old files can be re-rendered, installed or
+analyzed, and --index records their answers in each directory's hints store.
+
+    python src/goose_hints_parse.py ~/goose_hints --output answers.jsonl
+    python src/goose_hints_parse.py /srv/hints/* --workers 8 --index
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from goose_hints_catalog import get_options, get_question, load_catalog
+from goose_hints_flow import build_preferences, custom_option, is_asked, question_options
+from goose_hints_render import LAYOUTS, title_case
+from goose_hints_storage import FILE_PREFIXES
+
+CUSTOM = 'custom_preference'
+HEADER = re.compile(r'^# (.+) - Generated (\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})$')
+SECTION = re.compile(r'^### (?:\d+\. )?(.+):$')
+# 'name: value' lines the renderer writes for plain (non-option) values
+RAW_FIELD = re.compile(r'^([a-z][a-z0-9_]*): (.*)$')
+PLACEHOLDER = re.compile(r'\\\{(\w+)\\\}')
+# Fields of an option dict, as the first Simple Edition renderer wrote them
+LEGACY_FIELDS = ('key', 'label', 'hint')
+
+_matchers = {}
+
+class QuestionMatcher:
+    """Finds the option of one choice question a rendered hint line came from"""
+
+    __slots__ = ('question', 'exact', 'patterns')
+
+    def __init__(self, edition, question):
+        self.question = question
+        self.exact, self.patterns = {}, []
+        options = get_options(edition, question['key']) if question['type'] == 'choice' else ()
+        for option in options:
+            if '{' in option['hint']:
+                self.patterns.append((_hint_pattern(option['hint']), option['key'], None))
+            else:
+                self.exact.setdefault(option['hint'], option['key'])
+
+    def match(self, text):
+        """(option key, follow-up question, follow-up value) for a hint line, or None"""
+        option_key = self.exact.get(text)
+        if option_key is not None:
+            return option_key, None, None
+        for pattern, option_key, follow_up in self.patterns:
+            match = pattern.match(text)
+            if match:
+                return option_key, follow_up, match.group('value') if follow_up else None
+        return None
+
+def _hint_pattern(hint):
+    return re.compile('^' + PLACEHOLDER.sub(lambda m: f"(?P<{m.group(1)}>.+?)", re.escape(hint)) + '$')
+
+def edition_matchers(edition):
+    """{category: [QuestionMatcher]} for an edition, built once per process"""
+    if edition not in _matchers:
+        catalog = load_catalog()
+        categories = {}
+        for category in catalog['editions'][edition]['categories']:
+            matchers = {}
+            for question_key in catalog['categories'][(edition, category)]['questions']:
+                question = get_question(edition, question_key)
+                if question.get('applies_to'):
+                    # Follow-up text rewrites its parent option's hint, e.g. a custom root path
+                    parent = matchers[question['applies_to']]
+                    parent.patterns.insert(0, (_hint_pattern(question['hint']), next(iter(question['when']['in'])),
+                                               question['key']))
+                else:
+                    matchers[question_key] = QuestionMatcher(edition, question)
+            categories[category] = list(matchers.values())
+        _matchers[edition] = categories
+    return _matchers[edition]
+
+def edition_for(title, path=None):
+    """Edition named by a header title ('Universal Goose Hints') or file name prefix"""
+    for edition, layout in LAYOUTS.items():
+        if layout['title'] == title:
+            return edition
+    if path is not None:
+        for edition, prefix in FILE_PREFIXES.items():
+            if Path(path).name.startswith(prefix + '_'):
+                return edition
+    return None
+
+def parse_section(edition, category, lines, parsed):
+    """Match one category's '- ' lines to its questions, adding to parsed in place
+
+    parsed holds 'answers', the 'hints' text of matched options, 'extras'
+    (plain values such as exemplar_style, by category) and 'unmatched' lines.
+    """
+    answers, extras = parsed['answers'], parsed['extras']
+    matchers = edition_matchers(edition)[category]
+    by_title = {title_case(matcher.question['key']): matcher for matcher in matchers}
+    by_key = {matcher.question['key']: matcher for matcher in matchers}
+
+    fields = {}
+    for line in lines:
+        field = RAW_FIELD.match(line)
+        if field and field.group(1) in LEGACY_FIELDS:
+            fields[field.group(1)] = field.group(2)
+    if len(matchers) == 1 and 'key' in fields and 'hint' in fields:
+        # An option dict printed field by field
+        question = matchers[0].question
+        # Keys of options since retired from the catalog keep their text as a custom answer
+        known = {option['key'] for option in get_options(edition, question['key'])}
+        if fields['key'] == CUSTOM or fields['key'] not in known:
+            answers[question['key']] = custom_option(fields['hint'])
+        else:
+            answers[question['key']] = fields['key']
+            parsed['hints'][question['key']] = fields['hint']
+        return
+
+    cursor = 0
+    for line in lines:
+        candidates, text, titled = matchers[cursor:], line, False
+        field = RAW_FIELD.match(line)
+        label = line.split(': ', 1)
+        if field and field.group(1) in by_key and by_key[field.group(1)].question['type'] == 'text':
+            answers[field.group(1)] = field.group(2)
+            cursor = matchers.index(by_key[field.group(1)]) + 1
+            continue
+        if field and field.group(1) not in by_key:
+            extras.setdefault(category, {})[field.group(1)] = field.group(2)
+            continue
+        if LAYOUTS[edition]['labeled'] and len(label) == 2 and label[0] in by_title:
+            candidates, text, titled = [by_title[label[0]]], label[1], True
+        elif LAYOUTS[edition]['labeled'] and len(matchers) > 1 and len(label) == 2:
+            extras.setdefault(category, {})[label[0].lower().replace(' ', '_')] = label[1]
+            continue
+
+        for matcher in candidates:
+            question_key = matcher.question['key']
+            if matcher.question['type'] == 'text':
+                # Unlabeled text answers are 'key: value' lines, handled above
+                found = text if titled else None
+            else:
+                found = matcher.match(text)
+            if found is None:
+                continue
+            if matcher.question['type'] == 'text':
+                answers[question_key] = text
+            elif found[1] is not None:
+                answers[question_key], answers[found[1]] = found[0], found[2]
+            else:
+                answers[question_key] = found[0]
+                parsed['hints'][question_key] = text
+            cursor = matchers.index(matcher) + 1
+            break
+        else:
+            # Nothing in the catalog says this: a custom answer for the next question that was asked
+            resolved = {key: value if isinstance(value, dict) else {'key': value} for key, value in answers.items()}
+            target = next((matcher for matcher in candidates if matcher.question['type'] == 'choice'
+                           and matcher.question['key'] not in answers and is_asked(matcher.question, resolved)),
+                          None)
+            if target is None:
+                parsed['unmatched'].append(line)
+                continue
+            answers[target.question['key']] = custom_option(text)
+            cursor = matchers.index(target) + 1
+
+def parse_hints(lines, path=None, edition=None):
+    """Parse a rendered hints document from an iterable of lines
+
+    Returns a dict with the edition, platform, home, generated_at, the raw
+    answers ({question: option key, custom option or text}), the rebuilt
+    preferences, and any lines that could not be placed.
+    """
+    result = {'path': str(path) if path is not None else None, 'edition': edition, 'platform': None,
+              'home': None, 'generated_at': None}
+    categories, titles = None, {}
+    parsed = {'answers': {}, 'hints': {}, 'extras': {}, 'unmatched': []}
+    unmatched = parsed['unmatched']
+    category, section = None, []
+
+    def flush():
+        if category is not None and section:
+            parse_section(result['edition'], category, section, parsed)
+
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line.startswith('# '):
+            header = HEADER.match(line)
+            if header:
+                result['edition'] = result['edition'] or edition_for(header.group(1), path)
+                result['generated_at'] = header.group(2).replace(' ', 'T')
+            elif line.startswith('# Platform: '):
+                result['platform'] = line[len('# Platform: '):].strip()
+            elif line.startswith('# Home Directory: '):
+                result['home'] = line[len('# Home Directory: '):].strip()
+        elif line.startswith('### '):
+            flush()
+            if categories is None:
+                result['edition'] = result['edition'] or edition_for(None, path)
+                if result['edition'] is None:
+                    raise ValueError("not a Goose hints file")
+                categories = load_catalog()['editions'][result['edition']]['categories']
+                titles = {title_case(key): key for key in categories}
+            match = SECTION.match(line)
+            category, section = titles.get(match.group(1)) if match else None, []
+            if category is None:
+                unmatched.append(line)
+        elif line.startswith('## ') and categories is not None:
+            # The configuration is over; the rest is fixed boilerplate
+            break
+        elif line.startswith('- ') and category is not None:
+            section.append(line[2:].strip())
+        elif line.startswith('- ') and categories is not None:
+            unmatched.append(line)
+    flush()
+    if result['edition'] is None:
+        raise ValueError("not a Goose hints file")
+
+    result['answers'] = parsed['answers']
+    result['preferences'] = rebuild_preferences(result, parsed['hints'], parsed['extras'])
+    result['unmatched'] = unmatched
+    return result
+
+def rebuild_preferences(result, hints, extras):
+    """Preferences dict for parsed answers, using the file's own hint text"""
+    from goose_hints_platform import get_user_platform_info
+    edition = result['edition']
+    platform_info = get_user_platform_info(home=result['home'], system=result['platform'])
+    resolved = {}
+    for question_key, value in result['answers'].items():
+        if isinstance(value, str) and get_question(edition, question_key)['type'] == 'choice':
+            option = next((option for option in question_options(edition, get_question(edition, question_key),
+                                                                  platform_info) if option['key'] == value), None)
+            if option is None:
+                resolved[question_key] = custom_option(hints.get(question_key, value))
+            else:
+                resolved[question_key] = dict(option, hint=hints[question_key]) if question_key in hints else option
+        else:
+            resolved[question_key] = value
+    preferences = build_preferences(edition, resolved)
+    for category, values in extras.items():
+        group = preferences.setdefault(category, {})
+        if isinstance(group, dict) and 'hint' not in group:
+            group.update(values)
+    return preferences
+
+def parse_hints_file(path, with_hash=False):
+    """Parse one hints file in a single sequential read
+
+    Without with_hash reading stops at the end of the configuration; with it
+    the rest is read too so the result carries the file's sha256.
+    """
+    digest = hashlib.sha256() if with_hash else None
+
+    def lines(f):
+        for raw in f:
+            if digest is not None:
+                digest.update(raw)
+            yield raw.decode('utf-8', 'replace')
+
+    with open(path, 'rb', buffering=1 << 16) as f:
+        stream = lines(f)
+        result = parse_hints(stream, path)
+        if digest is not None:
+            for _ in stream:
+                pass
+            result['content_hash'] = digest.hexdigest()
+    return result
+
+def answer_record(result):
+    """Batch-mode answer record for a parsed file (custom answers as 'custom: ...')"""
+    record = {'id': Path(result['path']).stem if result['path'] else None, 'edition': result['edition'],
+              'home': result['home'], 'system': result['platform'], 'generated_at': result['generated_at']}
+    for question_key, value in result['answers'].items():
+        record[question_key] = f"custom: {value['hint']}" if isinstance(value, dict) else value
+    return record
+
+def iter_hints_paths(paths):
+    """Hints files named by path, or found directly inside directories"""
+    prefixes = tuple(prefix + '_' for prefix in FILE_PREFIXES.values())
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                names = sorted(entry.path for entry in entries
+                               if entry.name.startswith(prefixes) and entry.name.endswith('.txt') and entry.is_file())
+            for name in names:
+                yield name
+        else:
+            yield str(path)
+
+def parse_chunk(paths, with_hash=False):
+    """Worker entry point: parse a chunk of files, never raising per file"""
+    results = []
+    for path in paths:
+        try:
+            results.append((path, parse_hints_file(path, with_hash), None))
+        except (OSError, ValueError) as e:
+            results.append((path, None, str(e)))
+    return results
+
+def parse_paths(paths, workers=None, chunk_size=50, with_hash=False):
+    """Parse every hints file under paths, yielding (path, result, error) in file order"""
+    from goose_hints_batch import iter_chunks
+    chunks = iter_chunks(iter_hints_paths(paths), chunk_size)
+    if workers is not None and workers <= 0:
+        for chunk in chunks:
+            for item in parse_chunk(chunk, with_hash):
+                yield item
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for chunk in chunks:
+            pending.append(executor.submit(parse_chunk, chunk, with_hash))
+            if len(pending) >= workers * 2:
+                for item in pending.pop(0).result():
+                    yield item
+        for future in pending:
+            for item in future.result():
+                yield item
+
+def result_hash(result):
+    """The preferences hash save_hints() gave the file a parsed result came from
+
+    This is what the hints store keeps as content_hash. Files whose header
+    lacks the platform or home, or whose preferences could not be rebuilt,
+    get '' so they are never taken for a lookup's match.
+    """
+    from goose_hints_storage import preferences_hash
+    if result.get('preferences') is None or not result['platform'] or result['home'] is None:
+        return ''
+    return preferences_hash(result['preferences'], {'system': result['platform'], 'home': result['home']},
+                            result['edition'])
+
+def index_result(stores, result):
+    """Record a parsed file, with its answers, in the hints store of its directory"""
+    from goose_hints_store import FILENAME_PATTERN, HintsStore
+    path = Path(result['path'])
+    store = stores.get(path.parent)
+    if store is None:
+        store = stores[path.parent] = HintsStore(path.parent)
+    match = FILENAME_PATTERN.match(path.name)
+    stamps = ((result['generated_at'], '%Y-%m-%dT%H:%M:%S'), (match and match.group('stamp'), '%Y%m%d_%H%M%S'))
+    for stamp, stamp_format in stamps:
+        try:
+            created_at = datetime.strptime(stamp, stamp_format)
+            break
+        except (TypeError, ValueError):
+            continue
+    else:
+        created_at = datetime.fromtimestamp(path.stat().st_mtime)
+    latest = store.latest(result['edition'])
+    store.record(path, result['edition'], result['platform'] or 'unknown', result_hash(result),
+                 result['preferences'], created_at)
+    if latest and latest['created_ts'] > created_at.timestamp():
+        store.mark_latest(latest['path'])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Turn existing hints files back into structured preferences")
+    parser.add_argument('paths', nargs='*', default=[str(Path.home() / "goose_hints")],
+                        help="Hints files or directories holding them (default: ~/goose_hints)")
+    parser.add_argument('--output', help="Write one batch-mode answer record per file to this JSONL file")
+    parser.add_argument('--index', action='store_true', help="Record the answers in each directory's hints store")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (0 = run inline)")
+    args = parser.parse_args(argv)
+
+    from goose_hints_storage import atomic_write
+    started = time.perf_counter()
+    counts = {'files': 0, 'custom': 0, 'unmatched': 0}
+    failures, records, stores = [], [], {}
+    try:
+        for path, result, error in parse_paths(args.paths, args.workers, with_hash=args.index):
+            counts['files'] += 1
+            if error is not None:
+                failures.append((path, error))
+                continue
+            counts['custom'] += sum(1 for value in result['answers'].values() if isinstance(value, dict))
+            counts['unmatched'] += len(result['unmatched'])
+            if args.index:
+                index_result(stores, result)
+            record = json.dumps(answer_record(result))
+            if args.output:
+                records.append(record + "\n")
+            else:
+                print(record)
+    finally:
+        for store in stores.values():
+            store.close()
+    if args.output:
+        atomic_write(args.output, "".join(records))
+
+    print(f"✅ Parsed {counts['files'] - len(failures)} hints files in {time.perf_counter() - started:.2f}s "
+          f"({counts['custom']} custom answers, {counts['unmatched']} unplaced lines)", file=sys.stderr)
+    for path, error in failures[:20]:
+        print(f"   ❌ {path}: {error}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
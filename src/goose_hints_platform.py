@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Platform Detection
+Platform-specific defaults (home, projects, desktop, documents) shared by the
+builders, batch mode and the service. Kept free of other project imports so
+short commands can use it without loading the question catalog.
+"""
+
+import platform
+from pathlib import Path
+
+def get_user_platform_info(home=None, system=None):
+    """Get platform-specific information for better defaults"""
+    system = system or platform.system()
+    home_dir = Path(home) if home else Path.home()
+    
+    # Platform-specific defaults
+    if system == "Windows":
+        default_projects = home_dir / "Documents" / "Projects"
+        default_desktop = home_dir / "Desktop"
+        default_documents = home_dir / "Documents"
+    else:  # macOS, Linux, Unix
+        default_projects = home_dir / "Projects"
+        default_desktop = home_dir / "Desktop" 
+        default_documents = home_dir / "Documents"
+    
+    return {
+        "system": system,
+        "home": home_dir,
+        "projects": default_projects,
+        "desktop": default_desktop,
+        "documents": default_documents
+    }
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Environment Probe
+Looks at the user's machine for answers they would otherwise have to type:
+which cloud storage sync folders exist, whether python, R and node are
+installed, and which of the catalog's font families are available. Each
+probe runs on its own daemon thread with a hard deadline, so a hung network
+mount or a slow font cache can never stall the first prompt; probes that
+miss the deadline simply report nothing. Results are cached on disk for a
+day and turned into preselected options for the matching questions.
+"""
+
+import glob
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROBE_VERSION = 1
+DEFAULT_TIMEOUT = 1.5
+DEFAULT_TTL = 24 * 60 * 60
+
+# Provider (cloud_provider option key) -> sync folder patterns relative to home
+CLOUD_ROOTS = {
+    'google_drive': ["Google Drive", "GoogleDrive", "My Drive", "Library/CloudStorage/GoogleDrive-*"],
+    'onedrive': ["OneDrive", "OneDrive - *", "Library/CloudStorage/OneDrive-*"],
+    'dropbox': ["Dropbox", "Dropbox (*)", "Library/CloudStorage/Dropbox"],
+    'icloud': ["Library/Mobile Documents/com~apple~CloudDocs", "iCloudDrive"],
+}
+
+# Toolchain -> executables that count as installed
+TOOLCHAINS = {
+    'python': ['python3', 'python'],
+    'r': ['R', 'Rscript'],
+    'node': ['node'],
+}
+
+# Font option key -> lowercase family names (spaces removed) that count as installed
+FONT_FAMILIES = {
+    'montserrat': ['montserrat'],
+    'roboto': ['roboto'],
+    'arial': ['arial'],
+    'times': ['timesnewroman', 'times'],
+}
+
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc', '.dfont')
+
+def probe_cloud_root(home, patterns):
+    """First existing sync folder matching any pattern, or None"""
+    for pattern in patterns:
+        for match in sorted(glob.glob(str(Path(home) / pattern))):
+            if os.path.isdir(match):
+                return match
+    return None
+
+def probe_toolchain(executables):
+    """Path of the first executable found on PATH, or None"""
+    for executable in executables:
+        path = shutil.which(executable)
+        if path:
+            return path
+    return None
+
+def _font_directories(home, system):
+    home = Path(home)
+    if system == "Windows":
+        return [Path(os.environ.get('WINDIR', 'C:\\Windows')) / "Fonts",
+                home / "AppData" / "Local" / "Microsoft" / "Windows" / "Fonts"]
+    if system == "Darwin":
+        return [Path("/System/Library/Fonts"), Path("/Library/Fonts"), home / "Library" / "Fonts"]
+    return [Path("/usr/share/fonts"), Path("/usr/local/share/fonts"), home / ".fonts", home / ".local/share/fonts"]
+
+def _font_names(home, system):
+    """Lowercase installed font family or file names, spaces removed"""
+    if shutil.which('fc-list'):
+        import subprocess
+        result = subprocess.run(['fc-list', ':', 'family'], capture_output=True, text=True, timeout=DEFAULT_TIMEOUT)
+        return {name.strip().lower().replace(' ', '') for line in result.stdout.splitlines()
+                for name in line.split(',') if name.strip()}
+    names = set()
+    for directory in _font_directories(home, system):
+        for root, _, files in os.walk(str(directory)):
+            names.update(Path(name).stem.lower().replace(' ', '').replace('_', '')
+                         for name in files if name.lower().endswith(FONT_EXTENSIONS))
+    return names
+
+def probe_fonts(home, system):
+    """Catalog font keys whose family is installed, in catalog order"""
+    names = _font_names(home, system)
+    return [font for font, families in FONT_FAMILIES.items()
+            if any(name.startswith(family) for name in names for family in families)]
+
+def run_probes(probes, timeout=DEFAULT_TIMEOUT):
+    """Run {name: callable} concurrently; returns (results, timed_out names)
+
+    Every probe gets the same hard deadline. Probes still running when it
+    passes are abandoned on their daemon threads and report None.
+    """
+    results = {}
+    threads = {}
+
+    def run(name, probe):
+        try:
+            results[name] = probe()
+        except Exception:
+            results[name] = None
+
+    for name, probe in probes.items():
+        thread = threading.Thread(target=run, args=(name, probe), name=f"probe-{name}", daemon=True)
+        thread.start()
+        threads[name] = thread
+
+    deadline = time.monotonic() + timeout
+    timed_out = []
+    for name, thread in threads.items():
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            timed_out.append(name)
+    return {name: results.get(name) for name in probes if name not in timed_out}, timed_out
+
+def cache_path(platform_info):
+    return Path(platform_info['home']) / "goose_hints" / ".cache" / "environment_probe.json"
+
+def _read_cache(path, platform_info, ttl):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get('probe') != PROBE_VERSION \
+            or cached.get('system') != platform_info['system'] or cached.get('home') != str(platform_info['home']) \
+            or time.time() - cached.get('probed_at', 0) > ttl:
+        return None
+    return cached
+
+def probe_environment(platform_info, timeout=DEFAULT_TIMEOUT, ttl=DEFAULT_TTL, use_cache=True):
+    """Detected cloud folders, toolchains and fonts, from the cache when it is fresh
+
+    Returns {'cloud': {provider: path}, 'toolchains': {name: path},
+    'fonts': [font keys], 'timed_out': [probe names], ...}.
+    """
+    path = cache_path(platform_info)
+    if use_cache:
+        cached = _read_cache(path, platform_info, ttl)
+        if cached is not None:
+            return cached
+
+    home, system = platform_info['home'], platform_info['system']
+    probes = {f"cloud:{provider}": (lambda patterns=patterns: probe_cloud_root(home, patterns))
+              for provider, patterns in CLOUD_ROOTS.items()}
+    probes.update({f"toolchain:{name}": (lambda executables=executables: probe_toolchain(executables))
+                   for name, executables in TOOLCHAINS.items()})
+    probes['fonts'] = lambda: probe_fonts(home, system)
+    started = time.perf_counter()
+    results, timed_out = run_probes(probes, timeout)
+
+    environment = {
+        'probe': PROBE_VERSION,
+        'system': system,
+        'home': str(home),
+        'probed_at': time.time(),
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 1),
+        'cloud': {name.split(':', 1)[1]: value for name, value in results.items()
+                  if name.startswith('cloud:') and value},
+        'toolchains': {name.split(':', 1)[1]: value for name, value in results.items()
+                       if name.startswith('toolchain:') and value},
+        'fonts': results.get('fonts') or [],
+        'timed_out': timed_out,
+    }
+    # A probe that timed out gets another chance next run instead of being cached as absent
+    if use_cache and not timed_out:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            from goose_hints_storage import atomic_write
+            atomic_write(path, json.dumps(environment, indent=2) + "\n")
+        except OSError:
+            pass
+    return environment
+
+def suggested_defaults(environment):
+    """{question key: option key} preselections derived from a probe result"""
+    defaults = {}
+    cloud = environment.get('cloud') or {}
+    if len(cloud) == 1:
+        defaults['cloud_provider'] = next(iter(cloud))
+    elif cloud:
+        defaults['cloud_provider'] = 'multiple'
+
+    toolchains = environment.get('toolchains') or {}
+    if 'r' in toolchains:
+        defaults['coding_preferences'] = 'r_focus'
+    elif 'python' in toolchains:
+        defaults['coding_preferences'] = 'python_focus'
+    elif 'node' in toolchains:
+        defaults['coding_preferences'] = 'javascript_focus'
+
+    fonts = environment.get('fonts') or []
+    if fonts:
+        defaults['preferred_font'] = fonts[0]
+    return defaults
+
+def describe_environment(environment):
+    """Short human-readable lines about what the probe found"""
+    lines = []
+    if environment.get('cloud'):
+        lines.append("Cloud storage: " + ", ".join(sorted(environment['cloud'])))
+    if environment.get('toolchains'):
+        lines.append("Toolchains: " + ", ".join(sorted(environment['toolchains'])))
+    if environment.get('fonts'):
+        lines.append("Fonts: " + ", ".join(environment['fonts']))
+    return lines
+
+if __name__ == "__main__":
+    from goose_hints_platform import get_user_platform_info
+    found = probe_environment(get_user_platform_info(), use_cache='--fresh' not in sys.argv)
+    print(json.dumps(dict(found, defaults=suggested_defaults(found)), indent=2))
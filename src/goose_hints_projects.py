@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Per-Project Hints
+Goose also reads a .goosehints file in the directory it is started from, so
+the saved preferences are written into every repository under the projects
+root instead of being copied around by hand. Project roots are the
+directories holding a version control marker (.git, .hg, .svn, ...); the
+walk does not descend into a project once it is found.
+
+Each project's .goosehints gets the same managed section the installer
+writes into the global hints file, so notes the team keeps there are left
+alone. An overrides file adjusts the categories per project:
+
+    {
+      "clients/*": {"communication_style": "Write for client audiences"},
+      "website":   {"coding_preferences": null},
+      "scratch-*": {"skip": true}
+    }
+
+Patterns are matched against each project's path relative to the root (and
+its name), in file order; a category maps to a hint, a list of hints or null
+to leave it out. Files are merged on a thread pool. A manifest in
+~/goose_hints records the hash of every managed section written, so files
+whose section would not change are left untouched and sections edited by
+hand since the last run are reported as conflicts rather than overwritten
+(--force overwrites them).
+
+    python src/goose_hints_projects.py                          # saved preferences, configured root
+    python src/goose_hints_projects.py --root ~/src --overrides overrides.json --dry-run
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+
+from goose_hints_install import category_sections, managed_block, merge_goosehints
+from goose_hints_storage import atomic_write
+
+HINTS_FILENAME = ".goosehints"
+VCS_MARKERS = ('.git', '.hg', '.svn', '.bzr', '.fslckout', '_darcs')
+MANIFEST_VERSION = 1
+DEFAULT_WORKERS = 16
+MAX_DEPTH = 4
+CUSTOM_ROOT = re.compile(r'^Use (.+) as root directory$')
+
+# Result statuses
+WRITTEN, UNCHANGED, EXCLUDED, CONFLICT, FAILED = 'written', 'unchanged', 'excluded', 'conflict', 'failed'
+
+def configured_root(preferences, platform_info):
+    """The root directory the preferences chose, or the platform's projects folder"""
+    from goose_hints_layout import root_path
+    choice = (preferences.get('file_management') or {}).get('root_directory')
+    if isinstance(choice, dict) and 'key' in choice:
+        if choice['key'] == 'custom_path':
+            match = CUSTOM_ROOT.match(choice.get('hint', ''))
+            if match:
+                return Path(match.group(1)).expanduser()
+        else:
+            root = root_path(choice['key'], platform_info)
+            if root is not None:
+                return Path(root)
+    return Path(platform_info['projects'])
+
+def find_projects(root, max_depth=MAX_DEPTH):
+    """Project roots under root (version control marker present), sorted
+
+    Hidden and dependency directories are not entered, nor are projects
+    once found: nested checkouts belong to their enclosing project.
+    """
+    from goose_hints_layout import IGNORED_DIRS
+    projects, pending = [], [(str(root), 0)]
+    while pending:
+        path, depth = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name in VCS_MARKERS:
+                        subdirs = None
+                        break
+                    if depth < max_depth and not entry.name.startswith('.') and entry.name not in IGNORED_DIRS:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                        except OSError:
+                            continue
+        except OSError:
+            continue
+        if subdirs is None:
+            projects.append(Path(path))
+        else:
+            pending.extend((subdir, depth + 1) for subdir in subdirs)
+    return sorted(projects)
+
+def load_overrides(path):
+    """[(pattern, {category: hint, [hints] or None, 'skip': bool})] from an overrides JSON file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        overrides = json.load(f)
+    if not isinstance(overrides, dict) or not all(isinstance(value, dict) for value in overrides.values()):
+        raise ValueError(f"{path}: expected an object mapping project patterns to category overrides")
+    for pattern, changes in overrides.items():
+        for category, value in changes.items():
+            if category == 'skip':
+                if not isinstance(value, bool):
+                    raise ValueError(f"{path}: '{pattern}': skip must be true or false")
+            elif not (value is None or isinstance(value, str)
+                      or (isinstance(value, list) and all(isinstance(line, str) for line in value))):
+                raise ValueError(f"{path}: '{pattern}': {category} must be a hint, a list of hints or null")
+    return list(overrides.items())
+
+def project_sections(sections, relative, overrides):
+    """The categories for one project after its overrides, or None to leave it out"""
+    sections = dict(sections)
+    for pattern, changes in overrides:
+        if not (fnmatch(relative, pattern) or fnmatch(relative.rsplit('/', 1)[-1], pattern)):
+            continue
+        for category, value in changes.items():
+            if category == 'skip':
+                if value:
+                    return None
+            elif value is None:
+                sections.pop(category, None)
+            else:
+                sections[category] = [value] if isinstance(value, str) else list(value)
+    return sections
+
+def _hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def write_project(project, sections, recorded=None, force=False, dry_run=False):
+    """Merge sections into one project's hints file
+
+    recorded is the hash of the managed section last written there, if any.
+    Returns (status, detail, section hash).
+    """
+    path = Path(project) / HINTS_FILENAME
+    if path.is_symlink():
+        return CONFLICT, f"{HINTS_FILENAME} is a symlink", recorded
+    try:
+        current = path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        current = ''
+    block = managed_block(current)
+    if block is not None and recorded is not None and _hash(block) != recorded and not force:
+        return CONFLICT, "managed section edited since the last run (use --force to overwrite)", recorded
+
+    merged = merge_goosehints(current, sections, replace=True)
+    block_hash = _hash(managed_block(merged))
+    if merged == current:
+        return UNCHANGED, None, block_hash
+    if not dry_run:
+        atomic_write(path, merged)
+    return WRITTEN, None, block_hash
+
+def manifest_path(platform_info):
+    return Path(platform_info['home']) / "goose_hints" / "projects_manifest.json"
+
+def load_manifest(path):
+    """{project path: section hash} written by earlier runs"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('projects', {})
+
+def save_manifest(path, projects):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, json.dumps({'version': MANIFEST_VERSION, 'projects': projects}, indent=1, sort_keys=True) + "\n")
+
+def fan_out(preferences, root, overrides=(), manifest=None, workers=DEFAULT_WORKERS, force=False, dry_run=False,
+            max_depth=MAX_DEPTH, projects=None):
+    """Write the preferences into every project under root (or the given projects)
+
+    manifest ({project: section hash}) is updated in place. Returns
+    {'projects', written/unchanged/excluded/conflict/failed counts,
+    'results': [(project, status, detail)], 'elapsed'}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    started = time.perf_counter()
+    manifest = {} if manifest is None else manifest
+    root = Path(root)
+    sections = category_sections(preferences)
+    projects = find_projects(root, max_depth) if projects is None else [Path(project) for project in projects]
+
+    def job(project):
+        relative = project.relative_to(root).as_posix()
+        chosen = project_sections(sections, relative, overrides)
+        if chosen is None:
+            return project, EXCLUDED, None, None
+        try:
+            status, detail, block_hash = write_project(project, chosen, manifest.get(str(project)), force, dry_run)
+        except OSError as e:
+            return project, FAILED, f"{type(e).__name__}: {e}", None
+        return project, status, detail, block_hash
+
+    summary = {status: 0 for status in (WRITTEN, UNCHANGED, EXCLUDED, CONFLICT, FAILED)}
+    summary.update(projects=len(projects), results=[])
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for project, status, detail, block_hash in pool.map(job, projects):
+            summary[status] += 1
+            summary['results'].append((str(project), status, detail))
+            if block_hash is not None and not dry_run:
+                manifest[str(project)] = block_hash
+    summary['elapsed'] = time.perf_counter() - started
+    return summary
+
+def print_summary(summary, root, dry_run=False):
+    verb = "would be written" if dry_run else "written"
+    print(f"📁 {summary['projects']} projects under {root}")
+    print(f"✅ {summary[WRITTEN]} {verb}, {summary[UNCHANGED]} skipped (already up to date), "
+          f"{summary[EXCLUDED]} excluded by overrides, {summary[CONFLICT]} conflicts, "
+          f"{summary[FAILED]} failed in {summary['elapsed']:.2f}s")
+    for project, status, detail in summary['results']:
+        if status in (CONFLICT, FAILED):
+            print(f"   {'⚠️ ' if status == CONFLICT else '❌'} {project}: {detail}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write your preferences into every project's .goosehints")
+    parser.add_argument('--edition', choices=['simple', 'comprehensive'], default='simple')
+    parser.add_argument('--home', help="Home directory holding goose_hints/ (default: your home)")
+    parser.add_argument('--root', help="Directory holding the projects (default: your chosen root directory)")
+    parser.add_argument('--overrides', help="JSON file of per-project category overrides")
+    parser.add_argument('--max-depth', type=int, default=MAX_DEPTH, help="How deep to look for projects")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--force', action='store_true', help="Overwrite managed sections edited by hand")
+    parser.add_argument('--dry-run', action='store_true', help="Report what would change without writing")
+    args = parser.parse_args(argv)
+
+    from goose_hints_platform import get_user_platform_info
+    from goose_hints_state import load_state
+    platform_info = get_user_platform_info(home=args.home)
+    state = load_state(platform_info, args.edition)
+    if state is None:
+        print(f"No saved {args.edition} preferences - run 'goose-hints build --edition {args.edition}' first",
+              file=sys.stderr)
+        return 1
+    try:
+        overrides = load_overrides(args.overrides) if args.overrides else []
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read overrides: {e}", file=sys.stderr)
+        return 1
+
+    root = Path(args.root).expanduser() if args.root else configured_root(state['preferences'], platform_info)
+    if not root.is_dir():
+        print(f"❌ {root} is not a directory", file=sys.stderr)
+        return 1
+    path = manifest_path(platform_info)
+    manifest = load_manifest(path)
+    summary = fan_out(state['preferences'], root, overrides, manifest, args.workers, args.force, args.dry_run,
+                      args.max_depth)
+    if not args.dry_run and summary[WRITTEN] + summary[UNCHANGED]:
+        save_manifest(path, manifest)
+    print_summary(summary, root, args.dry_run)
+    return 1 if summary[FAILED] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
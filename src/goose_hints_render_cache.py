@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Render Cache
+Most people in an organization pick the same few option combinations, so
+batch runs and the Help-menu service keep rendering identical documents.
+The cache stores each distinct document once, as a template: the text with
+the per-user fields - generation time, home directory, file path - left as
+slots that are filled in for every user.
+
+Templates are keyed by what the rendered text depends on - the category
+and question keys and the chosen hints, with the home directory factored
+out of them since they often mention paths under it - plus the edition, the
+platform and RENDERER_VERSION. An in-process LRU tier is
+bounded by total template size; an optional directory tier is shared by
+worker processes and survives restarts. Hit and miss counters are kept so
+the cache can be sized.
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from goose_hints_render import RENDERER_VERSION, render_hints
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+# Slot markers use private-use characters that never occur in real hints
+HOME, FILE = "\ue000home\ue001", "\ue000file\ue001"
+SLOT = re.compile("\ue000(home|file|time:[^\ue001]*)\ue001")
+
+class _TimeSlot:
+    """Stands in for generated_at while a template is rendered"""
+
+    def strftime(self, fmt):
+        return f"\ue000time:{fmt}\ue001"
+
+# Structure markers in a render signature
+OPTION, GROUP, END = 1, 2, 3
+
+def _factor_home(value, home):
+    """value with every occurrence of home in its strings replaced by the home slot
+
+    Values other than dicts and None are rendered through str(), so they are
+    turned into strings here and rendered identically.
+    """
+    if isinstance(value, dict):
+        return {key: _factor_home(item, home) for key, item in value.items()}
+    if value is None:
+        return None
+    return str(value).replace(home, HOME)
+
+def _signature(value, home, out):
+    """Append to out everything in value the rendered text depends on, home factored out
+
+    Option labels and keys are never rendered, so only hints are kept.
+    """
+    if isinstance(value, dict):
+        if 'hint' in value:
+            out.append(OPTION)
+            out.append(str(value['hint']).replace(home, HOME))
+        else:
+            out.append(GROUP)
+            for key, item in value.items():
+                out.append(key)
+                _signature(item, home, out)
+            out.append(END)
+    elif value is None:
+        out.append(None)
+    else:
+        out.append(str(value).replace(home, HOME))
+
+class HintsTemplate:
+    """A rendered hints document with slots for home, file path and generation time"""
+
+    __slots__ = ('pieces', 'size')
+
+    def __init__(self, pieces):
+        # Literal text at even indices, slot names at odd ones
+        self.pieces = pieces
+        self.size = sum(len(piece) for piece in pieces)
+
+    @classmethod
+    def from_text(cls, text):
+        return cls(SLOT.split(text))
+
+    def fill(self, home, filename, generated_at):
+        out = []
+        for index, piece in enumerate(self.pieces):
+            if not index % 2:
+                out.append(piece)
+            elif piece == 'home':
+                out.append(home)
+            elif piece == 'file':
+                out.append(str(filename))
+            else:
+                out.append(generated_at.strftime(piece[5:]))
+        return ''.join(out)
+
+class RenderCache:
+    """Two-tier cache of hints templates: an LRU in memory and, optionally, a directory"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory else None
+        self._templates = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+    def key(self, preferences, platform_info, edition):
+        """Hashable key that equals another's exactly when both render to the same template"""
+        home = str(platform_info['home']) or HOME
+        out = [RENDERER_VERSION, edition, platform_info['system']]
+        _signature(preferences, home, out)
+        return tuple(out)
+
+    def template(self, preferences, platform_info, edition='simple'):
+        key = self.key(preferences, platform_info, edition)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return template
+
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        template = self._load(digest)
+        if template is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            home = str(platform_info['home']) or HOME
+            text = render_hints(_factor_home(preferences, home), {'system': platform_info['system'], 'home': HOME},
+                                FILE, edition, _TimeSlot())
+            template = HintsTemplate.from_text(text)
+            self._store(digest, template)
+            with self._lock:
+                self.misses += 1
+        self._remember(key, template)
+        return template
+
+    def render(self, preferences, platform_info, filename, edition='simple', generated_at=None):
+        """The same text render_hints() returns, from the cache where possible"""
+        from datetime import datetime
+        return self.template(preferences, platform_info, edition).fill(
+            str(platform_info['home']), filename, generated_at or datetime.now())
+
+    def _remember(self, key, template):
+        with self._lock:
+            if key in self._templates or template.size > self.max_bytes:
+                return
+            self._templates[key] = template
+            self._bytes += template.size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._templates.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def _path(self, digest):
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def _load(self, digest):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(digest), 'r', encoding='utf-8') as f:
+                pieces = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(pieces, list) or len(pieces) % 2 != 1:
+            return None
+        return HintsTemplate(pieces)
+
+    def _store(self, digest, template):
+        if self.directory is None:
+            return
+        from goose_hints_storage import atomic_write
+        path = self._path(digest)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Other processes may store the same template; the last rename wins with identical content
+            atomic_write(path, json.dumps(template.pieces, ensure_ascii=False))
+        except OSError:
+            pass
+
+    def stats(self):
+        """Counters for sizing: lookups served from memory, from disk and rendered"""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {'hits': self.hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'entries': len(self._templates), 'bytes': self._bytes,
+                    'hit_rate': round((self.hits + self.disk_hits) / lookups, 3) if lookups else None}
+
+# One cache per process for the batch workers, created on first use
+_process_cache = None
+
+def process_cache(directory=None, max_bytes=DEFAULT_MAX_BYTES):
+    """This process's RenderCache (shared by every batch chunk it renders)"""
+    global _process_cache
+    if _process_cache is None or _process_cache.directory != (Path(directory) if directory else None):
+        _process_cache = RenderCache(max_bytes, directory)
+    return _process_cache
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Terminal Screens
+How the question loop reaches the terminal. Everything the views print for
+one step - category header, question, options, the reply to the last answer
+- is collected in a buffer and written together with the prompt in a single
+write, instead of one write per print() line.
+
+The optional full-screen mode redraws a fixed frame with ANSI escapes,
+rewriting only the lines that changed since the previous frame, and lets
+options be picked with the arrow keys (or their number) and Enter. It needs
+an interactive terminal; on dumb terminals, pipes and while a transcript is
+recorded or replayed the plain buffered screen is used instead.
+"""
+
+import contextlib
+import io
+import os
+import re
+import shutil
+import sys
+
+# Screen used by run_terminal() when none is given: 'plain' or 'full'
+_preferred = 'plain'
+
+OPTION_LINE = re.compile(r'^\s+(\d+)\. ')
+ALTERNATE_SCREEN, NORMAL_SCREEN = "\x1b[?1049h", "\x1b[?1049l"
+HIGHLIGHT, RESET = "\x1b[7m", "\x1b[0m"
+
+class LineScreen:
+    """Plain terminal output, buffered so each step reaches the terminal in one write"""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self._buffer = io.StringIO()
+        self._redirect = None
+
+    def __enter__(self):
+        self.stream = self.stream or sys.stdout
+        self._redirect = contextlib.redirect_stdout(self._buffer)
+        self._redirect.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._redirect.__exit__(*exc_info)
+        self.flush()
+
+    def take(self):
+        """Text printed since the last take()"""
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+    def flush(self):
+        text = self.take()
+        if text:
+            self.stream.write(text)
+            self.stream.flush()
+
+    def present(self, session, view, new_category, new_question):
+        """Show what the current step needs: review, category header, question"""
+        from goose_hints_engine import CHOOSE, REVIEW, TEXT
+        if session.state == REVIEW:
+            view.show_review(session)
+            return
+        if new_category:
+            view.show_category(session)
+        if session.state in (CHOOSE, TEXT) and (new_question or view.repeat_options):
+            view.show_question(session)
+
+    def read(self, session, prompt, question_text):
+        """Write the buffered screen with the prompt and return the line typed"""
+        from goose_hints_transcript import ask_user
+        lead = self.take()
+        with contextlib.redirect_stdout(self.stream):
+            return ask_user(prompt, question_text, session.state, lead)
+
+class FullScreen(LineScreen):
+    """Fixed-frame ANSI screen with arrow-key option selection
+
+    keys, if given, is an iterator of key names ('up', 'down', 'enter',
+    'explain', a digit) used instead of the keyboard.
+    """
+
+    def __init__(self, stream=None, keys=None, size=None):
+        super().__init__(stream)
+        self.keys = keys
+        self.size = size
+        self._frame = []
+        self._body = ''
+        self._messages = ''
+
+    def __enter__(self):
+        super().__enter__()
+        self.stream.write(ALTERNATE_SCREEN + "\x1b[H\x1b[2J")
+        self.stream.flush()
+        return self
+
+    def __exit__(self, *exc_info):
+        # Back on the normal screen the reply to the last answer is printed as usual
+        self.stream.write(NORMAL_SCREEN)
+        super().__exit__(*exc_info)
+
+    def present(self, session, view, new_category, new_question):
+        # The whole frame is redrawn every step, so the question is always shown
+        from goose_hints_engine import REVIEW
+        self._messages = self.take()
+        if session.state == REVIEW:
+            view.show_review(session)
+        else:
+            view.show_category(session)
+            view.show_question(session)
+        self._body = self.take()
+
+    def read(self, session, prompt, question_text):
+        from goose_hints_engine import CHOOSE
+        from goose_hints_transcript import ask_user
+        if session.state == CHOOSE:
+            return self._choose(session)
+        # Free text is typed on the frame's last line with ordinary line editing
+        self.draw(self.compose())
+        with contextlib.redirect_stdout(self.stream):
+            response = ask_user(prompt.lstrip('\n'), question_text, session.state)
+        self._frame[-1] = None
+        return response
+
+    def compose(self, selected=None):
+        """Frame lines: the question with the selected option highlighted, then any messages"""
+        lines = self._body.strip('\n').split('\n')
+        if selected is not None:
+            for index, line in enumerate(lines):
+                match = OPTION_LINE.match(line)
+                if match and int(match.group(1)) == selected:
+                    lines[index] = HIGHLIGHT + line + RESET
+        messages = self._messages.strip('\n')
+        if messages:
+            lines.extend([''] + messages.split('\n'))
+        lines.append('')
+        return lines
+
+    def _choose(self, session):
+        max_choice = len(session.options) + (1 if session.question['allow_custom'] else 0)
+        selected = session.default_number or 1
+        help_line = "↑/↓ to move, Enter to choose" + (", e to explain" if session.explain else "")
+        while True:
+            self.draw(self.compose(selected) + [help_line])
+            key = self._read_key()
+            if key == 'enter':
+                return str(selected)
+            if key == 'explain' and session.explain:
+                return 'explain'
+            if key == 'up':
+                selected = max_choice if selected == 1 else selected - 1
+            elif key == 'down':
+                selected = 1 if selected == max_choice else selected + 1
+            elif key and key.isdigit() and 1 <= int(key) <= max_choice:
+                selected = int(key)
+
+    def _read_key(self):
+        if self.keys is not None:
+            return next(self.keys)
+        return read_key()
+
+    def draw(self, lines):
+        """Rewrite the lines that differ from the last frame, in one write"""
+        columns, rows = self.size or shutil.get_terminal_size()
+        # One row is kept free so Enter on the last line never scrolls the frame
+        lines = [clip(line, columns - 1) for line in lines][-(rows - 1):]
+        out = []
+        for index, line in enumerate(lines):
+            if index >= len(self._frame) or self._frame[index] != line:
+                out.append(f"\x1b[{index + 1};1H{line}\x1b[K")
+        if len(lines) < len(self._frame):
+            out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        out.append(f"\x1b[{len(lines)};{len(strip_ansi(lines[-1])) + 1}H")
+        self._frame = lines
+        self.stream.write("".join(out))
+        self.stream.flush()
+
+def strip_ansi(text):
+    return re.sub(r'\x1b\[[0-9;?]*[A-Za-z]', '', text)
+
+def clip(line, width):
+    """Cut a line to the terminal width, keeping any trailing reset"""
+    visible = strip_ansi(line)
+    if len(visible) <= width:
+        return line
+    clipped = visible[:max(width - 1, 0)] + "…"
+    return HIGHLIGHT + clipped + RESET if line.startswith(HIGHLIGHT) else clipped
+
+def read_key():
+    """One key press from the terminal as 'up', 'down', 'enter', 'explain', a character or None"""
+    if os.name == 'nt':
+        import msvcrt
+        key = msvcrt.getwch()
+        if key in ('\x00', '\xe0'):
+            return {'H': 'up', 'P': 'down'}.get(msvcrt.getwch())
+        if key == '\x03':
+            raise KeyboardInterrupt
+        return decode_key(key)
+
+    import termios
+    import tty
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        # cbreak keeps Ctrl-C raising KeyboardInterrupt
+        tty.setcbreak(fd)
+        key = os.read(fd, 1).decode('utf-8', 'replace')
+        if key == '\x1b':
+            import select
+            if select.select([fd], [], [], 0.05)[0]:
+                return {'[A': 'up', '[B': 'down', 'OA': 'up', 'OB': 'down'}.get(os.read(fd, 2).decode('ascii', 'replace'))
+            return None
+        return decode_key(key)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+def decode_key(key):
+    if key in ('\r', '\n'):
+        return 'enter'
+    if key in ('e', 'E'):
+        return 'explain'
+    if key in ('k', 'K'):
+        return 'up'
+    if key in ('j', 'J'):
+        return 'down'
+    return key
+
+def full_screen_supported(stdin=None, stdout=None):
+    """True when both ends are an interactive terminal that understands ANSI escapes"""
+    from goose_hints_transcript import _active
+    stdin, stdout = stdin or sys.stdin, stdout or sys.stdout
+    if _active is not None or not (stdin.isatty() and stdout.isatty()):
+        return False
+    if os.name == 'nt':
+        return bool(os.environ.get('WT_SESSION'))
+    return os.environ.get('TERM', 'dumb') != 'dumb'
+
+def choose_screen():
+    """The preferred screen if this terminal supports it, else the plain one"""
+    if _preferred == 'full' and full_screen_supported():
+        return FullScreen()
+    return LineScreen()
+
+@contextlib.contextmanager
+def preferred_screen(mode):
+    """Use mode ('plain' or 'full') for the question loops inside the block"""
+    global _preferred
+    previous, _preferred = _preferred, mode
+    try:
+        yield
+    finally:
+        _preferred = previous
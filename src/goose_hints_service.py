@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Help Menu Service
+A single-process asyncio HTTP service that serves the question flow to many
+concurrent Help-menu sessions. Sessions live in memory and are evicted after
+a period of inactivity. Uses only the Python standard library.
+
+Endpoints (JSON in, JSON out):
+    POST   /sessions                  {"edition": "simple"}  -> first question
+    GET    /sessions/<id>/question    current question (or "done")
+    POST   /sessions/<id>/answer      {"answer": 2 | "option_key" | {"custom": "..."} | "text"}
+    GET    /sessions/<id>/render      rendered hints document (text/plain)
+    DELETE /sessions/<id>             end the session
+    GET    /health                    session counts
+"""
+
+import argparse
+import asyncio
+import json
+import secrets
+import time
+import traceback
+from collections import OrderedDict
+from http import HTTPStatus
+
+from goose_hints_catalog import load_catalog
+from goose_hints_engine import QuestionSession
+from goose_hints_platform import get_user_platform_info
+from goose_hints_render_cache import DEFAULT_MAX_BYTES, RenderCache
+
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+DEFAULT_MAX_SESSIONS = 100000
+MAX_BODY_BYTES = 64 * 1024
+
+class ServiceError(Exception):
+    """Request error mapped to an HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class Session:
+    """One Help-menu session: its question engine and when it was last used"""
+
+    __slots__ = ('id', 'flow', 'last_seen')
+
+    def __init__(self, session_id, edition, platform_info):
+        self.id = session_id
+        self.flow = QuestionSession(edition, platform_info)
+        self.last_seen = time.monotonic()
+
+class HintsService:
+    """Session store and request router, independent of the HTTP transport"""
+
+    def __init__(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, max_sessions=DEFAULT_MAX_SESSIONS, render_cache=None):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        # Sessions with the same answers share one rendering
+        self.render_cache = render_cache or RenderCache()
+        # Ordered by last access, so idle eviction only looks at the front
+        self.sessions = OrderedDict()
+        self.evicted = 0
+
+    def evict_idle(self, now=None):
+        """Drop sessions idle for longer than idle_timeout"""
+        now = time.monotonic() if now is None else now
+        evicted = 0
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if now - session.last_seen < self.idle_timeout:
+                break
+            self.sessions.popitem(last=False)
+            evicted += 1
+        self.evicted += evicted
+        return evicted
+
+    def _session(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise ServiceError(HTTPStatus.NOT_FOUND, "unknown or expired session")
+        session.last_seen = time.monotonic()
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def _question_payload(self, session):
+        flow = session.flow
+        answered, applicable = flow.progress()
+        if flow.done:
+            return {'done': True, 'answered': answered}
+
+        question = flow.question
+        category = flow.category
+        payload = {
+            'done': False,
+            'key': question['key'],
+            'text': question['text'],
+            'type': question['type'],
+            'category': category['key'],
+            'category_name': category['name'],
+            'category_number': category['number'],
+            'total_categories': flow.total_categories,
+            'answered': answered,
+            'applicable': applicable,
+        }
+        if question['type'] == 'choice':
+            payload['allow_custom'] = question['allow_custom']
+            payload['options'] = [
+                {'number': number, 'key': option['key'], 'label': option['label'], 'hint': option['hint']}
+                for number, option in enumerate(flow.options, 1)
+            ]
+        return payload
+
+    def start_session(self, body):
+        edition = body.get('edition', 'simple')
+        if not isinstance(edition, str) or edition not in load_catalog()['editions']:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, f"unknown edition {edition!r}")
+        for field in ('home', 'system'):
+            if body.get(field) is not None and not isinstance(body[field], str):
+                raise ServiceError(HTTPStatus.BAD_REQUEST, f"'{field}' must be a string")
+        if len(self.sessions) >= self.max_sessions:
+            self.evict_idle()
+            if len(self.sessions) >= self.max_sessions:
+                raise ServiceError(HTTPStatus.SERVICE_UNAVAILABLE, "too many active sessions")
+
+        platform_info = get_user_platform_info(home=body.get('home'), system=body.get('system'))
+        session = Session(secrets.token_urlsafe(12), edition, platform_info)
+        self.sessions[session.id] = session
+        return {'session': session.id, 'edition': edition, 'question': self._question_payload(session)}
+
+    def answer(self, session, body):
+        flow = session.flow
+        if flow.done:
+            raise ServiceError(HTTPStatus.CONFLICT, "all questions are already answered")
+        question_key = flow.question['key']
+        if 'question' in body and body['question'] != question_key:
+            raise ServiceError(HTTPStatus.CONFLICT, f"expected an answer for '{question_key}'")
+        try:
+            value = flow.answer(body.get('answer'))
+        except ValueError as e:
+            raise ServiceError(HTTPStatus.BAD_REQUEST, str(e))
+        return {'accepted': {'question': question_key, 'value': value},
+                'question': self._question_payload(session)}
+
+    def render(self, session):
+        flow = session.flow
+        if not flow.done:
+            raise ServiceError(HTTPStatus.CONFLICT, "session has unanswered questions")
+        return self.render_cache.render(flow.preferences(), flow.platform_info,
+                                        "(rendered by the Goose Hints service)", flow.edition)
+
+    def handle(self, method, path, body):
+        """Route one request; returns (status, payload) where payload is a dict or text"""
+        parts = [part for part in path.split('?', 1)[0].split('/') if part]
+
+        if parts == ['health'] and method == 'GET':
+            return HTTPStatus.OK, {'sessions': len(self.sessions), 'evicted': self.evicted,
+                                   'render_cache': self.render_cache.stats()}
+        if parts == ['sessions'] and method == 'POST':
+            return HTTPStatus.CREATED, self.start_session(body)
+        if len(parts) >= 2 and parts[0] == 'sessions':
+            if len(parts) == 2 and method == 'DELETE':
+                self._session(parts[1])
+                del self.sessions[parts[1]]
+                return HTTPStatus.OK, {'deleted': parts[1]}
+            if len(parts) == 3:
+                session = self._session(parts[1])
+                if parts[2] == 'question' and method == 'GET':
+                    return HTTPStatus.OK, self._question_payload(session)
+                if parts[2] == 'answer' and method == 'POST':
+                    return HTTPStatus.OK, self.answer(session, body)
+                if parts[2] == 'render' and method == 'GET':
+                    return HTTPStatus.OK, self.render(session)
+        raise ServiceError(HTTPStatus.NOT_FOUND, f"no route for {method} {path}")
+
+async def _read_request(reader):
+    """Parse one HTTP/1.1 request; returns None on a cleanly closed connection"""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    lines = head.decode('latin-1').split("\r\n")
+    try:
+        method, target, version = lines[0].split(' ', 2)
+    except ValueError:
+        raise ServiceError(HTTPStatus.BAD_REQUEST, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if ':' in line:
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get('content-length') or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise ServiceError(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise ServiceError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "request body too large")
+    raw_body = await reader.readexactly(length) if length else b''
+    keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+    return method.upper(), target, raw_body, keep_alive
+
+def _response(status, payload, keep_alive):
+    if isinstance(payload, str):
+        body = payload.encode('utf-8')
+        content_type = 'text/plain; charset=utf-8'
+    else:
+        body = json.dumps(payload).encode('utf-8')
+        content_type = 'application/json'
+    head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode('latin-1') + body
+
+async def _handle_connection(service, reader, writer):
+    try:
+        while True:
+            keep_alive = False
+            try:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, target, raw_body, keep_alive = request
+                try:
+                    body = json.loads(raw_body) if raw_body else {}
+                except ValueError:
+                    raise ServiceError(HTTPStatus.BAD_REQUEST, "request body must be JSON")
+                if not isinstance(body, dict):
+                    raise ServiceError(HTTPStatus.BAD_REQUEST, "request body must be a JSON object")
+                status, payload = service.handle(method, target, body)
+            except ServiceError as e:
+                status, payload = e.status, {'error': str(e)}
+            except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                raise
+            except Exception:
+                # A bug behind the router: answer the client and keep serving
+                traceback.print_exc()
+                status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': "internal server error"}
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        pass
+    finally:
+        writer.close()
+
+async def _evict_periodically(service, interval):
+    while True:
+        await asyncio.sleep(interval)
+        service.evict_idle()
+
+async def serve(host='127.0.0.1', port=8765, idle_timeout=DEFAULT_IDLE_TIMEOUT, max_sessions=DEFAULT_MAX_SESSIONS,
+                ready=None, render_cache=None):
+    """Run the service until cancelled"""
+    service = HintsService(idle_timeout, max_sessions, render_cache)
+    server = await asyncio.start_server(lambda r, w: _handle_connection(service, r, w), host, port,
+                                        backlog=1024)
+    evictor = asyncio.ensure_future(_evict_periodically(service, max(1.0, min(60.0, idle_timeout / 4))))
+    if ready is not None:
+        ready(server)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        evictor.cancel()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the Goose Hints question flow over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="Seconds of inactivity before a session is evicted")
+    parser.add_argument('--max-sessions', type=int, default=DEFAULT_MAX_SESSIONS)
+    parser.add_argument('--render-cache', metavar='DIR', help="Keep rendered templates in this directory too")
+    parser.add_argument('--render-cache-mb', type=float, default=DEFAULT_MAX_BYTES / 2 ** 20,
+                        help="Memory for rendered templates")
+    args = parser.parse_args(argv)
+
+    load_catalog()
+    print(f"🦆 Goose Hints service listening on http://{args.host}:{args.port}")
+    try:
+        render_cache = RenderCache(int(args.render_cache_mb * 2 ** 20), args.render_cache)
+        asyncio.run(serve(args.host, args.port, args.idle_timeout, args.max_sessions, render_cache=render_cache))
+    except KeyboardInterrupt:
+        print("\n👋 Goose Hints service stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Saved Preferences
+Persists the structured preferences from each run as machine-readable state
+in ~/goose_hints, together with a fingerprint of every catalog category, so
+an update run only asks about the categories the user picks or the ones that
+were added or changed in the catalog since the last run.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from goose_hints_render import iter_category_lines
+from goose_hints_storage import atomic_write
+from goose_hints_transcript import ask_user
+
+STATE_VERSION = 1
+
+# The catalog is imported where it is used so that loading saved preferences
+# (goose_hints_cli.py render) does not pay for compiling or unpickling it
+
+def state_path(platform_info, edition):
+    """Location of the saved preferences for an edition"""
+    return Path(platform_info['home']) / "goose_hints" / f"{edition}_preferences.json"
+
+def save_state(preferences, platform_info, edition):
+    """Atomically save preferences with the catalog fingerprints they were answered against"""
+    from goose_hints_catalog import load_catalog
+    catalog = load_catalog()
+    path = state_path(platform_info, edition)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    state = {
+        'version': STATE_VERSION,
+        'edition': edition,
+        'saved_at': datetime.now().isoformat(timespec='seconds'),
+        'catalog_hash': catalog['hash'],
+        'fingerprints': {category: catalog['categories'][(edition, category)]['fingerprint']
+                         for category in preferences if (edition, category) in catalog['categories']},
+        'preferences': preferences,
+    }
+    atomic_write(path, json.dumps(state, indent=2, ensure_ascii=False) + "\n")
+    return path
+
+def load_state(platform_info, edition):
+    """Load saved state for an edition, or None if there is none usable"""
+    path = state_path(platform_info, edition)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get('version') != STATE_VERSION or state.get('edition') != edition:
+        return None
+    return state
+
+def stale_categories(state, edition):
+    """Catalog categories that are new, unanswered or changed since the state was saved"""
+    from goose_hints_catalog import load_catalog
+    catalog = load_catalog()
+    stale = []
+    for category in catalog['editions'][edition]['categories']:
+        answered = state['preferences'].get(category) is not None
+        fingerprint = state.get('fingerprints', {}).get(category)
+        if not answered or fingerprint != catalog['categories'][(edition, category)]['fingerprint']:
+            stale.append(category)
+    return stale
+
+def choose_categories_to_update(state, edition):
+    """Show saved answers and ask which categories to revisit
+
+    Categories added or changed in the catalog since the last run are always
+    included. Returns category keys in catalog order.
+    """
+    from goose_hints_catalog import load_catalog
+    catalog = load_catalog()
+    categories = catalog['editions'][edition]['categories']
+    stale = set(stale_categories(state, edition))
+
+    print(f"\n📂 **Your saved preferences** (from {state.get('saved_at', 'an earlier run')})")
+    for number, category in enumerate(categories, 1):
+        name = catalog['categories'][(edition, category)]['name']
+        marker = "  🆕 new or changed - will be asked" if category in stale else ""
+        print(f"\n  {number}. {name}{marker}")
+        for line in iter_category_lines(state['preferences'].get(category)):
+            print(f"     {line.rstrip()}")
+
+    while True:
+        response = ask_user("\n👤 Which categories would you like to change? (e.g. 1,3 or 'none'): ").strip().lower()
+        if response in ['none', 'no', '']:
+            picked = set()
+            break
+        try:
+            numbers = {int(part) for part in response.replace(' ', '').split(',') if part}
+        except ValueError:
+            print("Please enter category numbers separated by commas, or 'none'")
+            continue
+        if all(1 <= number <= len(categories) for number in numbers):
+            picked = {categories[number - 1] for number in numbers}
+            break
+        print(f"Please choose numbers between 1 and {len(categories)}")
+
+    return [category for category in categories if category in picked or category in stale]
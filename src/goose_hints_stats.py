@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Answer Statistics
+Precomputes a compact table from earlier answer sets: how much each choice
+question tells us about every other one (mutual information, in bits) and,
+for each answer, which other answers it predicts and how often it was right.
+With the table the question engine asks the most informative question next
+and pre-fills answers that are predictable enough for the user to accept or
+override in bulk. Lookups are plain dict reads, so choosing the next question
+takes microseconds.
+
+    python src/goose_hints_stats.py build --edition comprehensive answers.jsonl
+    python src/goose_hints_stats.py build --edition simple --from-store
+    python src/goose_hints_stats.py show --edition comprehensive
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from datetime import datetime
+from math import log2
+from pathlib import Path
+
+from goose_hints_catalog import iter_questions, load_catalog
+from goose_hints_flow import resolve_answer
+from goose_hints_platform import get_user_platform_info
+from goose_hints_storage import atomic_write
+
+STATS_VERSION = 1
+
+# A prediction pre-fills an answer at this probability or above
+DEFAULT_CONFIDENCE = 0.8
+# Answers seen fewer times than this predict nothing
+DEFAULT_MIN_SUPPORT = 5
+# Predictions weaker than this are left out of the table altogether
+STORED_CONFIDENCE = 0.5
+
+def stats_path(platform_info, edition):
+    """Location of the answer statistics table for an edition"""
+    return Path(platform_info['home']) / "goose_hints" / f"{edition}_answer_stats.json"
+
+def answer_keys(edition, record, platform_info):
+    """{question key: option key} for the choice answers in a raw answer record
+
+    Answers that do not resolve against the catalog are skipped.
+    """
+    keys = {}
+    for question in iter_questions(edition):
+        if question['type'] != 'choice' or question['key'] not in record:
+            continue
+        try:
+            keys[question['key']] = resolve_answer(edition, question, record[question['key']], platform_info)['key']
+        except ValueError:
+            continue
+    return keys
+
+def store_answer_keys(choices):
+    """{question key: option key} from a hints store 'choices' entry ('category.question' paths)"""
+    return {path.rsplit('.', 1)[-1]: key for path, key in choices.items()}
+
+def compute_stats(edition, answer_sets, min_support=DEFAULT_MIN_SUPPORT):
+    """Build the statistics table from an iterable of {question key: option key} dicts"""
+    questions = [question['key'] for question in iter_questions(edition) if question['type'] == 'choice']
+    joint = {}
+    sessions = 0
+    for keys in answer_sets:
+        sessions += 1
+        present = [(question, keys[question]) for question in questions if question in keys]
+        for i, (a, x) in enumerate(present):
+            for b, y in present[i + 1:]:
+                joint.setdefault((a, b), Counter())[(x, y)] += 1
+
+    information = {}
+    predictions = {}
+
+    def add_predictions(given, target, pairs, totals):
+        # For each answer to `given`, the most common answer to `target` alongside it
+        best = {}
+        for (x, y), count in pairs.items():
+            if y != 'custom_preference' and count > best.get(x, (None, 0))[1]:
+                best[x] = (y, count)
+        for x, (y, count) in best.items():
+            probability = count / totals[x]
+            if totals[x] >= min_support and probability >= STORED_CONFIDENCE:
+                predictions.setdefault(f"{given}={x}", []).append([target, y, round(probability, 3)])
+
+    for (a, b), counts in joint.items():
+        total = sum(counts.values())
+        rows, columns = Counter(), Counter()
+        for (x, y), count in counts.items():
+            rows[x] += count
+            columns[y] += count
+        mutual_information = sum(count / total * log2(count * total / (rows[x] * columns[y]))
+                                 for (x, y), count in counts.items())
+        if mutual_information > 1e-9:
+            information.setdefault(a, {})[b] = information.setdefault(b, {})[a] = round(mutual_information, 4)
+        add_predictions(a, b, counts, rows)
+        add_predictions(b, a, Counter({(y, x): count for (x, y), count in counts.items()}), columns)
+
+    return {
+        'stats': STATS_VERSION,
+        'edition': edition,
+        'catalog_hash': load_catalog()['hash'],
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+        'sessions': sessions,
+        'min_support': min_support,
+        'information': information,
+        'predictions': predictions,
+    }
+
+class AnswerStats:
+    """Loaded statistics table with the lookups the question engine needs"""
+
+    __slots__ = ('edition', 'sessions', 'confidence', 'information', 'predicts')
+
+    def __init__(self, table, confidence=DEFAULT_CONFIDENCE):
+        self.edition = table['edition']
+        self.sessions = table['sessions']
+        self.confidence = confidence
+        self.information = table['information']
+        self.predicts = {tuple(key.split('=', 1)): tuple((target, option_key, probability)
+                                                        for target, option_key, probability in entries)
+                         for key, entries in table['predictions'].items()}
+
+    def predict(self, answers, candidates):
+        """{question key: (option key, probability)} for candidates predictable from the answers so far"""
+        best = {}
+        for question_key, value in answers.items():
+            if not isinstance(value, dict):
+                continue
+            for target, option_key, probability in self.predicts.get((question_key, value.get('key')), ()):
+                if target in candidates and probability >= self.confidence \
+                        and probability > best.get(target, (None, 0.0))[1]:
+                    best[target] = (option_key, probability)
+        return best
+
+    def information_gain(self, question_key, others):
+        """Bits an answer to question_key is expected to reveal about the other questions"""
+        row = self.information.get(question_key, {})
+        return sum(row.get(other, 0.0) for other in others if other != question_key)
+
+    def most_informative(self, questions):
+        """The question with the highest expected information gain (catalog order breaks ties)"""
+        keys = [question['key'] for question in questions]
+        return max(questions, key=lambda question: self.information_gain(question['key'], keys))
+
+def save_stats(table, platform_info):
+    path = stats_path(platform_info, table['edition'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, json.dumps(table, separators=(',', ':'), sort_keys=True) + "\n")
+    return path
+
+def load_stats_table(platform_info, edition):
+    """The raw statistics table for an edition, or None if no usable table has been built"""
+    try:
+        with open(stats_path(platform_info, edition), 'r', encoding='utf-8') as f:
+            table = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(table, dict) or table.get('stats') != STATS_VERSION or table.get('edition') != edition:
+        return None
+    return table
+
+def load_stats(platform_info, edition, confidence=DEFAULT_CONFIDENCE):
+    """AnswerStats for an edition, or None if no usable table has been built"""
+    table = load_stats_table(platform_info, edition)
+    return AnswerStats(table, confidence) if table is not None else None
+
+def iter_file_answer_sets(edition, paths, platform_info):
+    """Answer sets from JSONL or CSV answer files in the batch-mode format"""
+    from goose_hints_batch import iter_records
+    for path in paths:
+        for _, record in iter_records(path):
+            if isinstance(record, dict):
+                yield answer_keys(edition, record.get('answers', record), platform_info)
+
+def print_stats(stats):
+    print(f"📊 {stats.edition} answer statistics from {stats.sessions} sessions")
+    questions = [question['key'] for question in iter_questions(stats.edition)]
+    print("\nMost informative questions:")
+    for question_key in sorted(questions, key=lambda key: -stats.information_gain(key, questions))[:5]:
+        print(f"   {question_key:<26}{stats.information_gain(question_key, questions):>8.3f} bits")
+    strong = sorted(((probability, given, target, option_key)
+                     for given, entries in stats.predicts.items()
+                     for target, option_key, probability in entries if probability >= stats.confidence),
+                    reverse=True)
+    print(f"\nAnswers that pre-fill others (confidence ≥ {stats.confidence:.0%}):")
+    for probability, (question_key, option_key), target, predicted in strong[:15]:
+        print(f"   {question_key}={option_key} → {target}={predicted} ({probability:.0%})")
+    if not strong:
+        print("   none yet")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build and inspect answer statistics for adaptive question order")
+    subcommands = parser.add_subparsers(dest='command')
+    build = subcommands.add_parser('build', help="Precompute the statistics table from earlier answers")
+    build.add_argument('answers', nargs='*', help="JSONL or CSV answer files (batch-mode format)")
+    build.add_argument('--edition', default='comprehensive', choices=['simple', 'comprehensive'])
+    build.add_argument('--from-store', action='store_true', help="Also use every hints file in ~/goose_hints")
+    build.add_argument('--min-support', type=int, default=DEFAULT_MIN_SUPPORT)
+    show = subcommands.add_parser('show', help="Print the most informative questions and strongest predictions")
+    show.add_argument('--edition', default='comprehensive', choices=['simple', 'comprehensive'])
+    show.add_argument('--confidence', type=float, default=DEFAULT_CONFIDENCE)
+    args = parser.parse_args(argv)
+    platform_info = get_user_platform_info()
+
+    if args.command == 'show':
+        stats = load_stats(platform_info, args.edition, args.confidence)
+        if stats is None:
+            print(f"No {args.edition} answer statistics yet - run the build command first", file=sys.stderr)
+            return 1
+        print_stats(stats)
+        return 0
+    if args.command != 'build':
+        parser.print_help()
+        return 0
+
+    answer_sets = list(iter_file_answer_sets(args.edition, args.answers, platform_info))
+    if args.from_store:
+        from goose_hints_store import open_store
+        with open_store(platform_info) as store:
+            answer_sets.extend(store_answer_keys(entry['choices']) for entry in store.history(args.edition))
+    if not answer_sets:
+        print("No answer sets to learn from", file=sys.stderr)
+        return 1
+    path = save_stats(compute_stats(args.edition, answer_sets, args.min_support), platform_info)
+    print(f"✅ Built {args.edition} answer statistics from {len(answer_sets)} sessions: {path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
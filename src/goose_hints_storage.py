@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Hints Storage
+Content-addressed, atomic writes for generated hints files. Each file name
+carries a hash of the canonical preference content, so re-running with the
+same answers reuses the existing file instead of writing a new one, and every
+write goes through a temporary file followed by an atomic rename. Files
+shared with other processes are merged under an advisory file lock.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from goose_hints_render import write_hints
+
+# File name prefix used by each edition inside ~/goose_hints
+FILE_PREFIXES = {
+    "simple": "universal_goose_hints",
+    "comprehensive": "comprehensive_goose_hints",
+}
+
+# Number of hex digits of the content hash kept in file names
+DIGEST_LENGTH = 12
+
+# The umask can only be read by setting it, so it is read once at import,
+# before any writer threads exist
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+def preferences_hash(preferences, platform_info, edition):
+    """Hash everything that shapes the hints content except timestamp and path"""
+    canonical = json.dumps({
+        'edition': edition,
+        'system': platform_info['system'],
+        'home': str(platform_info['home']),
+        'preferences': preferences,
+    }, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def hints_filename(edition, digest, generated_at=None):
+    """File name for a hints file: <prefix>_<timestamp>_<digest>.txt"""
+    generated_at = generated_at or datetime.now()
+    return f"{FILE_PREFIXES[edition]}_{generated_at.strftime('%Y%m%d_%H%M%S')}_{digest[:DIGEST_LENGTH]}.txt"
+
+def find_existing_hints(output_dir, edition, digest):
+    """Return an existing hints file with the same content hash, or None"""
+    pattern = f"{FILE_PREFIXES[edition]}_*_{digest[:DIGEST_LENGTH]}.txt"
+    for path in Path(output_dir).glob(pattern):
+        if path.is_file():
+            return path
+    return None
+
+def atomic_write(path, content, fsync=False):
+    """Write text to path via a temporary file and rename
+
+    content is either a string or a callable that writes into the open file.
+    The file keeps the mode of the one it replaces, and a new file gets the
+    mode open() would give it (the temporary file is private). With fsync=True the data (and on POSIX the directory entry) is flushed to
+    disk before returning, so a crash never leaves a partial file behind.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            if callable(content):
+                content(f)
+            else:
+                f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(str(path)).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(str(path.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+@contextmanager
+def file_lock(path, timeout=10.0):
+    """Hold an advisory lock on path (via a '<name>.lock' file next to it)
+
+    Every writer that takes the lock sees the others' changes before merging
+    its own. Raises TimeoutError if the lock is still held after timeout seconds.
+    """
+    lock_path = Path(path).with_name(Path(path).name + '.lock')
+    deadline = time.monotonic() + timeout
+    with open(lock_path, 'a+b') as f:
+        while True:
+            try:
+                if os.name == 'nt':
+                    import msvcrt
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{path} is locked by another process")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            if os.name == 'nt':
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def save_hints(preferences, platform_info, edition, output_dir=None, generated_at=None, fsync=False,
+               store=None, cache=None):
+    """Write the hints file unless identical preferences were already saved
+
+    Returns (path, written) where written is False when an existing file with
+    the same content hash was reused. When a HintsStore is given, the file is
+    looked up and recorded in its index and the retention policy is applied.
+    With a RenderCache the text comes from its template for these preferences.
+    """
+    output_dir = Path(output_dir) if output_dir else Path(platform_info['home']) / "goose_hints"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    digest = preferences_hash(preferences, platform_info, edition)
+    if store is not None:
+        entry = store.find_by_hash(edition, digest)
+        if entry is not None and Path(entry['path']).is_file():
+            store.mark_latest(entry['path'])
+            return Path(entry['path']), False
+
+    existing = find_existing_hints(output_dir, edition, digest)
+    if existing is not None:
+        if store is not None:
+            store.record(existing, edition, platform_info['system'], digest, preferences)
+        return existing, False
+
+    generated_at = generated_at or datetime.now()
+    filename = output_dir / hints_filename(edition, digest, generated_at)
+    if cache is not None:
+        content = cache.render(preferences, platform_info, filename, edition, generated_at)
+    else:
+        def content(f):
+            write_hints(f, preferences, platform_info, filename, edition, generated_at)
+    atomic_write(filename, content, fsync=fsync)
+    if store is not None:
+        store.record(filename, edition, platform_info['system'], digest, preferences, generated_at)
+        store.apply_retention()
+    return filename, True
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Hints Store
+Small SQLite index kept next to the hints files in ~/goose_hints. Every
+generated file is recorded with its edition, platform, timestamp, content hash
+and chosen option keys, so "latest for this edition" is a single primary-key
+lookup and old files can be pruned by a retention policy.
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from goose_hints_storage import FILE_PREFIXES
+
+INDEX_FILENAME = "index.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    edition TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    created_ts REAL NOT NULL,
+    content_hash TEXT NOT NULL,
+    choices TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS hints_edition_created ON hints (edition, created_ts);
+CREATE INDEX IF NOT EXISTS hints_edition_hash ON hints (edition, content_hash);
+CREATE TABLE IF NOT EXISTS latest (
+    edition TEXT PRIMARY KEY,
+    hints_id INTEGER NOT NULL REFERENCES hints (id)
+);
+CREATE TABLE IF NOT EXISTS settings (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Matches <prefix>_<YYYYmmdd>_<HHMMSS>[_<digest>].txt
+FILENAME_PATTERN = re.compile(r'^(?P<prefix>.+)_(?P<stamp>\d{8}_\d{6})(?:_(?P<digest>[0-9a-f]+))?\.txt$')
+
+def choice_keys(preferences, prefix=''):
+    """Flatten preferences into {'category' or 'category.question': option key}"""
+    keys = {}
+    for name, value in preferences.items():
+        if not isinstance(value, dict):
+            continue
+        path = f"{prefix}{name}"
+        if 'hint' in value:
+            keys[path] = value.get('key', 'custom_preference')
+        else:
+            keys.update(choice_keys(value, f"{path}."))
+    return keys
+
+class HintsStore:
+    """SQLite-backed index of generated hints files in one directory"""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.directory / INDEX_FILENAME), timeout=10)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def record(self, path, edition, platform_name, content_hash, preferences=None, created_at=None):
+        """Add (or refresh) a hints file and make it the latest for its edition"""
+        created_at = created_at or datetime.now()
+        choices = json.dumps(choice_keys(preferences or {}), sort_keys=True)
+        with self.connection:
+            updated = self.connection.execute(
+                "UPDATE hints SET content_hash = ?, choices = ? WHERE path = ?",
+                (content_hash, choices, str(path)))
+            if updated.rowcount == 0:
+                self.connection.execute(
+                    "INSERT INTO hints (path, edition, platform, created_at, created_ts, content_hash, choices) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (str(path), edition, platform_name, created_at.isoformat(timespec='seconds'),
+                     created_at.timestamp(), content_hash, choices))
+            hints_id = self.connection.execute("SELECT id FROM hints WHERE path = ?", (str(path),)).fetchone()[0]
+            self.connection.execute("INSERT OR REPLACE INTO latest (edition, hints_id) VALUES (?, ?)",
+                                    (edition, hints_id))
+        return hints_id
+
+    def mark_latest(self, path):
+        """Make an already indexed file the latest for its edition"""
+        with self.connection:
+            row = self.connection.execute("SELECT id, edition FROM hints WHERE path = ?", (str(path),)).fetchone()
+            if row is None:
+                return False
+            self.connection.execute("INSERT OR REPLACE INTO latest (edition, hints_id) VALUES (?, ?)",
+                                    (row['edition'], row['id']))
+        return True
+
+    def latest(self, edition):
+        """Latest hints entry for an edition as a dict, or None"""
+        row = self.connection.execute(
+            "SELECT hints.* FROM latest JOIN hints ON hints.id = latest.hints_id WHERE latest.edition = ?",
+            (edition,)).fetchone()
+        return _entry(row)
+
+    def find_by_hash(self, edition, content_hash):
+        """Indexed entry with this content hash, or None"""
+        row = self.connection.execute(
+            "SELECT * FROM hints WHERE edition = ? AND content_hash = ? ORDER BY created_ts DESC LIMIT 1",
+            (edition, content_hash)).fetchone()
+        return _entry(row)
+
+    def history(self, edition=None, limit=None):
+        """Indexed entries, newest first"""
+        query = "SELECT * FROM hints"
+        params = []
+        if edition:
+            query += " WHERE edition = ?"
+            params.append(edition)
+        query += " ORDER BY created_ts DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [_entry(row) for row in self.connection.execute(query, params)]
+
+    def iter_choices(self, edition, latest_only=False):
+        """Stream (platform, choices) for an edition's indexed files without loading them all
+
+        latest_only limits it to the edition's latest file (one profile per store).
+        """
+        if latest_only:
+            query = ("SELECT hints.platform, hints.choices FROM latest JOIN hints ON hints.id = latest.hints_id "
+                     "WHERE latest.edition = ?")
+        else:
+            query = "SELECT platform, choices FROM hints WHERE edition = ?"
+        for platform_name, choices in self.connection.execute(query, (edition,)):
+            yield platform_name, json.loads(choices)
+
+    def get_retention(self):
+        """Stored retention policy as (keep, max_age_days); None means unlimited"""
+        settings = dict(self.connection.execute("SELECT name, value FROM settings").fetchall())
+        keep = settings.get('retention_keep')
+        max_age = settings.get('retention_max_age_days')
+        return (int(keep) if keep is not None else None, float(max_age) if max_age is not None else None)
+
+    def set_retention(self, keep=None, max_age_days=None):
+        """Update the retention policy applied after every save
+
+        Only the settings given are changed; keep=0 keeps only the latest file
+        and max_age_days=0 removes every other file once it is saved.
+        """
+        if keep is not None and keep < 0:
+            raise ValueError(f"keep must be 0 or more, not {keep}")
+        if max_age_days is not None and max_age_days < 0:
+            raise ValueError(f"max age must be 0 days or more, not {max_age_days}")
+        settings = [(name, str(value)) for name, value in (('retention_keep', keep),
+                                                            ('retention_max_age_days', max_age_days))
+                    if value is not None]
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO settings (name, value) VALUES (?, ?)", settings)
+
+    def apply_retention(self, keep=None, max_age_days=None):
+        """Delete files beyond the newest `keep` per edition or older than max_age_days
+
+        Defaults to the stored policy. The latest file of each edition is never
+        removed. Returns the paths that were deleted.
+        """
+        if keep is None and max_age_days is None:
+            keep, max_age_days = self.get_retention()
+        if keep is None and max_age_days is None:
+            return []
+
+        latest_ids = {row[0] for row in self.connection.execute("SELECT hints_id FROM latest")}
+        cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+        doomed = []
+        editions = [row[0] for row in self.connection.execute("SELECT DISTINCT edition FROM hints")]
+        for edition in editions:
+            rows = self.connection.execute(
+                "SELECT id, path, created_ts FROM hints WHERE edition = ? ORDER BY created_ts DESC, id DESC",
+                (edition,)).fetchall()
+            for position, row in enumerate(rows):
+                if row['id'] in latest_ids:
+                    continue
+                too_many = keep is not None and position >= keep
+                too_old = cutoff is not None and row['created_ts'] < cutoff
+                if too_many or too_old:
+                    doomed.append((row['id'], row['path']))
+
+        removed = []
+        for hints_id, path in doomed:
+            try:
+                Path(path).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Keep the row so the file is retried next time
+                continue
+            removed.append(path)
+            with self.connection:
+                self.connection.execute("DELETE FROM hints WHERE id = ?", (hints_id,))
+        return removed
+
+    def reindex(self):
+        """Import hints files already in the directory that are not yet indexed
+
+        The answers are recovered from each file's text, so old files show up
+        in choice-based queries too.
+        """
+        from goose_hints_parse import parse_hints, result_hash
+        editions = {prefix: edition for edition, prefix in FILE_PREFIXES.items()}
+        known = {row[0] for row in self.connection.execute("SELECT path FROM hints")}
+        added = 0
+        for path in sorted(self.directory.glob('*_goose_hints_*.txt')):
+            match = FILENAME_PATTERN.match(path.name)
+            if str(path) in known or not match or match.group('prefix') not in editions:
+                continue
+            content = path.read_bytes()
+            platform_match = re.search(rb'^# Platform: (.+)$', content, re.MULTILINE)
+            platform_name = platform_match.group(1).decode('utf-8').strip() if platform_match else 'unknown'
+            edition = editions[match.group('prefix')]
+            created_at = datetime.strptime(match.group('stamp'), '%Y%m%d_%H%M%S')
+            try:
+                result = parse_hints(content.decode('utf-8', 'replace').splitlines(), path, edition)
+                preferences, content_hash = result['preferences'], result_hash(result)
+            except ValueError:
+                # Not recoverable, so never matched by find_by_hash()
+                preferences, content_hash = None, ''
+            latest = self.latest(edition)
+            self.record(path, edition, platform_name, content_hash, preferences, created_at)
+            if latest and latest['created_ts'] > created_at.timestamp():
+                self.mark_latest(latest['path'])
+            added += 1
+        return added
+
+def _entry(row):
+    if row is None:
+        return None
+    entry = dict(row)
+    entry['choices'] = json.loads(entry['choices'])
+    return entry
+
+def open_store(platform_info):
+    """Open the index in the user's ~/goose_hints directory"""
+    return HintsStore(Path(platform_info['home']) / "goose_hints")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query and maintain the ~/goose_hints index")
+    parser.add_argument('--dir', default=str(Path.home() / "goose_hints"), help="Hints directory")
+    subcommands = parser.add_subparsers(dest='command')
+    latest = subcommands.add_parser('latest', help="Print the latest hints file for an edition")
+    latest.add_argument('--edition', default='simple', choices=sorted(FILE_PREFIXES))
+    history = subcommands.add_parser('history', help="List indexed hints files, newest first")
+    history.add_argument('--edition', choices=sorted(FILE_PREFIXES))
+    history.add_argument('--limit', type=int)
+    retention = subcommands.add_parser('retention', help="Set and apply the retention policy")
+    retention.add_argument('--keep', type=int, help="Keep the newest N files per edition")
+    retention.add_argument('--max-age-days', type=float, help="Remove files older than D days")
+    subcommands.add_parser('reindex', help="Index hints files created before the index existed")
+    args = parser.parse_args(argv)
+
+    with HintsStore(args.dir) as store:
+        if args.command == 'latest':
+            entry = store.latest(args.edition)
+            if entry is None:
+                print(f"No {args.edition} hints indexed in {args.dir}", file=sys.stderr)
+                return 1
+            print(entry['path'])
+        elif args.command == 'history':
+            for entry in store.history(args.edition, args.limit):
+                print(f"{entry['created_at']}  {entry['edition']:<13} {entry['content_hash'][:12]}  {entry['path']}")
+        elif args.command == 'retention':
+            if args.keep is not None or args.max_age_days is not None:
+                try:
+                    store.set_retention(args.keep, args.max_age_days)
+                except ValueError as e:
+                    print(f"❌ {e}", file=sys.stderr)
+                    return 1
+            keep, max_age_days = store.get_retention()
+            removed = store.apply_retention()
+            print(f"✅ Retention: keep={'all' if keep is None else keep}, max age={'unlimited' if max_age_days is None else max_age_days} days")
+            print(f"🗑️  Removed {len(removed)} old hints files")
+        elif args.command == 'reindex':
+            print(f"✅ Indexed {store.reindex()} existing hints files")
+        else:
+            parser.print_help()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
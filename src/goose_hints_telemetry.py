@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Question Telemetry
+Structured timing events from the terminal question flow: question shown,
+'explain' requested, invalid input, custom preference started, confirmed or
+retried, answer accepted. Every response splits into think time (the prompt
+waiting for the user) and tool time (the engine and the view working), both
+from monotonic clocks, and each accepted answer carries the totals for its
+question.
+
+Events go to the exporter that is active - a JSONL file or an in-memory ring
+buffer, or anything with export(event) and close(). With none active the
+question loop only checks for None, so telemetry costs nothing when off.
+
+    python src/goose_hints_builder_simple.py --telemetry events.jsonl
+    python src/goose_hints_telemetry.py report events.jsonl [more.jsonl ...]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from collections import deque
+
+# Event names
+QUESTION_SHOWN = 'question_shown'
+EXPLAIN_REQUESTED = 'explain_requested'
+INVALID_INPUT = 'invalid_input'
+CUSTOM_STARTED = 'custom_started'
+CUSTOM_CONFIRM = 'custom_confirm'
+CUSTOM_RETRY = 'custom_retry'
+ANSWER_ACCEPTED = 'answer_accepted'
+PREFILL_REVIEWED = 'prefill_reviewed'
+
+# Engine outcome kind -> event name
+OUTCOME_EVENTS = {
+    'explain': EXPLAIN_REQUESTED,
+    'invalid': INVALID_INPUT,
+    'custom': CUSTOM_STARTED,
+    'confirm': CUSTOM_CONFIRM,
+    'retry': CUSTOM_RETRY,
+    'accepted': ANSWER_ACCEPTED,
+    'prefilled': PREFILL_REVIEWED,
+}
+RETRY_EVENTS = (INVALID_INPUT, CUSTOM_RETRY)
+
+# Exporter receiving events from the running session, if any
+_exporter = None
+
+class JsonlExporter:
+    """Appends one JSON line per event to a file, flushed as it is written"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def export(self, event):
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(json.dumps(event, separators=(',', ':')) + "\n")
+        # Flushed per event so a crashed session keeps what it recorded
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+
+class RingBufferExporter:
+    """Keeps the most recent events in memory"""
+
+    def __init__(self, capacity=10000):
+        self._events = deque(maxlen=capacity)
+
+    def export(self, event):
+        self._events.append(event)
+
+    @property
+    def events(self):
+        return list(self._events)
+
+    def close(self):
+        pass
+
+@contextlib.contextmanager
+def exporting(exporter):
+    """Send the telemetry of every session inside the block to exporter"""
+    global _exporter
+    previous, _exporter = _exporter, exporter
+    try:
+        yield exporter
+    finally:
+        _exporter = previous
+        exporter.close()
+
+class QuestionTracker:
+    """Times one session's responses and emits its events
+
+    The question loop calls waiting() just before prompting, answered() when
+    input arrives and outcome() once the response has been handled; time
+    between them is attributed to the user or the tool accordingly.
+    """
+
+    __slots__ = ('exporter', 'edition', 'session_id', 'current', '_mark', '_step_tool', '_step_think',
+                 '_think', '_tool', '_responses', '_retries')
+
+    def __init__(self, exporter, edition):
+        self.exporter = exporter
+        self.edition = edition
+        self.session_id = os.urandom(6).hex()
+        self.current = None
+        self._mark = time.perf_counter()
+        # The current response's split, and the current question's totals
+        self._step_tool = self._step_think = 0.0
+        self._think = self._tool = 0.0
+        self._responses = self._retries = 0
+
+    def _emit(self, name, question, **fields):
+        event = {'event': name, 'ts': round(time.monotonic(), 6), 'session': self.session_id,
+                 'edition': self.edition, 'category': question['category'] if question else None,
+                 'question': question['key'] if question else None}
+        event.update(fields)
+        self.exporter.export(event)
+
+    def shown(self, question):
+        """The question is on screen (emitted once per question)"""
+        if question is None or question['key'] == self.current:
+            return
+        self.current = question['key']
+        self._think = self._tool = 0.0
+        self._responses = self._retries = 0
+        self._emit(QUESTION_SHOWN, question)
+
+    def waiting(self):
+        now = time.perf_counter()
+        self._tool += now - self._mark
+        self._step_tool, self._mark = now - self._mark, now
+
+    def answered(self):
+        now = time.perf_counter()
+        self._step_think, self._mark = now - self._mark, now
+        self._think += self._step_think
+
+    def outcome(self, question, kind, value=None):
+        now = time.perf_counter()
+        step_tool = self._step_tool + (now - self._mark)
+        self._tool += now - self._mark
+        self._mark = now
+        name = OUTCOME_EVENTS.get(kind, kind)
+        self._responses += 1
+        if name in RETRY_EVENTS:
+            self._retries += 1
+        fields = {'think_ms': _ms(self._step_think), 'tool_ms': _ms(step_tool)}
+        if name == ANSWER_ACCEPTED:
+            fields.update(question_think_ms=_ms(self._think), question_tool_ms=_ms(self._tool),
+                          responses=self._responses, retries=self._retries,
+                          custom=isinstance(value, dict) and value.get('key') == 'custom_preference')
+            self.current = None
+        elif name == PREFILL_REVIEWED:
+            fields['accepted'] = len(value or ())
+        self._emit(name, question, **fields)
+
+def _ms(seconds):
+    return round(seconds * 1000, 3)
+
+def start_tracking(edition):
+    """A QuestionTracker for a new session, or None when no exporter is active"""
+    if _exporter is None:
+        return None
+    return QuestionTracker(_exporter, edition)
+
+def read_events(paths):
+    """Stream events from JSONL files, skipping torn or foreign lines"""
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(event, dict) and 'event' in event:
+                    yield event
+
+def summarize(events):
+    """Per-category and per-question medians and retry rates from answer_accepted events
+
+    Returns {'categories': [...], 'questions': [...], 'sessions': n,
+    'tool_ms_median': ...}, each list ranked by median time to answer.
+    Events missing the fields they are counted by (partial lines, older
+    formats) are skipped.
+    """
+    from statistics import median
+    by_category, by_question, sessions, tool = {}, {}, set(), []
+    explains = {}
+    for event in events:
+        sessions.add(event.get('session'))
+        if isinstance(event.get('tool_ms'), (int, float)):
+            tool.append(event['tool_ms'])
+        if event.get('event') == EXPLAIN_REQUESTED:
+            key = (event.get('edition'), event.get('question'))
+            explains[key] = explains.get(key, 0) + 1
+        if event.get('event') != ANSWER_ACCEPTED or event.get('question') is None:
+            continue
+        timings = event.get('question_think_ms'), event.get('question_tool_ms')
+        if not all(isinstance(value, (int, float)) for value in timings) \
+                or not isinstance(event.get('retries'), int) or 'edition' not in event or 'category' not in event:
+            continue
+        sample = (sum(timings), event['retries'], event.get('custom', False))
+        by_category.setdefault((event['edition'], event['category']), []).append(sample)
+        by_question.setdefault((event['edition'], event['question']), []).append(sample)
+
+    def rank(groups, name):
+        rows = []
+        for (edition, key), samples in groups.items():
+            rows.append({
+                'edition': edition, name: key, 'answers': len(samples),
+                'median_ms': round(median(sample[0] for sample in samples), 1),
+                'retry_rate': round(sum(1 for sample in samples if sample[1]) / len(samples), 3),
+                'custom_rate': round(sum(1 for sample in samples if sample[2]) / len(samples), 3),
+            })
+            if name == 'question':
+                rows[-1]['explains'] = explains.get((edition, key), 0)
+        return sorted(rows, key=lambda row: (-row['median_ms'], -row['retry_rate']))
+
+    return {'sessions': len(sessions - {None}), 'categories': rank(by_category, 'category'),
+            'questions': rank(by_question, 'question'),
+            'tool_ms_median': round(median(tool), 3) if tool else None}
+
+def print_report(summary, limit=10):
+    print(f"⏱️  {summary['sessions']} sessions; median tool time per response "
+          f"{summary['tool_ms_median'] if summary['tool_ms_median'] is not None else '-'} ms")
+    print("\nCategories by median time to answer a question:")
+    print(f"   {'category':<26}{'edition':<15}{'answers':>8}{'median':>10}{'retried':>9}{'custom':>8}")
+    for row in summary['categories'][:limit]:
+        print(f"   {row['category']:<26}{row['edition']:<15}{row['answers']:>8}{row['median_ms'] / 1000:>9.1f}s"
+              f"{row['retry_rate']:>9.0%}{row['custom_rate']:>8.0%}")
+    print("\nSlowest questions:")
+    for row in summary['questions'][:limit]:
+        print(f"   {row['question']:<26}{row['median_ms'] / 1000:>6.1f}s median, {row['retry_rate']:.0%} retried, "
+              f"{row['explains']} explain requests")
+    if not summary['categories']:
+        print("   no answered questions recorded")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize per-question timing telemetry")
+    subcommands = parser.add_subparsers(dest='command')
+    report = subcommands.add_parser('report', help="Rank categories by median time and retry rate")
+    report.add_argument('events', nargs='+', help="JSONL files written with --telemetry")
+    report.add_argument('--limit', type=int, default=10)
+    report.add_argument('--json', action='store_true', help="Print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    if args.command != 'report':
+        parser.print_help()
+        return 0
+    summary = summarize(read_events(args.events))
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary, args.limit)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
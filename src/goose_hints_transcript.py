@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Session Transcripts
+Every prompt the builders show goes through ask_user(). While a transcript
+is being recorded, each prompt, the answer typed (including 'explain' and
+invalid input) and the timing around it are appended to a compact JSONL
+transcript. Replaying a transcript drives the same builder functions from
+the recorded answers at full speed with no terminal attached, so slow or
+broken sessions can be reproduced exactly and real sessions reused as a
+regression and load workload.
+
+Transcript lines are JSON arrays:
+    ["s", id, text]                                         string table entry
+    ["a", gap_ms, wait_ms, source, question, prompt, answer]  answered prompt
+    ["x", gap_ms, wait_ms, source, question, prompt, error]   KeyboardInterrupt/EOFError
+    ["o", name, value]                                      observed value (see observe())
+    ["end", total_ms]
+source, question and prompt are string ids; gap_ms is the time the builder
+spent before showing the prompt and wait_ms the time the user took to answer.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from importlib import import_module
+
+TRANSCRIPT_VERSION = 1
+
+# Edition -> (module, builder function) driven by replay
+BUILDERS = {
+    'simple': ('goose_hints_builder_simple', 'universal_hints_builder'),
+    'comprehensive': ('goose_hints_builder_comprehensive', 'comprehensive_hints_builder'),
+}
+
+# Errors a prompt can end with, recorded and re-raised on replay
+INTERRUPTIONS = {'KeyboardInterrupt': KeyboardInterrupt, 'EOFError': EOFError}
+
+# Recorder or player for the running session, if any
+_active = None
+
+class TranscriptMismatch(Exception):
+    """The builder asked something other than what the transcript recorded next"""
+
+def ask_user(prompt, question=None, source=None, lead=''):
+    """Show a prompt and return the user's answer, recording or replaying it when active
+
+    question is the catalog question text the prompt belongs to, if any;
+    source defaults to the calling function's name. lead is screen text
+    written together with the prompt but not part of it.
+    """
+    if _active is None:
+        return input(lead + prompt)
+    return _active.ask(prompt, question, source or sys._getframe(1).f_code.co_name, lead)
+
+def observe(name, compute):
+    """compute()'s JSON result, recorded while recording and taken from the transcript on replay
+
+    For what a session learns from the computer partway through - files it
+    reads, directories it scans or creates. A replay runs in an empty home,
+    so computing these again would give different answers (or touch the real
+    filesystem). Transcripts recorded before a value was observed fall back
+    to computing it.
+    """
+    if _active is None:
+        return compute()
+    return _active.observe(name, compute)
+
+class TranscriptRecorder:
+    """Appends prompts and answers to a transcript file, one flushed line per event"""
+
+    def __init__(self, path, edition, options=None):
+        self._file = open(path, 'w', encoding='utf-8')
+        self._strings = {}
+        self._started = self._last = time.perf_counter()
+        self._write({
+            'transcript': TRANSCRIPT_VERSION,
+            'edition': edition,
+            'options': options or {},
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+            'platform': sys.platform,
+        })
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self._file.flush()
+
+    def _ref(self, text):
+        if text is None:
+            return None
+        ref = self._strings.get(text)
+        if ref is None:
+            ref = self._strings[text] = len(self._strings)
+            self._write(['s', ref, text])
+        return ref
+
+    def ask(self, prompt, question, source, lead=''):
+        shown = time.perf_counter()
+        gap_ms = round((shown - self._last) * 1000, 1)
+        refs = [self._ref(source), self._ref(question), self._ref(prompt)]
+        try:
+            answer = input(lead + prompt)
+        except tuple(INTERRUPTIONS.values()) as e:
+            self._last = time.perf_counter()
+            self._write(['x', gap_ms, round((self._last - shown) * 1000, 1)] + refs + [type(e).__name__])
+            raise
+        self._last = time.perf_counter()
+        self._write(['a', gap_ms, round((self._last - shown) * 1000, 1)] + refs + [answer])
+        return answer
+
+    def observe(self, name, compute):
+        value = compute()
+        self._write(['o', self._ref(name), value])
+        return value
+
+    def close(self):
+        if not self._file.closed:
+            self._write(['end', round((time.perf_counter() - self._started) * 1000, 1)])
+            self._file.close()
+
+class TranscriptPlayer:
+    """Answers prompts from recorded events; strict mode checks each prompt matches"""
+
+    def __init__(self, events, strict=True, observations=None):
+        self.events = events
+        self.strict = strict
+        self.position = 0
+        self.observations = {name: list(values) for name, values in (observations or {}).items()}
+
+    def ask(self, prompt, question, source, lead=''):
+        if lead:
+            sys.stdout.write(lead)
+        if self.position >= len(self.events):
+            raise TranscriptMismatch(f"transcript ended before prompt {prompt.strip()!r} ({source})")
+        event = self.events[self.position]
+        if self.strict and (event['source'], event['question'], event['prompt']) != (source, question, prompt):
+            raise TranscriptMismatch(f"event {self.position}: expected {event['question'] or event['prompt'].strip()!r} "
+                                     f"({event['source']}), builder asked {question or prompt.strip()!r} ({source})")
+        self.position += 1
+        if 'error' in event:
+            raise INTERRUPTIONS[event['error']]()
+        return event['answer']
+
+    def observe(self, name, compute):
+        recorded = self.observations.get(name)
+        return recorded.pop(0) if recorded else compute()
+
+def read_transcript(path):
+    """Load a transcript as (header, events) with string ids resolved
+
+    Observed values are collected, in order, in header['observations']
+    ({name: [value, ...]}).
+    """
+    strings = {}
+    events = []
+    with open(path, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+        if not isinstance(header, dict) or header.get('transcript') != TRANSCRIPT_VERSION:
+            raise ValueError(f"{path} is not a version {TRANSCRIPT_VERSION} transcript")
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A session killed mid-write leaves at most one torn last line
+                break
+            if entry[0] == 's':
+                strings[entry[1]] = entry[2]
+            elif entry[0] == 'o':
+                header.setdefault('observations', {}).setdefault(strings.get(entry[1]), []).append(entry[2])
+            elif entry[0] in ('a', 'x'):
+                _, gap_ms, wait_ms, source, question, prompt, value = entry
+                event = {'gap_ms': gap_ms, 'wait_ms': wait_ms, 'source': strings.get(source),
+                         'question': strings.get(question), 'prompt': strings.get(prompt)}
+                event['answer' if entry[0] == 'a' else 'error'] = value
+                events.append(event)
+    return header, events
+
+@contextlib.contextmanager
+def recording(path, edition, options=None):
+    """Record every ask_user() prompt inside the block to a transcript file"""
+    global _active
+    recorder = TranscriptRecorder(path, edition, options)
+    previous, _active = _active, recorder
+    try:
+        yield recorder
+    finally:
+        _active = previous
+        recorder.close()
+
+@contextlib.contextmanager
+def replaying(events, strict=True, observations=None):
+    """Answer every ask_user() prompt (and observe()) inside the block from recorded events"""
+    global _active
+    player = TranscriptPlayer(events, strict, observations)
+    previous, _active = _active, player
+    try:
+        yield player
+    finally:
+        _active = previous
+
+@contextlib.contextmanager
+def _isolated_home(home):
+    """Point Path.home() at another directory for the duration of a replay"""
+    saved = {name: os.environ.get(name) for name in ('HOME', 'USERPROFILE')}
+    os.environ['HOME'] = os.environ['USERPROFILE'] = str(home)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+def replay_transcript(path, home=None, strict=True, show=False):
+    """Replay one transcript through its builder; returns a result dict
+
+    The builder runs against home (a fresh temporary directory by default)
+    so replays never touch the real ~/goose_hints.
+    """
+    header, events = read_transcript(path)
+    module_name, function_name = BUILDERS[header['edition']]
+    builder = getattr(import_module(module_name), function_name)
+    result = {'path': str(path), 'edition': header['edition'], 'events': len(events),
+              'recorded_ms': round(sum(event['gap_ms'] + event['wait_ms'] for event in events), 1)}
+
+    with contextlib.ExitStack() as stack:
+        if home is None:
+            home = stack.enter_context(tempfile.TemporaryDirectory())
+        stack.enter_context(_isolated_home(home))
+        if not show:
+            devnull = stack.enter_context(open(os.devnull, 'w', encoding='utf-8'))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        player = stack.enter_context(replaying(events, strict, header.get('observations')))
+        started = time.perf_counter()
+        try:
+            builder(**header.get('options', {}))
+            result['error'] = None
+        except TranscriptMismatch as e:
+            result['error'] = str(e)
+        except tuple(INTERRUPTIONS.values()) as e:
+            # The recorded session ended in an interruption too
+            result['error'] = None if player.position == len(events) else f"unexpected {type(e).__name__}"
+        result['replay_ms'] = round((time.perf_counter() - started) * 1000, 2)
+        result['replayed'] = player.position
+
+    if result['error'] is None and player.position != len(events):
+        result['error'] = f"builder finished with {len(events) - player.position} recorded answers left"
+    return result
+
+def print_transcript(path):
+    """Human-readable listing of a transcript with timings"""
+    header, events = read_transcript(path)
+    print(f"🎬 {header['edition']} session recorded {header['recorded_at']} ({len(events)} prompts)")
+    for number, event in enumerate(events, 1):
+        answer = event.get('answer', f"<{event.get('error')}>")
+        context = f" [{event['question']}]" if event['question'] else ""
+        print(f"{number:>4}. +{event['gap_ms']:>7.1f}ms {event['wait_ms'] / 1000:>7.1f}s  "
+              f"{event['source']}{context}: {answer!r}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay or inspect recorded Goose Hints sessions")
+    subcommands = parser.add_subparsers(dest='command')
+    replay = subcommands.add_parser('replay', help="Replay transcripts through the builders at full speed")
+    replay.add_argument('transcripts', nargs='+')
+    replay.add_argument('--home', help="Home directory to run the builders in (default: a fresh temp dir)")
+    replay.add_argument('--lenient', action='store_true', help="Don't require prompts to match the recording")
+    replay.add_argument('--show', action='store_true', help="Print the builder output while replaying")
+    show = subcommands.add_parser('show', help="List a transcript's prompts, answers and timings")
+    show.add_argument('transcript')
+    args = parser.parse_args(argv)
+
+    if args.command == 'show':
+        print_transcript(args.transcript)
+        return 0
+    if args.command != 'replay':
+        parser.print_help()
+        return 0
+
+    started = time.perf_counter()
+    failed = 0
+    prompts = 0
+    for path in args.transcripts:
+        result = replay_transcript(path, args.home, strict=not args.lenient, show=args.show)
+        prompts += result['replayed']
+        if result['error']:
+            failed += 1
+            print(f"❌ {path}: {result['error']}")
+        else:
+            print(f"✅ {path}: {result['replayed']} prompts in {result['replay_ms']:.1f}ms "
+                  f"(recorded session took {result['recorded_ms'] / 1000:.1f}s)")
+    elapsed = time.perf_counter() - started
+    print(f"\n📊 {len(args.transcripts) - failed}/{len(args.transcripts)} transcripts replayed, "
+          f"{prompts} prompts in {elapsed:.2f}s")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    # Run the importable module's main so the builders and this CLI share one _active session
+    sys.exit(import_module('goose_hints_transcript').main())
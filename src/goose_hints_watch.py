@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Goose Hints Builder - Watch Mode
+Keeps everything derived from the saved preferences up to date while they
+are edited: the managed section of Goose's global hints, the tagged memory
+entries and, with --root, every project's .goosehints. The sources are the
+saved preferences, an optional org overlay (a preferences file such as the
+one 'goose-hints analytics --baseline-out' writes; its categories take
+precedence) and the per-project overrides file.
+
+On Linux the source directories are watched with inotify (through ctypes),
+so an idle watch sleeps in select() and uses no CPU; elsewhere the files are
+polled by mtime once a second. A burst of writes is debounced into one
+update, and each output is regenerated only if the categories it is built
+from changed: hints and memory are merged for just those categories, and
+only projects whose sections (after their overrides) differ are rewritten.
+
+    python src/goose_hints_watch.py
+    python src/goose_hints_watch.py --overlay org/baseline.json --root ~/src --overrides overrides.json
+"""
+
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from goose_hints_install import TARGETS, category_sections, install_preferences
+from goose_hints_state import load_state, state_path
+
+DEBOUNCE = 0.3
+POLL_INTERVAL = 1.0
+
+# inotify(7) event masks
+IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO = 0x8, 0x40, 0x80
+IN_CREATE, IN_DELETE, IN_Q_OVERFLOW = 0x100, 0x200, 0x4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+class InotifyWatcher:
+    """Changes to a set of files, reported by inotify on their directories
+
+    Directories rather than files are watched so atomic replacements
+    (write to a temporary file, then rename) are seen.
+    """
+
+    def __init__(self, paths):
+        import ctypes
+        import ctypes.util
+        self.paths = {Path(path).resolve() for path in paths}
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}
+        try:
+            for directory in {path.parent for path in self.paths}:
+                wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), WATCH_MASK)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+                self._dirs[wd] = directory
+        except OSError:
+            self.close()
+            raise
+
+    def wait(self, timeout=None):
+        """Watched paths changed before timeout seconds (None waits indefinitely)"""
+        import select
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            if not select.select([self.fd], [], [], remaining)[0]:
+                return set()
+            changed = self._read_events()
+            # Events for other files in the same directories are ignored
+            if changed:
+                return changed
+
+    def _read_events(self):
+        data = os.read(self.fd, 65536)
+        changed, offset = set(), 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                return set(self.paths)
+            if wd in self._dirs:
+                path = self._dirs[wd] / os.fsdecode(name)
+                if path in self.paths:
+                    changed.add(path)
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+class PollingWatcher:
+    """Changes to a set of files, found by comparing their mtime and size"""
+
+    def __init__(self, paths, interval=POLL_INTERVAL):
+        self.paths = {Path(path).resolve() for path in paths}
+        self.interval = interval
+        self._seen = {path: self._stamp(path) for path in self.paths}
+
+    @staticmethod
+    def _stamp(path):
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for path in self.paths:
+                stamp = self._stamp(path)
+                if stamp != self._seen[path]:
+                    self._seen[path] = stamp
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval if deadline is None else min(self.interval, max(deadline - time.monotonic(), 0)))
+
+    def close(self):
+        pass
+
+def make_watcher(paths, polling=False):
+    """An inotify watcher where the platform has one, else a polling watcher"""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths)
+
+def wait_for_changes(watcher, debounce=DEBOUNCE):
+    """Block until the watched files change, then until debounce seconds pass without changes"""
+    changed = watcher.wait()
+    while True:
+        more = watcher.wait(debounce)
+        if not more:
+            return changed
+        changed |= more
+
+def changed_categories(old, new):
+    """Categories added, removed or answered differently between two preferences dicts"""
+    return {category for category in set(old) | set(new) if old.get(category) != new.get(category)}
+
+class HintsWatch:
+    """The watched sources and the outputs derived from them
+
+    refresh() reloads the sources and regenerates what their changes affect;
+    the first call brings every output up to date.
+    """
+
+    def __init__(self, platform_info, edition='simple', overlay=None, targets=TARGETS, root=None,
+                 overrides=None, workers=None):
+        self.platform_info = platform_info
+        self.edition = edition
+        self.overlay = Path(overlay) if overlay else None
+        self.targets = tuple(targets)
+        self.root = Path(root) if root else None
+        self.overrides_path = Path(overrides) if overrides else None
+        self.workers = workers
+        self.preferences = None
+        self.overrides = []
+        self.manifest = {}
+
+    def sources(self):
+        paths = [state_path(self.platform_info, self.edition)]
+        return paths + [path for path in (self.overlay, self.overrides_path) if path is not None]
+
+    def load(self):
+        """(preferences with the overlay applied, overrides); raises ValueError if a source is unusable"""
+        state = load_state(self.platform_info, self.edition)
+        if state is None:
+            raise ValueError(f"no usable saved {self.edition} preferences")
+        preferences = dict(state['preferences'])
+        if self.overlay is not None:
+            try:
+                with open(self.overlay, 'r', encoding='utf-8') as f:
+                    overlay = json.load(f)
+            except OSError:
+                overlay = {}
+            if not isinstance(overlay, dict):
+                raise ValueError(f"{self.overlay}: expected a preferences object")
+            preferences.update(overlay)
+        overrides = []
+        if self.overrides_path is not None:
+            from goose_hints_projects import load_overrides
+            try:
+                overrides = load_overrides(self.overrides_path)
+            except FileNotFoundError:
+                pass
+        return preferences, overrides
+
+    def refresh(self):
+        """Regenerate the outputs affected since the last refresh
+
+        Returns {'categories': changed categories, 'targets': [...],
+        'projects': fan-out summary or None}.
+        """
+        preferences, overrides = self.load()
+        first = self.preferences is None
+        previous = {} if first else self.preferences
+        changed = changed_categories(previous, preferences)
+        report = {'categories': sorted(changed), 'targets': [], 'projects': None}
+
+        if self.targets and (changed or first):
+            subset = preferences if first else {category: preferences[category]
+                                                for category in changed if category in preferences}
+            removed = [category for category in changed if category not in preferences]
+            results = install_preferences(subset, self.platform_info, self.targets, remove=removed)
+            report['targets'] = [target for target, (_, written) in results.items() if written]
+
+        if self.root is not None and (changed or first or overrides != self.overrides):
+            report['projects'] = self._refresh_projects(previous, preferences, overrides, first)
+
+        self.preferences, self.overrides = preferences, overrides
+        return report
+
+    def _refresh_projects(self, previous, preferences, overrides, everything):
+        from goose_hints_projects import (DEFAULT_WORKERS, fan_out, find_projects, load_manifest, manifest_path,
+                                          project_sections, save_manifest)
+        path = manifest_path(self.platform_info)
+        if everything:
+            self.manifest = load_manifest(path)
+        old_sections, new_sections = category_sections(previous), category_sections(preferences)
+        projects = find_projects(self.root)
+        if not everything:
+            # Only projects whose own sections changed; new checkouts are picked up too
+            projects = [project for project in projects
+                        if str(project) not in self.manifest
+                        or project_sections(old_sections, project.relative_to(self.root).as_posix(), self.overrides)
+                        != project_sections(new_sections, project.relative_to(self.root).as_posix(), overrides)]
+        summary = fan_out(preferences, self.root, overrides, self.manifest, self.workers or DEFAULT_WORKERS,
+                          projects=projects)
+        if summary['written'] or summary['unchanged']:
+            save_manifest(path, self.manifest)
+        return summary
+
+    def run(self, watcher, debounce=DEBOUNCE, rounds=None, on_refresh=None):
+        """Refresh now and after every debounced change, rounds times (forever by default)"""
+        on_refresh = on_refresh or print_refresh
+        on_refresh(self._safe_refresh())
+        while rounds is None or rounds > 0:
+            wait_for_changes(watcher, debounce)
+            on_refresh(self._safe_refresh())
+            if rounds is not None:
+                rounds -= 1
+
+    def _safe_refresh(self):
+        # A source caught half-edited is skipped; the next save triggers another refresh
+        try:
+            return self.refresh()
+        except (OSError, ValueError, TimeoutError) as e:
+            return {'error': str(e)}
+
+def print_refresh(report):
+    stamp = datetime.now().strftime('%H:%M:%S')
+    if 'error' in report:
+        print(f"⚠️  {stamp} not updated: {report['error']}", flush=True)
+        return
+    outputs = {'hints': "global hints", 'memory': "memory"}
+    updated = [outputs[target] for target in report['targets']]
+    if report['projects'] is not None and report['projects']['written']:
+        updated.append(f"{report['projects']['written']} project(s)")
+    conflicts = report['projects']['conflict'] if report['projects'] else 0
+    changed = ", ".join(report['categories']) or "no categories"
+    print(f"🔄 {stamp} {changed} changed - updated {', '.join(updated) or 'nothing'}"
+          + (f" ({conflicts} project conflict(s), see goose-hints projects)" if conflicts else ""), flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate Goose hints, memory and project hints as preferences change")
+    parser.add_argument('--edition', choices=['simple', 'comprehensive'], default='simple')
+    parser.add_argument('--home', help="Home directory holding goose_hints/ (default: your home)")
+    parser.add_argument('--overlay', help="Org preferences file whose categories take precedence")
+    parser.add_argument('--target', choices=['hints', 'memory', 'both', 'none'], default='both',
+                        help="Goose files to keep up to date")
+    parser.add_argument('--root', help="Also keep every project's .goosehints under this directory up to date")
+    parser.add_argument('--overrides', help="JSON file of per-project category overrides")
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE, help="Seconds of quiet before updating")
+    parser.add_argument('--poll', action='store_true', help="Poll file times instead of using inotify")
+    args = parser.parse_args(argv)
+    targets = {'both': TARGETS, 'none': ()}.get(args.target, (args.target,))
+
+    from goose_hints_platform import get_user_platform_info
+    watch = HintsWatch(get_user_platform_info(home=args.home), args.edition, args.overlay, targets,
+                       Path(args.root).expanduser() if args.root else None, args.overrides)
+    try:
+        watcher = make_watcher(watch.sources(), polling=args.poll)
+    except OSError as e:
+        print(f"❌ Cannot watch the preferences: {e}", file=sys.stderr)
+        return 1
+    print(f"👀 Watching {', '.join(str(path) for path in watch.sources())} "
+          f"({'inotify' if isinstance(watcher, InotifyWatcher) else 'polling'}) - Ctrl-C to stop", flush=True)
+    try:
+        watch.run(watcher, args.debounce)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
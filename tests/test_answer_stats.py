@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints answer statistics and adaptive question order
+Builds a statistics table from correlated answer sets and steps the engine through it
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+sys.path.append('src')
+
+from goose_hints_engine import CHOOSE, PREFILLED, REVIEW, QuestionSession
+from goose_hints_platform import get_user_platform_info
+from goose_hints_stats import AnswerStats, compute_stats, load_stats, main, save_stats
+
+PLATFORM_INFO = get_user_platform_info(home='/home/jdoe', system='Linux')
+
+# Terse communicators want a final summary and no hand-holding on errors
+TERSE = {'communication_style': 'concise_direct', 'progress_reporting': 'final_summary_only',
+         'error_handling': 'fix_automatically'}
+CHATTY = {'communication_style': 'teaching_mode', 'progress_reporting': 'step_by_step',
+          'error_handling': 'debug_together'}
+
+def correlated_answer_sets(count=40):
+    """Answer sets where communication style decides two other answers"""
+    for i in range(count):
+        answers = dict(TERSE if i % 2 else CHATTY)
+        answers['time_management'] = ['speed_first', 'balanced', 'thorough_first', 'deadline_driven'][i // 2 % 4]
+        yield answers
+
+def test_compute_stats():
+    """Correlated answers produce predictions and information gain"""
+    print("🧪 Testing answer statistics")
+    table = compute_stats('comprehensive', correlated_answer_sets())
+    assert table['sessions'] == 40
+    assert ['progress_reporting', 'final_summary_only', 1.0] in table['predictions']['communication_style=concise_direct']
+    stats = AnswerStats(table)
+    assert stats.information_gain('communication_style', ['progress_reporting', 'error_handling']) > 1.9
+    assert stats.information_gain('time_management', ['progress_reporting', 'error_handling']) < 0.1
+
+    answers = {'communication_style': {'key': 'concise_direct'}}
+    started = time.perf_counter()
+    for _ in range(10000):
+        predicted = stats.predict(answers, {'progress_reporting', 'error_handling', 'time_management'})
+    assert (time.perf_counter() - started) / 10000 < 0.001
+    assert predicted == {'progress_reporting': ('final_summary_only', 1.0), 'error_handling': ('fix_automatically', 1.0)}
+
+    # Too little support predicts nothing
+    assert compute_stats('comprehensive', correlated_answer_sets(4))['predictions'] == {}
+    print("✅ Answer statistics work")
+
+def test_adaptive_session_prefills():
+    """The most informative question comes first and predicted answers are reviewed in bulk"""
+    print("🧪 Testing adaptive question order")
+    stats = AnswerStats(compute_stats('comprehensive', correlated_answer_sets()))
+    categories = ['time_management', 'communication_style', 'progress_reporting', 'error_handling']
+    session = QuestionSession('comprehensive', PLATFORM_INFO, categories, stats=stats)
+    assert session.question['key'] == 'communication_style'
+    session.answer('concise_direct')
+    assert session.question['key'] == 'time_management'
+    session.answer('balanced')
+
+    assert session.state == REVIEW
+    assert [question['key'] for question, _, _ in session.suggestions] == ['progress_reporting', 'error_handling']
+    outcome = session.submit('2')
+    assert outcome.kind == PREFILLED and list(outcome.value) == ['progress_reporting']
+    assert session.state == CHOOSE and session.question['key'] == 'error_handling'
+    session.answer('full_tracebacks')
+    assert session.done
+    preferences = session.preferences()
+    assert preferences['progress_reporting']['key'] == 'final_summary_only'
+    assert preferences['error_handling']['key'] == 'full_tracebacks'
+    print("✅ Adaptive question order works")
+
+def test_stats_file_round_trip():
+    """Tables build from answer files and load for the builders"""
+    print("🧪 Testing answer statistics files")
+    with tempfile.TemporaryDirectory() as home:
+        platform_info = get_user_platform_info(home=home, system='Linux')
+        assert load_stats(platform_info, 'comprehensive') is None
+        save_stats(compute_stats('comprehensive', correlated_answer_sets()), platform_info)
+        assert load_stats(platform_info, 'comprehensive').sessions == 40
+        assert load_stats(platform_info, 'simple') is None
+
+        answers = os.path.join(home, 'answers.jsonl')
+        with open(answers, 'w', encoding='utf-8') as f:
+            for record in correlated_answer_sets(10):
+                f.write(json.dumps(record) + "\n")
+        original_home = os.environ.get('HOME')
+        os.environ['HOME'] = home
+        try:
+            assert main(['build', '--edition', 'comprehensive', answers]) == 0
+        finally:
+            if original_home is None:
+                del os.environ['HOME']
+            else:
+                os.environ['HOME'] = original_home
+        assert load_stats(platform_info, 'comprehensive').sessions == 10
+    print("✅ Answer statistics files work")
+
+if __name__ == "__main__":
+    test_compute_stats()
+    test_adaptive_session_prefills()
+    test_stats_file_round_trip()
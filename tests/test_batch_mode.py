@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints Builder batch mode
+Validates answer resolution and headless hints generation
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_batch import resolve_record, run_batch, safe_record_id
+from goose_hints_catalog import get_question
+from goose_hints_flow import resolve_answer
+from goose_hints_platform import get_user_platform_info
+
+SAMPLE_RECORD = {
+    "id": "jdoe",
+    "home": "/home/jdoe",
+    "system": "Linux",
+    "output_formats": "visual_charts",
+    "communication_style": 3,
+    "exemplar_files": "none",
+    "preferred_font": "roboto",
+    "document_format": "custom: LaTeX with the lab template",
+    "root_directory": "custom_path",
+    "custom_root_path": "/srv/projects/jdoe",
+    "data_organization": "cookiecutter",
+    "backup_strategy": "always_backup",
+    "cloud_provider": "dropbox",
+    "coding_preferences": "python_focus"
+}
+
+def test_resolve_answer():
+    """Option keys, numbers and custom text all resolve"""
+    print("🧪 Testing batch answer resolution")
+    question = get_question('simple', 'output_formats')
+    platform_info = get_user_platform_info(home='/home/jdoe', system='Linux')
+    assert resolve_answer('simple', question, 'code_output', platform_info)['key'] == 'code_output'
+    assert resolve_answer('simple', question, '1', platform_info)['key'] == 'markdown_tables'
+    custom = resolve_answer('simple', question, {'custom': 'Bullet lists'}, platform_info)
+    assert custom == {'key': 'custom_preference', 'label': 'Custom: Bullet lists', 'hint': 'Bullet lists'}
+
+    for bad in ['nope', '99', 'custom:']:
+        try:
+            resolve_answer('simple', question, bad, platform_info)
+        except ValueError:
+            continue
+        raise AssertionError(f"{bad!r} should not resolve")
+    print("✅ Answer resolution validated")
+
+def test_resolve_record():
+    """A full record produces the interactive preferences shape"""
+    platform_info = get_user_platform_info(home=SAMPLE_RECORD['home'], system='Linux')
+    preferences = resolve_record(SAMPLE_RECORD, platform_info)
+
+    assert preferences['communication_style']['key'] == 'milestone_updates'
+    assert 'exemplar_files' not in preferences['document_formatting']
+    assert preferences['document_formatting']['document_format']['key'] == 'custom_preference'
+    assert preferences['file_management']['root_directory']['hint'] == "Use /srv/projects/jdoe as root directory"
+    assert preferences['file_management']['cloud_provider']['key'] == 'dropbox'
+
+    # No cloud follow-up for local backups
+    local = dict(SAMPLE_RECORD, backup_strategy='local_backup')
+    assert 'cloud_provider' not in resolve_record(local, platform_info)['file_management']
+    print("✅ Record resolution validated")
+
+def test_run_batch():
+    """Batch runs write one file per good record and report failures"""
+    with tempfile.TemporaryDirectory() as tmp:
+        answers = Path(tmp) / "answers.jsonl"
+        records = [dict(SAMPLE_RECORD, id=f"user{i}") for i in range(5)]
+        records.append({"id": "broken", "output_formats": "nope"})
+        answers.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding='utf-8')
+
+        for workers in (0, 2):
+            output_dir = Path(tmp) / f"out{workers}"
+            summary = run_batch(answers, output_dir, workers=workers, chunk_size=2)
+            assert summary['records'] == 6
+            assert summary['succeeded'] == 5
+            assert [f['id'] for f in summary['failed']] == ['broken']
+            assert len(list(output_dir.glob('user*/universal_goose_hints_*.txt'))) == 5
+
+            # Identical answers on a re-run reuse the existing files
+            rerun = run_batch(answers, output_dir, workers=workers, chunk_size=2)
+            assert rerun['unchanged'] == 5
+            assert len(list(output_dir.glob('user*/universal_goose_hints_*.txt'))) == 5
+    print("✅ Batch generation validated")
+
+def test_record_ids():
+    """Record ids never leave the output directory and never share one"""
+    assert safe_record_id({'id': 'jdoe'}, 1) == 'jdoe'
+    assert safe_record_id({}, 7) == 'record-7'
+    assert safe_record_id({'id': 'j doe'}, 1) != safe_record_id({'id': 'j_doe'}, 2)
+    assert safe_record_id({'id': '../x'}, 1).startswith('.._x-')
+    for dots in ('.', '..', '...'):
+        try:
+            safe_record_id({'id': dots}, 1)
+            assert False, f"{dots!r} should be rejected"
+        except ValueError:
+            pass
+
+    with tempfile.TemporaryDirectory() as tmp:
+        answers = Path(tmp) / "answers.jsonl"
+        records = [dict(SAMPLE_RECORD, id=record_id) for record_id in ('..', 'j doe', 'j_doe')]
+        answers.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding='utf-8')
+        output_dir = Path(tmp) / "out"
+        summary = run_batch(answers, output_dir, workers=0)
+        assert summary['succeeded'] == 2 and [f['id'] for f in summary['failed']] == ['record-1']
+        assert len(list(output_dir.glob('*/universal_goose_hints_*.txt'))) == 2
+        assert not list(Path(tmp).glob('universal_goose_hints_*.txt'))
+    print("✅ Record ids validated")
+
+if __name__ == "__main__":
+    test_resolve_answer()
+    test_resolve_record()
+    test_run_batch()
+    test_record_ids()
+    print("\n🎉 Batch mode validated!")
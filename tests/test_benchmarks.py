@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script for the benchmark corpus and scripted question flows
+Checks that synthetic answers drive the interactive builders to the same
+preferences the non-interactive question flow produces
+"""
+
+import sys
+sys.path.append('src')
+sys.path.append('benchmarks')
+
+from benchmark_suite import PLATFORM_INFO, benchmark_edition, run_flows
+from goose_hints_catalog import iter_questions
+from goose_hints_flow import build_preferences, resolve_answer
+from synthetic_corpus import generate_answers, scripted_inputs
+
+def test_scripted_flows_match_question_flow():
+    """Builder preferences from scripted keystrokes equal the flow module's preferences"""
+    print("🧪 Testing scripted benchmark flows")
+    for edition in ['simple', 'comprehensive']:
+        records = list(generate_answers(edition, 40, custom_ratio=0.5, seed=7))
+        assert len({record['id'] for record in records}) == 40
+        assert any(isinstance(value, dict) for record in records for value in record.values())
+
+        sessions = [(record, scripted_inputs(edition, record)) for record in records]
+        preferences, questions = run_flows(edition, sessions)
+        assert questions == sum(len(record) - 1 for record in records)
+
+        questions_by_key = {question['key']: question for question in iter_questions(edition)}
+        for record, prefs in zip(records, preferences):
+            answers = {key: resolve_answer(edition, questions_by_key[key], value, PLATFORM_INFO)
+                       for key, value in record.items() if key != 'id'}
+            assert prefs == build_preferences(edition, answers), record['id']
+    print("✅ Scripted benchmark flows work")
+
+def test_benchmark_results_shape():
+    """A tiny benchmark run reports throughput, per-question overhead and peak memory"""
+    results = benchmark_edition('comprehensive', 5, 0.2, 1)
+    assert set(results) == {'flow_comprehensive', 'render_comprehensive', 'render_cached_comprehensive'}
+    flow = results['flow_comprehensive']
+    assert flow['sessions'] == 5 and flow['per_second'] > 0 and flow['us_per_question'] > 0
+    assert results['render_comprehensive']['peak_kib'] >= 0
+
+if __name__ == "__main__":
+    test_scripted_flows_match_question_flow()
+    test_benchmark_results_shape()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script for the goose-hints command line entry point
+Checks subcommand dispatch and that short commands import only what they need
+"""
+
+import json
+import subprocess  # nosec B404 - runs this repo's own CLI
+import sys
+import tempfile
+sys.path.append('src')
+
+from goose_hints_catalog import get_options
+from goose_hints_platform import get_user_platform_info
+from goose_hints_state import save_state
+
+def run_cli(args):
+    """Run goose_hints_cli.main in a fresh interpreter; returns (code, stdout, imported modules)"""
+    script = ("import json, sys; sys.path.insert(0, 'src'); import goose_hints_cli; "
+              f"code = goose_hints_cli.main({args!r}); "
+              "sys.stderr.write(json.dumps(sorted(sys.modules))); sys.exit(code)")
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True)  # nosec B603
+    return result.returncode, result.stdout, set(json.loads(result.stderr.splitlines()[-1]))
+
+def test_render_saved_profile_is_lightweight():
+    """render prints saved preferences without loading the catalog or the SQLite index"""
+    print("🧪 Testing CLI render")
+    with tempfile.TemporaryDirectory() as home:
+        code, _, _ = run_cli(['render', '--home', home])
+        assert code == 1
+
+        platform_info = get_user_platform_info(home=home)
+        save_state({'output_formats': get_options('simple', 'output_formats')[0]}, platform_info, 'simple')
+        code, output, modules = run_cli(['render', '--home', home])
+
+    assert code == 0
+    assert output.startswith("# Universal Goose Hints - Generated")
+    assert get_options('simple', 'output_formats')[0]['hint'] in output
+    for heavy in ['goose_hints_catalog', 'goose_hints_store', 'goose_hints_builder_simple', 'sqlite3', 'asyncio']:
+        assert heavy not in modules, f"render imported {heavy}"
+    print("✅ CLI render works")
+
+def test_unknown_command_rejected():
+    """Unknown subcommands exit with a usage error"""
+    print("🧪 Testing CLI dispatch")
+    result = subprocess.run([sys.executable, 'src/goose_hints_cli.py', 'frobnicate'],  # nosec B603
+                            capture_output=True, text=True)
+    assert result.returncode == 2
+    assert 'invalid choice' in result.stderr
+    print("✅ CLI dispatch works")
+
+if __name__ == "__main__":
+    test_render_saved_profile_is_lightweight()
+    test_unknown_command_rejected()
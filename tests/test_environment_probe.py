@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints environment probe
+Checks detection, the probe deadline, the cache and the preselected answers
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_engine import ACCEPTED, QuestionSession
+from goose_hints_platform import get_user_platform_info
+from goose_hints_probe import probe_cloud_root, probe_environment, run_probes, suggested_defaults, CLOUD_ROOTS
+
+def test_cloud_detection_and_cache():
+    """A Dropbox folder is found, cached, and the cache is reused until it expires"""
+    print("🧪 Testing cloud folder detection and probe cache")
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / "Dropbox").mkdir()
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        assert probe_cloud_root(tmp, CLOUD_ROOTS['dropbox']) == str(Path(tmp) / "Dropbox")
+        assert probe_cloud_root(tmp, CLOUD_ROOTS['onedrive']) is None
+
+        first = probe_environment(platform_info)
+        assert first['cloud'] == {'dropbox': str(Path(tmp) / "Dropbox")}
+        assert first['timed_out'] == []
+
+        (Path(tmp) / "OneDrive").mkdir()
+        assert probe_environment(platform_info)['probed_at'] == first['probed_at']
+        assert set(probe_environment(platform_info, ttl=0)['cloud']) == {'dropbox', 'onedrive'}
+    print("✅ Cloud folder detection and probe cache work")
+
+def test_probe_deadline():
+    """A hung probe is abandoned at the deadline without holding up the others"""
+    print("🧪 Testing probe deadline")
+    started = time.monotonic()
+    results, timed_out = run_probes({'fast': lambda: 'ok', 'hung': lambda: time.sleep(5), 'broken': lambda: 1 / 0},
+                                    timeout=0.2)
+    assert time.monotonic() - started < 1.0
+    assert results == {'fast': 'ok', 'broken': None}
+    assert timed_out == ['hung']
+    print("✅ Probe deadline works")
+
+def test_defaults_preselect_options():
+    """Detected tools become defaults that an empty answer accepts"""
+    print("🧪 Testing preselected answers")
+    defaults = suggested_defaults({'cloud': {'dropbox': '/d', 'onedrive': '/o'},
+                                   'toolchains': {'python': '/usr/bin/python3'}, 'fonts': ['roboto']})
+    assert defaults == {'cloud_provider': 'multiple', 'coding_preferences': 'python_focus', 'preferred_font': 'roboto'}
+    assert suggested_defaults({'cloud': {}, 'toolchains': {}, 'fonts': []}) == {}
+
+    platform_info = get_user_platform_info(home='/home/jdoe', system='Linux')
+    session = QuestionSession('simple', platform_info, ['coding_preferences'], defaults=defaults)
+    assert session.options[session.default_number - 1]['key'] == 'python_focus'
+    outcome = session.submit('')
+    assert outcome.kind == ACCEPTED and outcome.value['key'] == 'python_focus'
+
+    session = QuestionSession('simple', platform_info, ['output_formats'], defaults=defaults)
+    assert session.default_number is None
+    assert session.submit('').kind != ACCEPTED
+    print("✅ Preselected answers work")
+
+if __name__ == "__main__":
+    test_cloud_detection_and_cache()
+    test_probe_deadline()
+    test_defaults_preselect_options()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints exemplar style extractor
+Builds small Markdown, DOCX and PDF exemplars and checks what is extracted
+"""
+
+import os
+import sys
+import tempfile
+import zipfile
+import zlib
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_engine import QuestionSession
+import goose_hints_exemplar as exemplar
+from goose_hints_exemplar import (analyze_exemplars, cache_path, exemplar_defaults, exemplar_hints,
+                                  extract_style, parse_exemplar_paths, summarize_styles)
+from goose_hints_platform import get_user_platform_info
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+A = 'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+
+def write_docx(path):
+    paragraphs = "".join(
+        f'<w:p><w:pPr><w:pStyle w:val="Heading{level}"/></w:pPr><w:r><w:t>{number} Section</w:t></w:r></w:p>'
+        for level, number in [(1, "1."), (2, "1.1"), (2, "1.2"), (1, "2.")])
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('word/theme/theme1.xml',
+                         f'<a:theme {A}><a:fontScheme><a:majorFont><a:latin typeface="Roboto Slab"/></a:majorFont>'
+                         f'<a:minorFont><a:latin typeface="Roboto"/></a:minorFont></a:fontScheme></a:theme>')
+        archive.writestr('word/styles.xml',
+                         f'<w:styles {W}><w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:asciiTheme="minorHAnsi"/>'
+                         f'<w:sz w:val="22"/></w:rPr></w:rPrDefault></w:docDefaults></w:styles>')
+        archive.writestr('word/document.xml',
+                         f'<w:document {W}><w:body>{paragraphs}'
+                         f'<w:p><w:r><w:rPr><w:rFonts w:ascii="Roboto"/></w:rPr><w:t>Body</w:t></w:r></w:p>'
+                         f'<w:tbl><w:tr><w:tc><w:p/></w:tc></w:tr></w:tbl></w:body></w:document>')
+
+def write_pdf(path):
+    objects = zlib.compress(b"1 0 << /Type /Font /Subtype /TrueType /BaseFont /ABCDEF+TimesNewRomanPSMT >>")
+    with open(path, 'wb') as f:
+        f.write(b"%PDF-1.5\n1 0 obj << /Type /Page /Resources << /Font << /F1 2 0 R >> >> >> endobj\n"
+                b"2 0 obj << /Type /Font /Subtype /Type1 /BaseFont /Arial-BoldMT >> endobj\n"
+                b"3 0 obj << /Type /ObjStm /N 1 /First 4 /Filter /FlateDecode /Length "
+                + str(len(objects)).encode() + b" >>\nstream\n" + objects + b"\nendstream\nendobj\n%%EOF\n")
+
+def test_extractors():
+    """Each format yields its fonts, headings and deliverable format"""
+    print("🧪 Testing exemplar extractors")
+    with tempfile.TemporaryDirectory() as tmp:
+        markdown = Path(tmp) / "notes.md"
+        markdown.write_text("# 1. Intro\n\n## 1.1 Scope\n\n```\n# not a heading\n```\n\n"
+                            "| a | b |\n|---|---|\n| 1 | 2 |\n<span style=\"font-family: Montserrat\">x</span>\n",
+                            encoding='utf-8')
+        style = extract_style(str(markdown))
+        assert style['format'] == 'markdown'
+        assert style['headings'] == {'1': 1, '2': 1} and style['numbered_headings'] == 2
+        assert style['tables'] == 1 and style['fonts'] == {'Montserrat': 1}
+
+        docx = Path(tmp) / "report.docx"
+        write_docx(docx)
+        style = extract_style(str(docx))
+        assert style['format'] == 'word', style
+        assert list(style['fonts']) == ['Roboto'] and style['font_size'] == 11
+        assert style['headings'] == {'1': 2, '2': 2} and style['numbered_headings'] == 4
+        assert style['tables'] == 1
+
+        pdf = Path(tmp) / "final.pdf"
+        write_pdf(pdf)
+        style = extract_style(str(pdf))
+        assert style['format'] == 'pdf' and style['pages'] == 1
+        assert set(style['fonts']) == {'Arial', 'TimesNewRoman'}, style
+
+        assert 'error' in extract_style(str(Path(tmp) / "slides.pptx"))
+        (Path(tmp) / "broken.docx").write_bytes(b"not a zip")
+        assert 'error' in extract_style(str(Path(tmp) / "broken.docx"))
+
+        # Encrypted members and unknown compression methods are per-file errors too
+        for offset, value, message in ((8, 1, 'encrypted'), (10, 99, 'compression')):
+            data = bytearray(docx.read_bytes())
+            central = data.find(b'PK\x01\x02')
+            while central != -1:
+                data[central + offset:central + offset + 2] = value.to_bytes(2, 'little')
+                central = data.find(b'PK\x01\x02', central + 4)
+            (Path(tmp) / "locked.docx").write_bytes(bytes(data))
+            assert message in extract_style(str(Path(tmp) / "locked.docx"))['error']
+
+        # Oversized DOCX parts are refused and PDF streams that inflate too far are skipped
+        limits = exemplar.MAX_MEMBER_BYTES, exemplar.MAX_STREAM_BYTES
+        exemplar.MAX_MEMBER_BYTES = exemplar.MAX_STREAM_BYTES = 64
+        try:
+            assert 'more than' in extract_style(str(docx))['error']
+            assert extract_style(str(pdf))['fonts'] == {'Arial': 1}
+        finally:
+            exemplar.MAX_MEMBER_BYTES, exemplar.MAX_STREAM_BYTES = limits
+    print("✅ Exemplar extractors work")
+
+def test_cache_and_defaults():
+    """Unchanged files come from the cache; the summary preselects font and format"""
+    print("🧪 Testing exemplar cache and preselected answers")
+    with tempfile.TemporaryDirectory() as tmp:
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        paths = []
+        for i in range(6):
+            path = Path(tmp) / f"report{i}.docx"
+            write_docx(path)
+            paths.append(str(path))
+        value = ", ".join(paths) + f", {tmp}/missing.md"
+        styles = analyze_exemplars(parse_exemplar_paths(value), platform_info)
+        assert len(styles) == 7 and 'error' in styles[-1]
+        assert cache_path(platform_info).exists()
+
+        # A cached style is returned as stored, even though the file would now parse differently
+        stat = os.stat(paths[0])
+        Path(paths[0]).write_bytes(b"garbage!" * 100)
+        os.truncate(paths[0], stat.st_size)
+        os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert analyze_exemplars(paths[:1], platform_info) == styles[:1]
+        os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert 'error' in analyze_exemplars(paths[:1], platform_info)[0]
+
+        summary = summarize_styles(styles)
+        assert summary['files'] == 6 and summary['format'] == 'word'
+        defaults = exemplar_defaults(summary)
+        assert defaults == {'preferred_font': 'roboto', 'document_format': 'word'}
+        assert exemplar_hints(summary)[1] == "Structure documents with up to 2 levels of numbered headings"
+
+        session = QuestionSession('simple', platform_info, ['document_formatting'], defaults=defaults)
+        session.answer(value)
+        assert session.options[session.default_number - 1]['key'] == 'roboto'
+        session.submit('')
+        assert session.options[session.default_number - 1]['key'] == 'word'
+    print("✅ Exemplar cache and preselected answers work")
+
+if __name__ == "__main__":
+    test_extractors()
+    test_cache_and_defaults()
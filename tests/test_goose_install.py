@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints installer
+Merges preferences into Goose's hints and memory files in temporary homes
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_flow import custom_option
+from goose_hints_install import install_homes, install_preferences, main, target_paths
+from goose_hints_platform import get_user_platform_info
+from goose_hints_state import save_state
+
+TERSE = custom_option("Keep answers short")
+VISUAL = {'key': 'visual_charts', 'label': 'Charts', 'hint': 'Create visualizations and charts for data presentation'}
+PYTHON = {'key': 'python_focus', 'label': 'Python', 'hint': 'Prefer Python for data analysis and programming tasks'}
+
+def test_merge_keeps_unrelated_entries():
+    """Installing replaces only the categories being installed"""
+    print("🧪 Testing merge into Goose hints and memory")
+    with tempfile.TemporaryDirectory() as tmp:
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        paths = target_paths(platform_info)
+        assert paths['hints'] == Path(tmp) / ".config" / "goose" / ".goosehints"
+        paths['memory'].parent.mkdir(parents=True)
+        paths['hints'].write_text("Always use type hints.\n", encoding='utf-8')
+        paths['memory'].write_text("# work\nI work on the billing team\n\n", encoding='utf-8')
+
+        results = install_preferences({'communication_style': TERSE, 'output_formats': VISUAL}, platform_info)
+        assert all(changed for _, changed in results.values())
+        results = install_preferences({'output_formats': VISUAL, 'coding_preferences': PYTHON}, platform_info)
+        assert all(changed for _, changed in results.values())
+
+        hints = paths['hints'].read_text(encoding='utf-8')
+        assert hints.startswith("Always use type hints.\n\n<!-- goose-hints-builder:begin -->")
+        assert hints.count("### Output Formats") == 1
+        assert "- Keep answers short\n" in hints and "- Prefer Python" in hints
+        memory = paths['memory'].read_text(encoding='utf-8')
+        entries = memory.strip().split("\n\n")
+        assert entries[0] == "# work\nI work on the billing team"
+        assert [entry.split("\n")[0] for entry in entries[1:]] == [
+            "# goose-hints communication_style", "# goose-hints output_formats", "# goose-hints coding_preferences"]
+
+        again = install_preferences({'output_formats': VISUAL}, platform_info)
+        assert not any(changed for _, changed in again.values())
+        assert not list(paths['hints'].parent.glob("*.tmp"))
+    print("✅ Merge into Goose hints and memory works")
+
+def test_concurrent_installs_keep_every_category():
+    """Writers holding the lock in turn never lose each other's categories"""
+    print("🧪 Testing concurrent installs")
+    with tempfile.TemporaryDirectory() as tmp:
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        categories = [f"category_{i}" for i in range(12)]
+        threads = [threading.Thread(target=install_preferences, args=({category: TERSE}, platform_info))
+                   for category in categories]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        hints = target_paths(platform_info)['hints'].read_text(encoding='utf-8')
+        memory = target_paths(platform_info)['memory'].read_text(encoding='utf-8')
+        for category in categories:
+            assert f"<!-- {category} -->" in hints and f"# goose-hints {category}\n" in memory
+    print("✅ Concurrent installs work")
+
+def test_fleet_install():
+    """Many homes are installed in one call, from saved preferences or answer records"""
+    print("🧪 Testing fleet install")
+    with tempfile.TemporaryDirectory() as tmp:
+        homes = [Path(tmp) / f"user{i}" for i in range(5)]
+        jobs = [(get_user_platform_info(home=home, system='Linux'), {'output_formats': VISUAL}) for home in homes]
+        summary = install_homes(jobs, workers=3)
+        assert summary['installed'] == 5 and summary['failed'] == 0
+        assert install_homes(jobs)['unchanged'] == 5
+        # A generator of jobs is drained a few at a time
+        assert install_homes(iter(jobs), workers=2, max_pending=2)['unchanged'] == 5
+
+        save_state({'coding_preferences': PYTHON}, get_user_platform_info(home=homes[0]), 'simple')
+        assert main(['--home', str(homes[0]), str(homes[1]), '--target', 'memory']) == 0
+        memory = target_paths(get_user_platform_info(home=homes[0]))['memory'].read_text(encoding='utf-8')
+        assert "# goose-hints coding_preferences" in memory
+
+        answers = Path(tmp) / "team.jsonl"
+        answers.write_text('{"id": "a", "home": "%s", "output_formats": "simple_text", "communication_style": 1, '
+                           '"preferred_font": 1, "document_format": 1, "root_directory": 1, "data_organization": 1, '
+                           '"backup_strategy": "manual_backup", "coding_preferences": 1}\n{"id": "b"}\n' % homes[4],
+                           encoding='utf-8')
+        assert main(['--answers', str(answers), '--target', 'hints']) == 0
+        hints = target_paths(get_user_platform_info(home=homes[4]))['hints'].read_text(encoding='utf-8')
+        assert "Provide clear, simple text responses" in hints and hints.count("### Output Formats") == 1
+    print("✅ Fleet install works")
+
+if __name__ == "__main__":
+    test_merge_keeps_unrelated_entries()
+    test_concurrent_installs_keep_every_category()
+    test_fleet_install()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints compiler
+Checks that compiled hints keep every directive in far fewer tokens
+"""
+
+import sys
+sys.path.append('src')
+
+from goose_hints_compile import compile_hints, count_tokens, merge_directives
+from goose_hints_engine import QuestionSession
+from goose_hints_flow import custom_option
+from goose_hints_platform import get_user_platform_info
+
+PLATFORM_INFO = get_user_platform_info(home='/home/jdoe', system='Linux')
+
+def answered(edition, answers):
+    session = QuestionSession(edition, PLATFORM_INFO)
+    while not session.done:
+        session.answer(answers.get(session.question['key'], 1))
+    return session.preferences()
+
+def test_compile_simple():
+    """Boilerplate goes, follow-ups fold into their parent, same-verb directives share a line"""
+    print("🧪 Testing simple hints compilation")
+    preferences = answered('simple', {'exemplar_files': 'none', 'backup_strategy': 'selective_backup',
+                                      'cloud_provider': 'dropbox'})
+    preferences['communication_style'] = custom_option("Present data in markdown tables")
+    result = compile_hints(preferences, PLATFORM_INFO, 'simple', budget=None)
+    text = result['text']
+
+    assert text.startswith("# Goose preferences (Linux)\n")
+    for boilerplate in ("Universal Features", "Integration Instructions", "File Location", "###"):
+        assert boilerplate not in text
+    assert "- Backup only completed work and final outputs to Dropbox\n" in text
+    assert "for cloud backups" not in text
+    assert "- Use Montserrat as primary font; /home/jdoe/Projects as root with project subdirectories;" in text
+    # The custom answer says nothing the markdown tables option doesn't
+    assert text.count("markdown tables") == 1
+    assert result['tokens_after'] == count_tokens(text)
+    assert result['tokens_after'] * 2 < result['tokens_before']
+    assert result['dropped'] == []
+    print("✅ Simple hints compilation works")
+
+def test_budget_drops_least_useful_first():
+    """Over budget, near-default options go before the rest and custom answers go last"""
+    print("🧪 Testing token budget")
+    preferences = answered('comprehensive', {'time_management': 'balanced', 'security_privacy': 'standard_practices',
+                                             'decision_making': {'custom': 'Never push to main'}})
+    unlimited = compile_hints(preferences, PLATFORM_INFO, 'comprehensive', budget=None)
+    budget = unlimited['tokens_after'] - 5
+    result = compile_hints(preferences, PLATFORM_INFO, 'comprehensive', budget=budget)
+    assert result['tokens_after'] <= budget
+    assert set(result['dropped']) <= {'time_management', 'security_privacy'} and result['dropped']
+
+    tiny = compile_hints(preferences, PLATFORM_INFO, 'comprehensive', budget=20)
+    assert tiny['tokens_after'] <= 20
+    assert "Never push to main" in tiny['text']
+    assert count_tokens("Use /home/jdoe/Projects as root") < len("Use /home/jdoe/Projects as root")
+    assert merge_directives(["Use A", "Keep B", "Use C", "Stop"]) == ["Use A; C", "Keep B", "Stop"]
+    print("✅ Token budget works")
+
+if __name__ == "__main__":
+    test_compile_simple()
+    test_budget_drops_least_useful_first()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints Builder output handling
+Validates hints rendering and storage without user interaction
+"""
+
+import io
+import os
+import stat
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_builder_simple import get_user_platform_info
+from goose_hints_catalog import get_options
+from goose_hints_render import iter_hints_sections, render_hints, write_hints
+from goose_hints_storage import atomic_write, preferences_hash, save_hints
+from goose_hints_state import load_state, save_state, stale_categories
+from goose_hints_store import HintsStore
+
+PLATFORM_INFO = get_user_platform_info(home='/home/jdoe', system='Linux')
+GENERATED_AT = datetime(2025, 7, 22, 9, 30, 0)
+
+SIMPLE_PREFERENCES = {
+    'output_formats': {'key': 'simple_text', 'label': 'Simple text responses', 'hint': 'Provide clear, simple text responses'},
+    'document_formatting': {
+        'exemplar_files': '~/Documents/template.md',
+        'preferred_font': {'key': 'roboto', 'label': 'Roboto', 'hint': 'Use Roboto as primary font'},
+        'document_format': None,
+    },
+}
+
+def test_render_simple_shapes():
+    """Flat options and nested groups render one line per answer"""
+    print("🧪 Testing hints rendering")
+    content = render_hints(SIMPLE_PREFERENCES, PLATFORM_INFO, 'hints.txt', 'simple', GENERATED_AT)
+
+    assert content.startswith("# Universal Goose Hints - Generated 2025-07-22 09:30:00\n")
+    assert "### Output Formats:\n- Provide clear, simple text responses\n" in content
+    assert ("### Document Formatting:\n- exemplar_files: ~/Documents/template.md\n"
+            "- Use Roboto as primary font\n\n") in content
+    assert content.endswith("## File Location:\nhints.txt\n")
+    print("✅ Simple rendering validated")
+
+def test_render_comprehensive_labels():
+    """Comprehensive documents number categories and label nested answers"""
+    preferences = {
+        'output_formats': {'key': 'visual_first', 'label': 'Visual', 'hint': 'Prioritize visuals'},
+        'file_management': {
+            'organization': {'key': 'date_organized', 'label': 'Dates', 'hint': 'Organize by date'},
+            'backup_strategy': {'key': 'custom_preference', 'label': 'Custom: NAS', 'hint': 'Back up to the NAS'},
+        },
+    }
+    content = render_hints(preferences, PLATFORM_INFO, 'hints.txt', 'comprehensive', GENERATED_AT)
+    assert "### 1. Output Formats:\n- Prioritize visuals\n" in content
+    assert "### 2. File Management:\n- Organization: Organize by date\n- Backup Strategy: Back up to the NAS\n" in content
+    assert content.endswith("Ready for Help menu integration and universal deployment!\n")
+    print("✅ Comprehensive rendering validated")
+
+def test_streaming_matches_full_render():
+    """Writing into a sink produces exactly the rendered string"""
+    sink = io.StringIO()
+    written = write_hints(sink, SIMPLE_PREFERENCES, PLATFORM_INFO, 'hints.txt', 'simple', GENERATED_AT)
+    expected = render_hints(SIMPLE_PREFERENCES, PLATFORM_INFO, 'hints.txt', 'simple', GENERATED_AT)
+    assert sink.getvalue() == expected
+    assert written == len(expected)
+    assert len(list(iter_hints_sections(SIMPLE_PREFERENCES, PLATFORM_INFO, 'hints.txt'))) == 4
+    print("✅ Streaming rendering validated")
+
+def test_save_hints_skips_identical_preferences():
+    """Saving the same preferences twice keeps a single file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        first, written = save_hints(SIMPLE_PREFERENCES, PLATFORM_INFO, 'simple', tmp, GENERATED_AT)
+        assert written
+        assert first.name == f"universal_goose_hints_20250722_093000_{preferences_hash(SIMPLE_PREFERENCES, PLATFORM_INFO, 'simple')[:12]}.txt"
+        assert first.read_text(encoding='utf-8') == render_hints(SIMPLE_PREFERENCES, PLATFORM_INFO, first, 'simple', GENERATED_AT)
+
+        second, written = save_hints(SIMPLE_PREFERENCES, PLATFORM_INFO, 'simple', tmp, datetime.now(), fsync=True)
+        assert not written
+        assert second == first
+
+        changed = dict(SIMPLE_PREFERENCES, output_formats={'key': 'code_output', 'label': 'Code', 'hint': 'Show code'})
+        third, written = save_hints(changed, PLATFORM_INFO, 'simple', tmp, GENERATED_AT)
+        assert written and third != first
+        assert sorted(p.name for p in Path(tmp).iterdir()) == sorted([first.name, third.name])
+    print("✅ Content-addressed saving validated")
+
+def test_atomic_write_leaves_no_partial_file():
+    """A failing writer leaves neither the target nor a temp file behind"""
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "hints.txt"
+
+        def failing_writer(f):
+            f.write("partial")
+            raise RuntimeError("disk full")
+
+        try:
+            atomic_write(target, failing_writer)
+        except RuntimeError:
+            pass
+        assert list(Path(tmp).iterdir()) == []
+
+        atomic_write(target, "complete\n", fsync=True)
+        assert target.read_text(encoding='utf-8') == "complete\n"
+        assert list(Path(tmp).iterdir()) == [target]
+    print("✅ Atomic writes validated")
+
+def test_atomic_write_keeps_mode():
+    """Replaced files keep their mode and new files get the umask's, not the temporary file's 0600"""
+    if os.name == 'nt':
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "shared.txt"
+        target.write_text("old\n", encoding='utf-8')
+        target.chmod(0o640)
+        atomic_write(target, "new\n")
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+        umask = os.umask(0o022)
+        os.umask(umask)
+        fresh = Path(tmp) / "fresh.txt"
+        atomic_write(fresh, "new\n")
+        assert stat.S_IMODE(fresh.stat().st_mode) == 0o666 & ~umask
+    print("✅ Atomic write modes validated")
+
+def test_store_latest_and_retention():
+    """The index tracks the latest file and prunes old ones"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with HintsStore(tmp) as store:
+            paths = []
+            for minute in range(4):
+                preferences = dict(SIMPLE_PREFERENCES, run={'key': f'run{minute}', 'label': 'Run', 'hint': f'Run {minute}'})
+                path, written = save_hints(preferences, PLATFORM_INFO, 'simple', tmp,
+                                           GENERATED_AT.replace(minute=minute), store=store)
+                assert written
+                paths.append(path)
+
+            latest = store.latest('simple')
+            assert latest['path'] == str(paths[-1])
+            assert latest['choices']['run'] == 'run3'
+            assert latest['choices']['document_formatting.preferred_font'] == 'roboto'
+            assert store.latest('comprehensive') is None
+
+            # Saving earlier preferences again reuses that file and makes it latest
+            again, written = save_hints(dict(SIMPLE_PREFERENCES, run={'key': 'run1', 'label': 'Run', 'hint': 'Run 1'}),
+                                        PLATFORM_INFO, 'simple', tmp, store=store)
+            assert not written and again == paths[1]
+            assert store.latest('simple')['path'] == str(paths[1])
+
+            store.set_retention(keep=2)
+            removed = store.apply_retention()
+            # Newest two survive, and so does the latest even though it is older
+            assert sorted(removed) == [str(paths[0])]
+            assert {entry['path'] for entry in store.history('simple')} == {str(p) for p in paths[1:]}
+            assert not paths[0].exists()
+
+            # keep=0 is a policy of its own: only the latest file stays
+            store.set_retention(max_age_days=30)
+            store.set_retention(keep=0)
+            # Each setting is updated on its own, and 0 is a limit rather than none
+            assert store.get_retention() == (0, 30.0)
+            store.set_retention(max_age_days=0)
+            assert store.get_retention() == (0, 0.0)
+            for bad in ({'keep': -1}, {'max_age_days': -0.5}):
+                try:
+                    store.set_retention(**bad)
+                    assert False, f"{bad} should be rejected"
+                except ValueError:
+                    pass
+            assert sorted(store.apply_retention()) == [str(paths[2]), str(paths[3])]
+    print("✅ Hints store validated")
+
+def test_reindex_matches_saved_hash():
+    """Reindexed files are found by the preferences hash save_hints() looks up"""
+    with tempfile.TemporaryDirectory() as tmp:
+        preferences = {'output_formats': get_options('simple', 'output_formats')[0],
+                       'communication_style': get_options('simple', 'communication_style')[1]}
+        path, _ = save_hints(preferences, PLATFORM_INFO, 'simple', tmp, GENERATED_AT)
+        with HintsStore(tmp) as store:
+            assert store.reindex() == 1
+            digest = preferences_hash(preferences, PLATFORM_INFO, 'simple')
+            assert store.find_by_hash('simple', digest)['path'] == str(path)
+            again, written = save_hints(preferences, PLATFORM_INFO, 'simple', tmp, store=store)
+            assert not written and again == path
+    print("✅ Reindexed hashes validated")
+
+def test_saved_state_round_trip():
+    """Saved preferences reload and report new or changed categories"""
+    with tempfile.TemporaryDirectory() as tmp:
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        answered = {
+            'output_formats': SIMPLE_PREFERENCES['output_formats'],
+            'document_formatting': SIMPLE_PREFERENCES['document_formatting'],
+        }
+        path = save_state(answered, platform_info, 'simple')
+        assert path == Path(tmp) / "goose_hints" / "simple_preferences.json"
+
+        state = load_state(platform_info, 'simple')
+        assert state['preferences'] == answered
+        assert load_state(platform_info, 'comprehensive') is None
+        # Unanswered categories are always stale
+        assert stale_categories(state, 'simple') == ['communication_style', 'file_management', 'coding_preferences']
+
+        # A category whose catalog definition changed is stale again
+        state['fingerprints']['output_formats'] = 'outdated'
+        assert stale_categories(state, 'simple')[0] == 'output_formats'
+    print("✅ Saved preferences validated")
+
+if __name__ == "__main__":
+    test_render_simple_shapes()
+    test_render_comprehensive_labels()
+    test_streaming_matches_full_render()
+    test_save_hints_skips_identical_preferences()
+    test_atomic_write_leaves_no_partial_file()
+    test_atomic_write_keeps_mode()
+    test_store_latest_and_retention()
+    test_reindex_matches_saved_hash()
+    test_saved_state_round_trip()
+    print("\n🎉 Hints output validated!")
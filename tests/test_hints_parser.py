@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints parser
+Renders preferences, parses them back and checks nothing was lost
+"""
+
+import io
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_batch import resolve_record
+from goose_hints_engine import QuestionSession
+from goose_hints_flow import question_options
+from goose_hints_parse import main, parse_hints, parse_hints_file, parse_paths, rebuild_preferences
+from goose_hints_platform import get_user_platform_info
+from goose_hints_render import render_hints
+from goose_hints_storage import save_hints
+from goose_hints_store import HintsStore
+
+LEGACY_SIMPLE = """# Universal Goose Hints - Generated 2025-07-30 10:11:12
+# Platform: Darwin
+# Home Directory: /Users/jdoe
+
+## Your Personalized Goose Configuration:
+
+### Output Formats:
+- key: markdown_tables
+- label: Clean markdown tables with summaries
+- hint: Present data in well-formatted markdown tables with executive summaries
+
+### Communication Style:
+- key: custom_preference
+- label: Custom: Be brief
+- hint: Be brief
+
+### File Management:
+- Use /Volumes/work as root directory
+- Organize files by type and format
+- Backup only completed work and final outputs to cloud storage
+- Use Dropbox for cloud backups
+
+## Universal Features Used:
+- Cross-platform compatibility: Darwin support
+"""
+
+def random_preferences(edition, platform_info, rng):
+    session = QuestionSession(edition, platform_info)
+    while not session.done:
+        question = session.question
+        if question['type'] == 'text':
+            session.answer(rng.choice(['none', '~/Templates/report.md']) if question['key'] == 'exemplar_files'
+                           else '/srv/projects')
+        elif rng.random() < 0.2:
+            session.answer({'custom': f"My own {question['key']} rule"})
+        else:
+            session.answer(rng.randint(1, len(question_options(edition, question, platform_info))))
+    return session.preferences()
+
+def test_round_trip():
+    """Parsing a rendered file gives back exactly the preferences it was rendered from"""
+    print("🧪 Testing hints round trip")
+    rng = random.Random(3)
+    for edition in ('simple', 'comprehensive'):
+        for i in range(100):
+            platform_info = get_user_platform_info(home=f"/home/user{i}", system=rng.choice(['Linux', 'Darwin', 'Windows']))
+            preferences = random_preferences(edition, platform_info, rng)
+            if 'document_formatting' in preferences and i % 2:
+                preferences['document_formatting']['exemplar_style'] = "Body text in Arial; headings H1-H2"
+            result = parse_hints(io.StringIO(render_hints(preferences, platform_info, "hints.txt", edition)))
+            assert result['edition'] == edition and result['home'] == f"/home/user{i}"
+            assert result['preferences'] == preferences, (preferences, result['preferences'])
+            assert result['unmatched'] == []
+    print("✅ Hints round trip works")
+
+def test_legacy_file():
+    """Files from the first renderer (option fields printed raw) still parse"""
+    print("🧪 Testing legacy hints file")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "universal_goose_hints_20250730_101112.txt"
+        path.write_text(LEGACY_SIMPLE, encoding='utf-8')
+        result = parse_hints_file(path, with_hash=True)
+    assert result['platform'] == 'Darwin' and result['generated_at'] == '2025-07-30T10:11:12'
+    assert result['answers']['output_formats'] == 'markdown_tables'
+    assert result['answers']['communication_style']['hint'] == "Be brief"
+    assert result['answers']['root_directory'] == 'custom_path'
+    assert result['preferences']['file_management']['root_directory']['hint'] == "Use /Volumes/work as root directory"
+    assert result['answers']['cloud_provider'] == 'dropbox'
+    assert len(result['content_hash']) == 64
+    print("✅ Legacy hints file works")
+
+def test_retired_option():
+    """A legacy key naming an option no longer in the catalog becomes a custom answer"""
+    print("🧪 Testing retired option keys")
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "goose_hints"
+        directory.mkdir()
+        path = directory / "universal_goose_hints_20250730_101112.txt"
+        path.write_text(LEGACY_SIMPLE.replace("key: markdown_tables", "key: retired_option"), encoding='utf-8')
+        result = parse_hints_file(path)
+        assert result['answers']['output_formats']['key'] == 'custom_preference'
+        assert result['preferences']['output_formats']['hint'].startswith("Present data in well-formatted")
+        assert rebuild_preferences(dict(result, answers=dict(result['answers'], output_formats='retired_option')),
+                                   {}, {})['output_formats']['hint'] == 'retired_option'
+        assert main([str(directory), '--output', str(Path(tmp) / "answers.jsonl"), '--workers', '0']) == 0
+    print("✅ Retired option keys work")
+
+def test_directories():
+    """Directories parse on a process pool into answer records and the hints store"""
+    print("🧪 Testing directory parsing")
+    rng = random.Random(5)
+    with tempfile.TemporaryDirectory() as tmp:
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        directory = Path(tmp) / "goose_hints"
+        for _ in range(12):
+            save_hints(random_preferences('simple', platform_info, rng), platform_info, 'simple')
+        (directory / "notes.txt").write_text("not hints", encoding='utf-8')
+        (directory / "universal_goose_hints_broken.txt").write_text("# nothing here\n", encoding='utf-8')
+
+        inline = list(parse_paths([directory], workers=0))
+        pooled = list(parse_paths([directory], workers=2, chunk_size=4))
+        assert [path for path, _, _ in inline] == [path for path, _, _ in pooled] and len(inline) == 13
+        assert sum(1 for _, _, error in pooled if error) == 1
+
+        output = Path(tmp) / "answers.jsonl"
+        assert main([str(directory), '--output', str(output), '--index', '--workers', '2']) == 1
+        records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+        assert len(records) == 12
+        for (path, result, _), record in zip([item for item in inline if item[1]], records):
+            # Records are batch-mode answers: rendering them again gives the same preferences
+            assert resolve_record(record, platform_info) == result['preferences']
+        with HintsStore(directory) as store:
+            assert len(store.history('simple')) == 12
+            assert all(entry['choices'] for entry in store.history('simple'))
+    print("✅ Directory parsing works")
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_legacy_file()
+    test_retired_option()
+    test_directories()
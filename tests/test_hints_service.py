@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints question flow and Help-menu service
+Drives sessions through the service router without opening sockets
+"""
+
+import asyncio
+import contextlib
+import io
+import sys
+from http import HTTPStatus
+sys.path.append('src')
+
+from goose_hints_flow import build_preferences, next_question, resolve_answer
+from goose_hints_builder_simple import get_user_platform_info
+from goose_hints_service import HintsService, ServiceError, _handle_connection, _read_request
+
+PLATFORM_INFO = get_user_platform_info(home='/home/jdoe', system='Linux')
+
+def test_flow_follow_ups():
+    """Follow-up questions only appear when their parent answer calls for them"""
+    print("🧪 Testing question flow follow-ups")
+    answers = {}
+    asked = []
+    while True:
+        question = next_question('simple', answers)
+        if question is None:
+            break
+        asked.append(question['key'])
+        value = {'root_directory': 'custom_path', 'custom_root_path': '/srv/work',
+                 'backup_strategy': 'manual_backup', 'exemplar_files': 'none'}.get(question['key'], 1)
+        answers[question['key']] = resolve_answer('simple', question, value, PLATFORM_INFO)
+
+    assert 'custom_root_path' in asked
+    assert 'cloud_provider' not in asked
+    preferences = build_preferences('simple', answers)
+    assert preferences['file_management']['root_directory']['hint'] == "Use /srv/work as root directory"
+    assert 'exemplar_files' not in preferences['document_formatting']
+    assert set(preferences) == {'output_formats', 'communication_style', 'document_formatting',
+                                'file_management', 'coding_preferences'}
+
+    question = next_question('simple', {})
+    for bad in ['', '99', 'not_an_option', {'custom': ' '}]:
+        try:
+            resolve_answer('simple', question, bad, PLATFORM_INFO)
+            assert False, f"{bad!r} should be rejected"
+        except ValueError:
+            pass
+    assert resolve_answer('simple', question, 'custom: Bullet points', PLATFORM_INFO)['key'] == 'custom_preference'
+    print("✅ Question flow follow-ups work")
+
+def test_service_session_lifecycle():
+    """A session goes start -> answers -> render and can be deleted"""
+    print("🧪 Testing service session lifecycle")
+    service = HintsService()
+    status, payload = service.handle('POST', '/sessions', {'edition': 'comprehensive', 'home': '/home/jdoe'})
+    assert status == HTTPStatus.CREATED
+    session = payload['session']
+    question = payload['question']
+    assert question['category_number'] == 1 and question['options'][0]['number'] == 1
+
+    try:
+        service.handle('GET', f'/sessions/{session}/render', {})
+        assert False, "render should require a complete session"
+    except ServiceError as e:
+        assert e.status == HTTPStatus.CONFLICT
+
+    try:
+        service.handle('POST', f'/sessions/{session}/answer', {'answer': 'nope'})
+        assert False, "unknown option should be rejected"
+    except ServiceError as e:
+        assert e.status == HTTPStatus.BAD_REQUEST
+
+    while not question['done']:
+        status, payload = service.handle('POST', f'/sessions/{session}/answer',
+                                         {'question': question['key'], 'answer': 1})
+        question = payload['question']
+
+    status, text = service.handle('GET', f'/sessions/{session}/render', {})
+    assert status == HTTPStatus.OK and text.startswith("# Comprehensive Goose Hints")
+    assert service.handle('DELETE', f'/sessions/{session}', {})[0] == HTTPStatus.OK
+    assert service.handle('GET', '/health', {})[1]['sessions'] == 0
+    print("✅ Service session lifecycle works")
+
+def test_service_idle_eviction():
+    """Idle sessions are evicted oldest first and the session cap is enforced"""
+    print("🧪 Testing service idle eviction")
+    service = HintsService(idle_timeout=60, max_sessions=2)
+    first = service.handle('POST', '/sessions', {})[1]['session']
+    second = service.handle('POST', '/sessions', {})[1]['session']
+    try:
+        service.handle('POST', '/sessions', {})
+        assert False, "session cap should be enforced"
+    except ServiceError as e:
+        assert e.status == HTTPStatus.SERVICE_UNAVAILABLE
+
+    service.sessions[first].last_seen -= 120
+    service.sessions.move_to_end(first, last=False)
+    assert service.evict_idle() == 1
+    assert list(service.sessions) == [second]
+    try:
+        service.handle('GET', f'/sessions/{first}/question', {})
+        assert False, "evicted session should be gone"
+    except ServiceError as e:
+        assert e.status == HTTPStatus.NOT_FOUND
+    print("✅ Service idle eviction works")
+
+def test_service_bad_requests():
+    """Malformed requests are answered with 400 rather than dropping the connection"""
+    print("🧪 Testing service bad requests")
+    service = HintsService()
+    for body in ({'edition': ['simple']}, {'edition': {'name': 'simple'}}, {'home': 42}):
+        try:
+            service.handle('POST', '/sessions', body)
+            assert False, f"{body} should be rejected"
+        except ServiceError as e:
+            assert e.status == HTTPStatus.BAD_REQUEST
+
+    async def read(content_length):
+        reader = asyncio.StreamReader()
+        reader.feed_data(f"POST /sessions HTTP/1.1\r\nContent-Length: {content_length}\r\n\r\n".encode('latin-1'))
+        reader.feed_eof()
+        return await _read_request(reader)
+
+    for content_length in ('abc', '-5', '1.5'):
+        try:
+            asyncio.run(read(content_length))
+            assert False, f"Content-Length {content_length} should be rejected"
+        except ServiceError as e:
+            assert e.status == HTTPStatus.BAD_REQUEST
+
+    class BrokenService(HintsService):
+        def handle(self, method, target, body):
+            raise KeyError('bug')
+
+    class Writer:
+        def __init__(self):
+            self.data = b''
+
+        def write(self, data):
+            self.data += data
+
+        async def drain(self):
+            pass
+
+        def close(self):
+            pass
+
+    async def exchange(service):
+        reader, writer = asyncio.StreamReader(), Writer()
+        reader.feed_data(b"GET /health HTTP/1.1\r\nConnection: close\r\n\r\n")
+        reader.feed_eof()
+        await _handle_connection(service, reader, writer)
+        return writer.data
+
+    with contextlib.redirect_stderr(io.StringIO()) as log:
+        response = asyncio.run(exchange(BrokenService()))
+    assert response.startswith(b"HTTP/1.1 500 Internal Server Error")
+    assert "KeyError: 'bug'" in log.getvalue()
+    assert asyncio.run(exchange(HintsService())).startswith(b"HTTP/1.1 200 OK")
+    print("✅ Service bad requests work")
+
+if __name__ == "__main__":
+    test_flow_follow_ups()
+    test_service_session_lifecycle()
+    test_service_idle_eviction()
+    test_service_bad_requests()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints organization analytics
+Analyzes synthetic teams with planted correlations (skipped without NumPy)
+"""
+
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('src')
+
+import goose_hints_analytics as analytics
+from goose_hints_analytics import ProfileMatrix, analyze, baseline_preferences, iter_answer_file_sets, main
+from goose_hints_engine import QuestionSession
+from goose_hints_platform import get_user_platform_info
+from goose_hints_storage import save_hints
+from goose_hints_store import open_store
+
+def team(size=600, seed=7):
+    """Answer sets where Python users want code output and Mac users prefer Roboto"""
+    rng = random.Random(seed)
+    for i in range(size):
+        platform_name = 'Darwin' if i % 3 == 0 else 'Linux'
+        coding = 'python_focus' if rng.random() < 0.6 else rng.choice(['r_focus', 'javascript_focus'])
+        if coding == 'python_focus':
+            output = 'code_output' if rng.random() < 0.8 else 'markdown_tables'
+        else:
+            output = rng.choice(['markdown_tables', 'visual_charts', 'simple_text'])
+        backup = 'manual_backup' if rng.random() < 0.7 else 'always_backup'
+        keys = {'coding_preferences': coding, 'output_formats': output, 'backup_strategy': backup,
+                'preferred_font': 'roboto' if platform_name == 'Darwin' else 'montserrat',
+                'communication_style': 'custom_preference' if i % 2 else rng.choice(['interactive', 'silent_execution'])}
+        if backup == 'always_backup':
+            keys['cloud_provider'] = 'dropbox'
+        yield platform_name, keys
+
+def test_team_report():
+    """Distributions, lift, platform differences and the baseline come out of one matrix"""
+    print("🧪 Testing organization analytics report")
+    if analytics.np is None:
+        print("⏭️  NumPy is not installed - skipped")
+        return
+    matrix = ProfileMatrix('simple', team())
+    assert len(matrix) == 600 and matrix.platform_names == ['Darwin', 'Linux']
+    report = analyze(matrix, min_support=20)
+
+    coding = report['distributions']['coding_preferences']
+    assert coding[0][0] == 'python_focus' and 0.5 < coding[0][2] < 0.7
+    assert sum(count for _, count, _ in coding) == 600
+    assert report['distributions']['document_format'] == []
+
+    pairs = {(a, x, b, y): lift for a, x, b, y, _, lift in report['co_occurrence']}
+    assert pairs[('output_formats', 'code_output', 'coding_preferences', 'python_focus')] > 1.5
+    # cloud_provider is only asked after always_backup; that alone is not a correlation
+    assert not any('cloud_provider' in (a, b) for a, _, b, _ in pairs)
+
+    assert report['platforms']['Darwin']['preferred_font'] == ('roboto', 1.0)
+    assert report['platforms']['Linux']['preferred_font'] == ('montserrat', 1.0)
+    assert report['platforms']['Darwin']['profiles'] == 200
+
+    baseline = report['baseline']
+    assert baseline['coding_preferences'] == 'python_focus' and baseline['backup_strategy'] == 'manual_backup'
+    # Half custom: custom answers never become the baseline, and the rest split
+    assert 'communication_style' not in baseline
+    # Everyone who was asked picked Dropbox, but the baseline backup strategy doesn't ask
+    assert 'cloud_provider' not in baseline
+
+    platform_info = get_user_platform_info(home='/home/team', system='Linux')
+    preferences = baseline_preferences('simple', baseline, platform_info)
+    assert preferences['coding_preferences']['key'] == 'python_focus'
+    print("✅ Organization analytics report works")
+
+def test_sources():
+    """Profiles stream from answer files and hints stores into the same matrix"""
+    print("🧪 Testing analytics sources")
+    if analytics.np is None:
+        print("⏭️  NumPy is not installed - skipped")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        answers = Path(tmp) / "team.jsonl"
+        answers.write_text("\n".join(json.dumps(record) for record in [
+            {'id': 'a', 'system': 'Linux', 'coding_preferences': 1, 'output_formats': 'code_output'},
+            {'id': 'b', 'answers': {'coding_preferences': 'python_focus', 'output_formats': 'custom: ASCII plots'}},
+            {'id': 'c', 'coding_preferences': 'cobol_focus'},
+            {'id': 'd', 'answers': ['python_focus']},
+            ['not', 'a', 'record'],
+        ]) + "\n", encoding='utf-8')
+        sets = list(iter_answer_file_sets([str(answers)], 'simple'))
+        assert len(sets) == 3
+        assert sets[0] == ('Linux', {'coding_preferences': 'python_focus', 'output_formats': 'code_output'})
+        assert sets[1] == ('unknown', {'coding_preferences': 'python_focus', 'output_formats': 'custom_preference'})
+        assert sets[2] == ('unknown', {})
+
+        home = Path(tmp) / "user"
+        platform_info = get_user_platform_info(home=home, system='Linux')
+        with open_store(platform_info) as store:
+            for choice in (1, 2):
+                session = QuestionSession('simple', platform_info)
+                while not session.done:
+                    session.answer(choice if session.question['type'] == 'choice' else 'none')
+                save_hints(session.preferences(), platform_info, 'simple', store=store)
+            assert len(list(store.iter_choices('simple'))) == 2
+            latest = list(store.iter_choices('simple', latest_only=True))
+            assert latest == [('Linux', latest[0][1])] and latest[0][1]['coding_preferences'] == 'r_focus'
+
+        baseline_path = Path(tmp) / "baseline.json"
+        assert main(['--answers', str(answers), '--home', str(home), '--min-share', '0.5',
+                     '--baseline-out', str(baseline_path), '--json']) == 0
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+        assert baseline['coding_preferences']['key'] == 'python_focus'
+        assert main(['--home', str(Path(tmp) / "nobody")]) == 1
+    print("✅ Analytics sources work")
+
+if __name__ == "__main__":
+    test_team_report()
+    test_sources()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints per-project fan-out
+Builds a tree of repositories and writes every project's .goosehints
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_flow import custom_option
+from goose_hints_platform import get_user_platform_info
+from goose_hints_projects import (CONFLICT, EXCLUDED, UNCHANGED, WRITTEN, configured_root, fan_out,
+                                  find_projects, load_overrides, main)
+from goose_hints_state import save_state
+
+TERSE = custom_option("Keep answers short")
+VISUAL = {'key': 'visual_charts', 'label': 'Charts', 'hint': 'Create visualizations and charts for data presentation'}
+PYTHON = {'key': 'python_focus', 'label': 'Python', 'hint': 'Prefer Python for data analysis and programming tasks'}
+PREFERENCES = {'communication_style': TERSE, 'output_formats': VISUAL, 'coding_preferences': PYTHON}
+
+def make_tree(root):
+    """Repositories at several depths, plus folders that must not be treated as projects"""
+    for marker in ('alpha/.git', 'beta/.hg', 'clients/acme/.git', 'clients/globex/.svn',
+                   'alpha/vendor/lib/.git', 'node_modules/pkg/.git', '.cache/repo/.git'):
+        (root / marker).mkdir(parents=True)
+    (root / 'notes').mkdir()
+    (root / 'beta' / '.goosehints').write_text("Run tests with make check.\n", encoding='utf-8')
+
+def test_find_projects():
+    """Project roots are found by VCS marker; nested, hidden and dependency folders are not entered"""
+    print("🧪 Testing project discovery")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        assert [path.relative_to(root).as_posix() for path in find_projects(root)] == [
+            'alpha', 'beta', 'clients/acme', 'clients/globex']
+        assert find_projects(root, max_depth=0) == []
+        assert find_projects(root / 'alpha') == [root / 'alpha']
+
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        custom = {'file_management': {'root_directory': {'key': 'custom_path', 'label': 'Custom',
+                                                         'hint': f"Use {tmp}/work as root directory"}}}
+        assert configured_root(custom, platform_info) == root / 'work'
+        assert configured_root({}, platform_info) == Path(platform_info['projects'])
+    print("✅ Project discovery works")
+
+def test_fan_out():
+    """Every project gets the managed section with its overrides; reruns skip and detect hand edits"""
+    print("🧪 Testing per-project fan-out")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root)
+        overrides = [('clients/*', {'communication_style': "Write for client audiences"}),
+                     ('globex', {'coding_preferences': None}),
+                     ('alpha', {'skip': True})]
+        manifest = {}
+        summary = fan_out(PREFERENCES, root, overrides, manifest, workers=4)
+        assert (summary[WRITTEN], summary[EXCLUDED]) == (3, 1)
+        assert not (root / 'alpha' / '.goosehints').exists()
+
+        beta = (root / 'beta' / '.goosehints').read_text(encoding='utf-8')
+        assert beta.startswith("Run tests with make check.\n\n<!-- goose-hints-builder:begin -->")
+        assert "- Keep answers short" in beta and "- Prefer Python" in beta
+        globex = (root / 'clients' / 'globex' / '.goosehints').read_text(encoding='utf-8')
+        assert "- Write for client audiences" in globex and "Keep answers short" not in globex
+        assert "Coding Preferences" not in globex
+        assert "Coding Preferences" in (root / 'clients' / 'acme' / '.goosehints').read_text(encoding='utf-8')
+
+        # Nothing changed: every file is skipped
+        again = fan_out(PREFERENCES, root, overrides, manifest, workers=4)
+        assert (again[WRITTEN], again[UNCHANGED]) == (0, 3)
+
+        # A hand-edited managed section is a conflict until forced
+        acme = root / 'clients' / 'acme' / '.goosehints'
+        acme.write_text(acme.read_text(encoding='utf-8').replace("Prefer Python", "Prefer Rust"), encoding='utf-8')
+        dropped = {key: value for key, value in PREFERENCES.items() if key != 'output_formats'}
+        summary = fan_out(dropped, root, overrides, manifest, workers=4)
+        assert (summary[WRITTEN], summary[CONFLICT]) == (2, 1)
+        assert "Prefer Rust" in acme.read_text(encoding='utf-8')
+        assert "Output Formats" not in (root / 'beta' / '.goosehints').read_text(encoding='utf-8')
+        summary = fan_out(dropped, root, overrides, manifest, workers=4, force=True)
+        assert summary[WRITTEN] == 1 and "Prefer Rust" not in acme.read_text(encoding='utf-8')
+    print("✅ Per-project fan-out works")
+
+def test_command():
+    """The command fans out saved preferences, keeps a manifest and supports dry runs"""
+    print("🧪 Testing projects command")
+    with tempfile.TemporaryDirectory() as tmp:
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        root = Path(tmp) / "src"
+        make_tree(root)
+        save_state(PREFERENCES, platform_info, 'simple')
+        overrides = Path(tmp) / "overrides.json"
+        overrides.write_text(json.dumps({'beta': {'skip': True}}), encoding='utf-8')
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert main(['--home', tmp, '--root', str(root), '--dry-run']) == 0
+            assert not (root / 'alpha' / '.goosehints').exists()
+            assert main(['--home', tmp, '--root', str(root), '--overrides', str(overrides)]) == 0
+        assert "3 written, 0 skipped (already up to date), 1 excluded by overrides" in output.getvalue()
+        manifest = json.loads((Path(tmp) / "goose_hints" / "projects_manifest.json").read_text(encoding='utf-8'))
+        assert len(manifest['projects']) == 3
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            assert main(['--home', tmp, '--root', str(root), '--edition', 'comprehensive']) == 1
+
+        # Override values that are not hints are refused before anything is written
+        for bad in ({'beta': {'communication_style': 5}}, {'beta': {'communication_style': {'a': 1}}},
+                    {'beta': {'communication_style': ['ok', 2]}}, {'beta': {'skip': 'yes'}}):
+            overrides.write_text(json.dumps(bad), encoding='utf-8')
+            try:
+                load_overrides(overrides)
+                assert False, f"{bad} should be rejected"
+            except ValueError:
+                pass
+            errors = io.StringIO()
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(errors):
+                assert main(['--home', tmp, '--root', str(root), '--overrides', str(overrides)]) == 1
+            assert "Could not read overrides" in errors.getvalue()
+    print("✅ Projects command works")
+
+if __name__ == "__main__":
+    test_find_projects()
+    test_fan_out()
+    test_command()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints project layout scanner
+Builds projects in each organization scheme and checks what the scan infers
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_layout import EARLY_EXIT_PROJECTS, classify_project, scan_project, scan_root
+from goose_hints_platform import get_user_platform_info
+
+LAYOUTS = {
+    'cookiecutter': ['data/raw/a.csv', 'src/clean.py', 'notebooks/eda.ipynb', 'docs/index.md'],
+    'simple_folders': ['input/a.csv', 'output/report.pdf', 'scripts/run.py'],
+    'by_date': ['2024-01-15/notes.md', '2024-02-03/notes.md', '2024-03-20_review/notes.md'],
+    'by_type': ['csv/a.csv', 'csv/b.csv', 'reports/q1.pdf', 'stuff/x.png', 'stuff/y.png'],
+    'flat_structure': ['analysis.py', 'data.csv', 'report.docx', 'notes.txt'],
+}
+
+def make_project(root, name, scheme):
+    for relative in LAYOUTS[scheme]:
+        path = Path(root) / name / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x", encoding='utf-8')
+    return str(Path(root) / name)
+
+def test_classify_schemes():
+    """Each scheme is recognized from the project's folders and files"""
+    print("🧪 Testing project classification")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scheme in LAYOUTS:
+            project = make_project(tmp, f"project_{scheme}", scheme)
+            assert classify_project(f"project_{scheme}", scan_project(project)) == scheme, scheme
+        empty = Path(tmp) / "empty"
+        empty.mkdir()
+        assert classify_project("empty", scan_project(str(empty))) is None
+        dated = Path(tmp) / "2023-11-02 offsite"
+        dated.mkdir()
+        assert classify_project(dated.name, scan_project(str(dated))) == 'by_date'
+
+        listing = scan_project(make_project(tmp, "big", 'flat_structure'), max_entries=2)
+        assert sum(len(dirs) + len(files) for dirs, files in listing['tree'].values()) == 2
+    print("✅ Project classification works")
+
+def test_dominant_scheme_and_cache():
+    """The most common scheme wins with its share as confidence; unchanged projects come from the cache"""
+    print("🧪 Testing dominant scheme and scan cache")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "Projects"
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        for i in range(6):
+            make_project(root, f"study{i}", 'cookiecutter')
+        make_project(root, "quick", 'flat_structure')
+        (root / "empty").mkdir()
+
+        layout = scan_root(root, platform_info)
+        assert layout['scheme'] == 'cookiecutter'
+        assert layout['counts'] == {'cookiecutter': 6, 'flat_structure': 1}
+        assert layout['confidence'] == 0.75 and layout['projects_scanned'] == 8
+        assert layout['cached'] == 0
+
+        again = scan_root(root, platform_info)
+        assert again['cached'] == 8 and again['counts'] == layout['counts']
+
+        for name in ("study0", "study1"):
+            for directory in ("data", "src", "notebooks", "docs"):
+                os.rename(root / name / directory, root / name / f"old_{directory}")
+        changed = scan_root(root, platform_info)
+        assert changed['cached'] == 6
+        assert changed['counts']['cookiecutter'] == 4
+        assert scan_root(Path(tmp) / "missing", platform_info)['scheme'] is None
+    print("✅ Dominant scheme and scan cache work")
+
+def test_early_exit():
+    """A root where one scheme clearly dominates stops scanning early"""
+    print("🧪 Testing early exit")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(EARLY_EXIT_PROJECTS * 4):
+            make_project(tmp, f"p{i:03d}", 'by_date')
+        layout = scan_root(tmp, workers=4)
+        assert layout['scheme'] == 'by_date' and layout['confidence'] == 1.0
+        assert EARLY_EXIT_PROJECTS <= layout['projects_scanned'] < layout['projects_total']
+    print("✅ Early exit works")
+
+if __name__ == "__main__":
+    test_classify_schemes()
+    test_dominant_scheme_and_cache()
+    test_early_exit()
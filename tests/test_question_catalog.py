@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints Builder question catalog
+Validates catalog structure, compiled lookups and the on-disk cache
+"""
+
+import copy
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('src')
+
+import goose_hints_catalog
+from goose_hints_catalog import (
+    CATALOG, COMPILED_FORMAT, catalog_hash, compile_catalog, format_options, get_category_options,
+    get_option, get_options, validate_catalog
+)
+from goose_hints_builder_simple import get_user_platform_info
+
+def test_catalog_is_valid():
+    """The shipped catalog passes validation and broken ones do not"""
+    print("🧪 Testing question catalog validation")
+    validate_catalog()
+
+    broken = copy.deepcopy(CATALOG)
+    broken['editions']['simple']['categories'][3]['questions'][4]['when']['in'].append('no_such_backup')
+    try:
+        validate_catalog(broken)
+    except ValueError as e:
+        assert 'no_such_backup' in str(e)
+    else:
+        raise AssertionError("unknown follow-up option should fail validation")
+    print("✅ Catalog validation working")
+
+def test_compiled_lookups():
+    """Compiled catalog indexes options by question and category"""
+    compiled = compile_catalog()
+    assert compiled['editions']['simple']['categories'] == (
+        'output_formats', 'communication_style', 'document_formatting', 'file_management', 'coding_preferences')
+    assert get_option('simple', 'cloud_provider', 'dropbox')['label'] == 'Dropbox'
+    assert get_option('simple', 'cloud_provider', 'nope') is None
+    assert set(get_category_options('simple', 'file_management')) == {
+        'root_directory', 'data_organization', 'backup_strategy', 'cloud_provider'}
+    # Repeated lookups return the same compiled tuple instead of rebuilding it
+    assert get_options('simple', 'preferred_font') is get_options('simple', 'preferred_font')
+
+    platform_info = get_user_platform_info(home='/home/jdoe', system='Linux')
+    root_options = format_options(get_options('simple', 'root_directory'), platform_info)
+    assert root_options[0]['hint'] == f"Use {Path('/home/jdoe/Projects')} as root with project subdirectories"
+    assert '{projects}' in get_options('simple', 'root_directory')[0]['hint']
+    print("✅ Compiled lookups working")
+
+def test_catalog_cache_round_trip():
+    """A second load comes straight from the hash-keyed cache"""
+    with tempfile.TemporaryDirectory() as tmp:
+        old_env = os.environ.get('GOOSE_HINTS_CACHE_DIR')
+        os.environ['GOOSE_HINTS_CACHE_DIR'] = tmp
+        old_compiled = goose_hints_catalog._compiled
+        try:
+            goose_hints_catalog._compiled = None
+            first = goose_hints_catalog.load_catalog()
+            cache_files = list(Path(tmp).glob('catalog_*.pickle'))
+            assert [p.name for p in cache_files] == [f"catalog_{catalog_hash()[:16]}_v{COMPILED_FORMAT}.pickle"]
+
+            goose_hints_catalog._compiled = None
+            second = goose_hints_catalog.load_catalog()
+            assert second is not first
+            assert second == first
+
+            # A cache others could have written is recompiled, not unpickled
+            if hasattr(os, 'getuid'):
+                cache_files[0].chmod(0o666)
+                assert goose_hints_catalog._read_cache(cache_files[0], catalog_hash()) is None
+        finally:
+            goose_hints_catalog._compiled = old_compiled
+            if old_env is None:
+                del os.environ['GOOSE_HINTS_CACHE_DIR']
+            else:
+                os.environ['GOOSE_HINTS_CACHE_DIR'] = old_env
+    print("✅ Catalog cache working")
+
+if __name__ == "__main__":
+    test_catalog_is_valid()
+    test_compiled_lookups()
+    test_catalog_cache_round_trip()
+    print("\n🎉 Question catalog validated!")
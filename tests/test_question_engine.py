@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints question engine
+Steps both editions through the state machine without a terminal
+"""
+
+import inspect
+import sys
+sys.path.append('src')
+
+from goose_hints_catalog import load_catalog
+from goose_hints_engine import (ACCEPTED, CHOOSE, CONFIRM, CONFIRMING, CUSTOM, CUSTOMIZE, EXPLAIN, INVALID, RETRY, TEXT,
+                                QuestionSession)
+from goose_hints_platform import get_user_platform_info
+
+PLATFORM_INFO = get_user_platform_info(home='/home/jdoe', system='Linux')
+
+def test_custom_retries_stay_flat():
+    """Rejected and empty custom preferences loop in the session without growing the stack"""
+    print("🧪 Testing custom preference retries")
+    session = QuestionSession('simple', PLATFORM_INFO, ['output_formats'])
+    assert session.state == CHOOSE
+    assert session.submit('explain').kind == EXPLAIN
+    assert session.submit('abc').kind == INVALID
+    assert session.submit(str(len(session.options) + 1)).kind == CUSTOMIZE
+    assert session.state == CUSTOM
+
+    depth = len(inspect.stack())
+    for _ in range(2000):
+        assert session.submit('   ').kind == INVALID
+        assert session.submit('Bullet lists').kind == CONFIRMING
+        assert session.state == CONFIRM
+        assert session.submit('no').kind == RETRY
+    assert len(inspect.stack()) == depth
+
+    session.submit('Bullet lists')
+    outcome = session.submit('yes')
+    assert outcome.kind == ACCEPTED and outcome.value['hint'] == 'Bullet lists'
+    assert session.done
+    assert session.preferences() == {'output_formats': outcome.value}
+    print("✅ Custom preference retries work")
+
+def test_follow_ups_and_text_questions():
+    """The cloud provider follow-up only appears for cloud backup choices"""
+    print("🧪 Testing engine follow-ups")
+    for backup, expect_cloud in [('always_backup', True), ('local_backup', False)]:
+        session = QuestionSession('simple', PLATFORM_INFO, ['file_management'])
+        asked = []
+        while not session.done:
+            asked.append(session.question['key'])
+            value = {'root_directory': 'custom_path', 'backup_strategy': backup}.get(session.question['key'], 1)
+            if session.state == TEXT:
+                assert session.submit('/srv/work').kind == ACCEPTED
+            else:
+                session.answer(value)
+        assert ('cloud_provider' in asked) == expect_cloud
+        assert asked[:2] == ['root_directory', 'custom_root_path']
+        prefs = session.preferences()['file_management']
+        assert prefs['root_directory']['hint'] == "Use /srv/work as root directory"
+    print("✅ Engine follow-ups work")
+
+def test_comprehensive_runs_all_categories():
+    """The comprehensive edition asks every catalog category, with no confirmation step"""
+    print("🧪 Testing comprehensive engine session")
+    session = QuestionSession('comprehensive', PLATFORM_INFO)
+    assert session.total_categories == 13
+    while not session.done:
+        if session.question['key'] == 'security_privacy':
+            session.submit(str(len(session.options) + 1))
+            assert session.submit('Never upload client data').kind == ACCEPTED
+        else:
+            assert session.submit('2').kind == ACCEPTED
+    preferences = session.preferences()
+    assert list(preferences) == list(load_catalog()['editions']['comprehensive']['categories'])
+    assert preferences['security_privacy']['key'] == 'custom_preference'
+    assert session.progress() == (14, 14)
+
+    try:
+        session.answer(1)
+        assert False, "a finished session should not take answers"
+    except ValueError:
+        pass
+    print("✅ Comprehensive engine session works")
+
+if __name__ == "__main__":
+    test_custom_retries_stay_flat()
+    test_follow_ups_and_text_questions()
+    test_comprehensive_runs_all_categories()
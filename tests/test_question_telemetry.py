@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints question telemetry
+Drives scripted sessions with an exporter attached and reports on the events
+"""
+
+import builtins
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.append('src')
+
+import goose_hints_builder_simple as simple
+from goose_hints_telemetry import JsonlExporter, RingBufferExporter, exporting, main, read_events, summarize
+
+PLATFORM_INFO = simple.get_user_platform_info(home='/home/jdoe', system='Linux')
+FIRST_CATEGORIES = ['output_formats', 'communication_style']
+
+def scripted_session(answers, think=0.0):
+    """Answer the first Simple Edition categories from a script, pausing think seconds per answer"""
+    responses = iter(answers)
+
+    def fake_input(prompt=''):
+        time.sleep(think)
+        return next(responses)
+
+    original_input = builtins.input
+    builtins.input = fake_input
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return simple.ask_preferences(PLATFORM_INFO, FIRST_CATEGORIES)
+    finally:
+        builtins.input = original_input
+
+def test_events():
+    """Each response becomes one event with think and tool time; accepted answers carry totals"""
+    print("🧪 Testing question telemetry events")
+    with exporting(RingBufferExporter()) as exporter:
+        scripted_session(['explain', '9', '2', '5', 'Be brief', 'no', 'Be terse', 'yes'], think=0.01)
+    events = exporter.events
+    assert [event['event'] for event in events] == [
+        'question_shown', 'explain_requested', 'invalid_input', 'answer_accepted',
+        'question_shown', 'custom_started', 'custom_confirm', 'custom_retry', 'custom_confirm', 'answer_accepted']
+    assert len({event['session'] for event in events}) == 1
+    assert all(b['ts'] >= a['ts'] for a, b in zip(events, events[1:]))
+
+    responses = [event for event in events if event['event'] != 'question_shown']
+    assert all(event['think_ms'] >= 10 and event['tool_ms'] >= 0 for event in responses)
+    first, second = events[3], events[9]
+    assert first['question'] == 'output_formats' and first['responses'] == 3 and first['retries'] == 1
+    assert first['question_think_ms'] >= 30 and not first['custom']
+    assert second['category'] == 'communication_style' and second['retries'] == 1 and second['custom']
+
+    # Without an exporter nothing is collected and nothing breaks
+    assert scripted_session(['1', '1'])['output_formats']['key'] == 'markdown_tables'
+    print("✅ Question telemetry events work")
+
+def test_report():
+    """Sessions exported to JSONL rank categories by median time and retry rate"""
+    print("🧪 Testing telemetry report")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "events.jsonl"
+        for _ in range(3):
+            with exporting(JsonlExporter(path)):
+                scripted_session(['abc', '2', '5', 'Be brief', 'yes'], think=0.005)
+        session = next(read_events([path]))['session']
+        with open(path, 'a', encoding='utf-8') as f:
+            # Partial and older-format events are skipped, not fatal
+            for event in ({'event': 'answer_accepted', 'question': 'x'},
+                          {'event': 'answer_accepted', 'question': 'x', 'edition': 'simple',
+                           'question_think_ms': 5, 'question_tool_ms': None, 'retries': 0},
+                          {'event': 'explain_requested'}, {'tool_ms': 'slow'}):
+                f.write(json.dumps(dict(event, session=session)) + "\n")
+            f.write('{"event": "answer_acc')  # torn last line
+
+        summary = summarize(read_events([path]))
+        assert summary['sessions'] == 3
+        rows = {row['category']: row for row in summary['categories']}
+        assert rows['output_formats']['answers'] == 3 and rows['output_formats']['retry_rate'] == 1.0
+        assert rows['communication_style']['retry_rate'] == 0.0 and rows['communication_style']['custom_rate'] == 1.0
+        # The custom answer took three responses against two
+        assert summary['categories'][0]['category'] == 'communication_style'
+        assert summary['questions'][0]['median_ms'] >= summary['questions'][1]['median_ms']
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert main(['report', str(path), '--json']) == 0
+        assert json.loads(output.getvalue())['sessions'] == 3
+    print("✅ Telemetry report works")
+
+def test_jsonl_flush():
+    """Each exported event reaches the file before the exporter closes"""
+    print("🧪 Testing telemetry flush")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "events.jsonl"
+        exporter = JsonlExporter(path)
+        exporter.export({'event': 'answer_accepted', 'session': 's'})
+        assert list(read_events([path])) == [{'event': 'answer_accepted', 'session': 's'}]
+        exporter.close()
+    print("✅ Telemetry flush works")
+
+if __name__ == "__main__":
+    test_events()
+    test_report()
+    test_jsonl_flush()
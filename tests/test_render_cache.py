@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints render cache
+Checks cached renderings against the renderer and exercises both cache tiers
+"""
+
+import json
+import random
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_batch import run_batch
+from goose_hints_engine import QuestionSession
+from goose_hints_flow import question_options
+from goose_hints_platform import get_user_platform_info
+from goose_hints_render import render_hints
+from goose_hints_render_cache import RenderCache
+from goose_hints_service import HintsService
+
+GENERATED_AT = datetime(2025, 7, 30, 10, 11, 12)
+
+def random_preferences(edition, platform_info, rng):
+    session = QuestionSession(edition, platform_info)
+    while not session.done:
+        question = session.question
+        if question['type'] == 'text':
+            session.answer(f"{platform_info['home']}/work" if rng.random() < 0.5 else 'none')
+        elif rng.random() < 0.1:
+            session.answer({'custom': f"Keep it in {platform_info['home']}"})
+        else:
+            session.answer(rng.randint(1, min(2, len(question_options(edition, question, platform_info)))))
+    return session.preferences()
+
+def test_cached_text_matches_renderer():
+    """Cached renderings are identical to render_hints, for every home and platform"""
+    print("🧪 Testing cached renderings")
+    rng = random.Random(11)
+    cache = RenderCache()
+    homes = ['/home/ann', '/Users/bob', 'C:\\Users\\cy', '/']
+    for edition in ('simple', 'comprehensive'):
+        for i in range(150):
+            system = rng.choice(['Linux', 'Darwin', 'Windows'])
+            platform_info = get_user_platform_info(home=rng.choice(homes), system=system)
+            # Six answer scripts shared by users on different homes and platforms
+            preferences = random_preferences(edition, platform_info, random.Random(i % 6))
+            filename = Path(platform_info['home']) / "goose_hints" / f"hints_{i}.txt"
+            expected = render_hints(preferences, platform_info, filename, edition, GENERATED_AT)
+            assert cache.render(preferences, platform_info, filename, edition, GENERATED_AT) == expected
+    stats = cache.stats()
+    assert stats['hits'] > stats['misses'] and stats['hits'] + stats['misses'] == 300
+
+    # The home directory is factored out: the same answers on another home are a hit
+    shared = RenderCache()
+    for home in ('/home/ann', '/Users/bob'):
+        platform_info = get_user_platform_info(home=home, system='Darwin')
+        shared.render(random_preferences('simple', platform_info, random.Random(1)), platform_info, 'x')
+    assert (shared.stats()['hits'], shared.stats()['misses']) == (1, 1)
+    print("✅ Cached renderings work")
+
+def test_tiers_and_eviction():
+    """The LRU stays within its byte budget; the directory tier is shared between caches"""
+    print("🧪 Testing render cache tiers")
+    rng = random.Random(4)
+    platform_info = get_user_platform_info(home='/home/ann', system='Linux')
+    sets = [random_preferences('comprehensive', platform_info, rng) for _ in range(20)]
+    small = RenderCache(max_bytes=3 * len(render_hints(sets[0], platform_info, 'x', 'comprehensive')))
+    for preferences in sets + sets:
+        small.render(preferences, platform_info, 'x', 'comprehensive')
+    stats = small.stats()
+    assert stats['entries'] <= 3 and stats['bytes'] <= small.max_bytes and stats['evictions'] > 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        first = RenderCache(directory=tmp)
+        first.render(sets[0], platform_info, 'x', 'comprehensive')
+        second = RenderCache(directory=tmp)
+        other_home = get_user_platform_info(home='/home/bob', system='Linux')
+        second.render(sets[0], platform_info, 'x', 'comprehensive')
+        assert (second.stats()['disk_hits'], second.stats()['misses']) == (1, 0)
+        # A damaged entry is simply rendered again
+        for path in Path(tmp).rglob('*.json'):
+            path.write_text('[', encoding='utf-8')
+        third = RenderCache(directory=tmp)
+        text = third.render(sets[0], other_home, 'x', 'comprehensive', GENERATED_AT)
+        assert third.stats()['misses'] == 1
+        assert text == render_hints(sets[0], other_home, 'x', 'comprehensive', GENERATED_AT)
+    print("✅ Render cache tiers work")
+
+def test_batch_and_service():
+    """Batch runs report cache counters; the service shares renderings between sessions"""
+    print("🧪 Testing render cache in batch and service")
+    with tempfile.TemporaryDirectory() as tmp:
+        answers = Path(tmp) / "answers.jsonl"
+        records = [{'id': f"user{i}", 'home': f"/home/user{i}", 'system': 'Linux', 'output_formats': 1,
+                    'communication_style': 2, 'exemplar_files': 'none', 'preferred_font': 1, 'document_format': 1,
+                    'root_directory': 1, 'data_organization': 1, 'backup_strategy': 'local_backup',
+                    'coding_preferences': 1} for i in range(8)]
+        answers.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding='utf-8')
+        for workers in (0, 2):
+            output_dir = Path(tmp) / f"out{workers}"
+            summary = run_batch(answers, output_dir, workers=workers, chunk_size=4, cache_dir=Path(tmp) / "cache")
+            assert summary['succeeded'] == 8
+            assert sum(summary['cache'].values()) == 8 and summary['cache']['misses'] <= 1
+            text = next(output_dir.glob('user3/*.txt')).read_text(encoding='utf-8')
+            assert "# Home Directory: /home/user3\n" in text and "/home/user3/Projects" in text
+
+    service = HintsService()
+    for home in ('/home/ann', '/home/bob'):
+        session = service.start_session({'home': home, 'system': 'Linux'})['session']
+        while not service.sessions[session].flow.done:
+            question = service.sessions[session].flow.question
+            service.answer(service.sessions[session], {'answer': 'none' if question['type'] == 'text' else 1})
+        assert f"# Home Directory: {home}" in service.handle('GET', f'/sessions/{session}/render', {})[1]
+    cache = service.handle('GET', '/health', {})[1]['render_cache']
+    assert (cache['hits'], cache['misses']) == (1, 1)
+    print("✅ Render cache in batch and service works")
+
+if __name__ == "__main__":
+    test_cached_text_matches_renderer()
+    test_tiers_and_eviction()
+    test_batch_and_service()
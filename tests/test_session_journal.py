@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the Goose Hints session journal
+Checks append/replay, torn-line recovery and resuming an interrupted builder
+"""
+
+import builtins
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_catalog import get_options
+from goose_hints_journal import SessionJournal, journal_path, read_journal
+from goose_hints_platform import get_user_platform_info
+import goose_hints_builder_comprehensive as comprehensive
+import goose_hints_builder_simple as simple
+
+def scripted_input(responses):
+    """Replacement for input() that plays back responses (exceptions are raised)"""
+    responses = iter(responses)
+
+    def fake_input(prompt=''):
+        response = next(responses)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+    return fake_input
+
+def test_journal_replay_and_torn_line():
+    """Answers replay in order and a torn last line is dropped before appending"""
+    print("🧪 Testing session journal replay")
+    with tempfile.TemporaryDirectory() as home:
+        platform_info = {'home': Path(home), 'system': 'Linux'}
+        with SessionJournal.start(platform_info, 'simple', ['output_formats']) as journal:
+            journal.append('output_formats', {'key': 'markdown_tables', 'label': 'Tables', 'hint': 'Use tables'})
+            journal.append('exemplar_files', 'none')
+
+        path = journal_path(platform_info, 'simple')
+        with open(path, 'ab') as f:
+            f.write(b'{"q": "communication_st')
+
+        header, answers, _, good_bytes = read_journal(path)
+        assert header['categories'] == ['output_formats']
+        assert list(answers) == ['output_formats', 'exemplar_files']
+        assert good_bytes < path.stat().st_size
+
+        with SessionJournal.resume(platform_info, 'simple') as journal:
+            journal.append('communication_style', {'key': 'concise', 'label': 'Concise', 'hint': 'Be concise'})
+        header, answers, _, good_bytes = read_journal(path)
+        assert list(answers) == ['output_formats', 'exemplar_files', 'communication_style']
+        assert good_bytes == path.stat().st_size
+
+        assert SessionJournal.resume(platform_info, 'comprehensive') is None
+    print("✅ Session journal replay works")
+
+def test_comprehensive_resume_after_interrupt():
+    """An interrupted comprehensive run resumes at the first unanswered question"""
+    print("🧪 Testing comprehensive resume")
+    original_input, original_home = builtins.input, os.environ.get('HOME')
+    with tempfile.TemporaryDirectory() as home:
+        os.environ['HOME'] = home
+        try:
+            builtins.input = scripted_input(['yes', '1', '2', KeyboardInterrupt()])
+            assert comprehensive.comprehensive_hints_builder() == (None, None)
+            platform_info = get_user_platform_info()
+            assert journal_path(platform_info, 'comprehensive').is_file()
+
+            # Only the remaining questions are asked: backup strategy and the other 11 categories
+            builtins.input = scripted_input(['3'] + ['1'] * 11)
+            preferences, hints = comprehensive.comprehensive_hints_builder(resume=True)
+        finally:
+            builtins.input = original_input
+            if original_home is None:
+                del os.environ['HOME']
+            else:
+                os.environ['HOME'] = original_home
+
+        assert preferences['output_formats']['key'] == get_options('comprehensive', 'output_formats')[0]['key']
+        assert preferences['file_management']['organization']['key'] == \
+            get_options('comprehensive', 'organization')[1]['key']
+        assert preferences['file_management']['backup_strategy']['key'] == \
+            get_options('comprehensive', 'backup_strategy')[2]['key']
+        assert len(preferences) == 13
+        assert preferences['security_privacy']['key'] == get_options('comprehensive', 'security_privacy')[0]['key']
+        assert hints.startswith("# Comprehensive Goose Hints")
+        assert not journal_path(platform_info, 'comprehensive').exists()
+    print("✅ Comprehensive resume works")
+
+def test_simple_resume_keeps_exemplar_style():
+    """The style read from exemplar files before an interruption survives --resume"""
+    print("🧪 Testing resume after exemplar analysis")
+    original_input, original_home = builtins.input, os.environ.get('HOME')
+    with tempfile.TemporaryDirectory() as home:
+        exemplar = Path(home) / "report.md"
+        exemplar.write_text('# Report\n\n<span style="font-family: Montserrat">x</span>\n', encoding='utf-8')
+        os.environ['HOME'] = home
+        try:
+            builtins.input = scripted_input(['yes', '1', '1', str(exemplar), KeyboardInterrupt()])
+            assert simple.universal_hints_builder(defaults={}) == (None, None)
+            exemplar.unlink()
+
+            # Enter accepts the font and format the exemplar preselected
+            builtins.input = scripted_input(['', ''] + ['1'] * 10)
+            preferences, _ = simple.universal_hints_builder(resume=True, defaults={})
+        finally:
+            builtins.input = original_input
+            if original_home is None:
+                del os.environ['HOME']
+            else:
+                os.environ['HOME'] = original_home
+
+        formatting = preferences['document_formatting']
+        assert formatting['preferred_font']['key'] == 'montserrat'
+        assert formatting['document_format']['key'] == 'markdown'
+        assert 'Montserrat' in formatting['exemplar_style']
+    print("✅ Resume after exemplar analysis works")
+
+if __name__ == "__main__":
+    test_journal_replay_and_torn_line()
+    test_comprehensive_resume_after_interrupt()
+    test_simple_resume_keeps_exemplar_style()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints session transcripts
+Records a scripted builder session and replays it without a terminal
+"""
+
+import builtins
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_catalog import get_question
+from goose_hints_store import choice_keys
+from goose_hints_transcript import TranscriptMismatch, read_transcript, recording, replay_transcript, replaying
+import goose_hints_builder_comprehensive as comprehensive
+import goose_hints_builder_simple as simple
+from goose_hints_stats import compute_stats, save_stats
+
+PLATFORM_INFO = simple.get_user_platform_info(home='/home/jdoe', system='Linux')
+FIRST_CATEGORIES = ['output_formats', 'communication_style']
+
+def record_simple_session(path, answers):
+    """Run the simple builder's first categories with scripted input while recording"""
+    responses = iter(answers)
+    original_input = builtins.input
+    builtins.input = lambda prompt='': next(responses)
+    try:
+        with recording(path, 'simple'), contextlib.redirect_stdout(io.StringIO()):
+            preferences = simple.ask_preferences(PLATFORM_INFO, FIRST_CATEGORIES)
+    finally:
+        builtins.input = original_input
+    return preferences
+
+def test_record_and_replay_functions():
+    """explain, invalid and custom answers are recorded and replay to the same choices"""
+    print("🧪 Testing transcript record/replay")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        recorded = record_simple_session(path, ['explain', '9', 'abc', '2', '5', 'Be brief', 'no', 'Be terse', 'yes'])
+
+        header, events = read_transcript(path)
+        assert header['edition'] == 'simple'
+        assert [event['answer'] for event in events] == ['explain', '9', 'abc', '2', '5', 'Be brief', 'no',
+                                                          'Be terse', 'yes']
+        assert [event['source'] for event in events] == ['choose'] * 5 + ['custom', 'confirm', 'custom', 'confirm']
+        assert events[0]['question'] == get_question('simple', 'output_formats')['text']
+        assert all(event['wait_ms'] >= 0 and event['gap_ms'] >= 0 for event in events)
+        # 3 sources, 2 questions and 4 prompts, each stored once in the string table
+        assert sum(1 for line in path.read_text(encoding='utf-8').splitlines() if line.startswith('["s"')) == 9
+
+        original_input = builtins.input
+        builtins.input = None  # replay must never reach the terminal
+        try:
+            with replaying(events) as player, contextlib.redirect_stdout(io.StringIO()):
+                replayed = simple.ask_preferences(PLATFORM_INFO, FIRST_CATEGORIES)
+        finally:
+            builtins.input = original_input
+        assert replayed == recorded
+        assert replayed['communication_style']['hint'] == 'Be terse'
+        assert player.position == len(events)
+
+        try:
+            with replaying(events), contextlib.redirect_stdout(io.StringIO()):
+                simple.ask_preferences(PLATFORM_INFO, ['coding_preferences'])
+            assert False, "a different question should not match the transcript"
+        except TranscriptMismatch:
+            pass
+    print("✅ Transcript record/replay works")
+
+def test_replay_observed_layout():
+    """The scanned layout and the created root come from the transcript, not the replaying machine"""
+    print("🧪 Testing replay of observed values")
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "work"
+        for i in range(6):
+            for relative in ('data/raw/a.csv', 'src/clean.py', 'notebooks/eda.ipynb'):
+                (root / f"study{i}" / relative).parent.mkdir(parents=True, exist_ok=True)
+                (root / f"study{i}" / relative).write_text("x", encoding='utf-8')
+        path = Path(tmp) / "layout.jsonl"
+        platform_info = simple.get_user_platform_info(home=tmp, system='Linux')
+        # Custom root, Enter accepts the detected layout, manual backups
+        responses = iter(['5', str(root), '', '3'])
+        original_input = builtins.input
+        builtins.input = lambda prompt='': next(responses)
+        try:
+            with recording(path, 'simple'), contextlib.redirect_stdout(io.StringIO()):
+                recorded = simple.ask_preferences(platform_info, ['file_management'])
+        finally:
+            builtins.input = original_input
+        assert recorded['file_management']['data_organization']['key'] == 'cookiecutter'
+
+        header, events = read_transcript(path)
+        assert header['observations']['layout'][0]['scheme'] == 'cookiecutter'
+        assert header['observations']['create_root'] == [None]
+        moved = Path(tmp) / "elsewhere"
+        root.rename(moved)
+        with replaying(events, observations=header['observations']) as player, \
+                contextlib.redirect_stdout(io.StringIO()):
+            replayed = simple.ask_preferences(platform_info, ['file_management'])
+        assert replayed == recorded and player.position == len(events)
+        assert not root.exists()
+
+        # Likewise the style read from exemplar files, here gone by the time of the replay
+        exemplar = Path(tmp) / "report.md"
+        exemplar.write_text('<span style="font-family: Montserrat">x</span>\n', encoding='utf-8')
+        responses = iter([str(exemplar), '', ''])
+        builtins.input = lambda prompt='': next(responses)
+        try:
+            with recording(path, 'simple'), contextlib.redirect_stdout(io.StringIO()):
+                recorded = simple.ask_preferences(platform_info, ['document_formatting'])
+        finally:
+            builtins.input = original_input
+        assert recorded['document_formatting']['preferred_font']['key'] == 'montserrat'
+        exemplar.unlink()
+        header, events = read_transcript(path)
+        with replaying(events, observations=header['observations']), contextlib.redirect_stdout(io.StringIO()):
+            assert simple.ask_preferences(platform_info, ['document_formatting']) == recorded
+    print("✅ Replay of observed values works")
+
+def test_replay_full_builder_session():
+    """A recorded full builder run replays in an isolated home and writes nothing to the real one"""
+    print("🧪 Testing full session replay")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "full.jsonl"
+        answers = ['yes', '1', '2', 'none', '1', '1', '2', '1', '3', '2']
+        responses = iter(answers)
+        original_input, original_home = builtins.input, os.environ.get('HOME')
+        builtins.input = lambda prompt='': next(responses)
+        os.environ['HOME'] = str(Path(tmp) / "home")
+        try:
+            with recording(path, 'simple', {'update': False, 'resume': False}), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                preferences, _ = simple.universal_hints_builder()
+        finally:
+            builtins.input = original_input
+            if original_home is None:
+                del os.environ['HOME']
+            else:
+                os.environ['HOME'] = original_home
+        assert preferences is not None
+
+        replay_home = Path(tmp) / "replay_home"
+        result = replay_transcript(path, home=str(replay_home))
+        assert result['error'] is None, result['error']
+        assert result['replayed'] == len(answers)
+        saved = json.loads((replay_home / "goose_hints" / "simple_preferences.json").read_text(encoding='utf-8'))
+        assert choice_keys(saved['preferences']) == choice_keys(preferences)
+    print("✅ Full session replay works")
+
+def test_replay_adaptive_session():
+    """An --adaptive recording carries its statistics table, so the replay asks in the same order"""
+    print("🧪 Testing adaptive session replay")
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp) / "home"
+        # Concise communicators always want a final summary
+        answer_sets = [{'communication_style': 'concise_direct' if i % 2 else 'teaching_mode',
+                        'progress_reporting': 'final_summary_only' if i % 2 else 'step_by_step'} for i in range(40)]
+        save_stats(compute_stats('comprehensive', answer_sets), simple.get_user_platform_info(home=home))
+        path = Path(tmp) / "adaptive.jsonl"
+        responses = iter(['yes'] + ['1'] * 200)
+        original_input, original_home = builtins.input, os.environ.get('HOME')
+        builtins.input = lambda prompt='': next(responses)
+        os.environ['HOME'] = str(home)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                comprehensive.main(['--adaptive', '--no-probe', '--record', str(path)])
+        finally:
+            builtins.input = original_input
+            if original_home is None:
+                del os.environ['HOME']
+            else:
+                os.environ['HOME'] = original_home
+
+        header, events = read_transcript(path)
+        assert header['options']['stats_table']['sessions'] == 40
+        assert events[1]['question'] == get_question('comprehensive', 'communication_style')['text']
+        result = replay_transcript(path)
+        assert result['error'] is None, result['error']
+        assert result['replayed'] == len(events)
+    print("✅ Adaptive session replay works")
+
+if __name__ == "__main__":
+    test_record_and_replay_functions()
+    test_replay_observed_layout()
+    test_replay_full_builder_session()
+    test_replay_adaptive_session()
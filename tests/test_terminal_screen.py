@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints terminal screens
+Drives the question loop through the buffered and full-screen renderers
+"""
+
+import builtins
+import contextlib
+import io
+import sys
+sys.path.append('src')
+
+import goose_hints_builder_simple as simple
+from goose_hints_engine import QuestionSession, run_terminal
+from goose_hints_screen import FullScreen, LineScreen, choose_screen, full_screen_supported, preferred_screen, strip_ansi
+
+PLATFORM_INFO = simple.get_user_platform_info(home='/home/jdoe', system='Linux')
+FIRST_CATEGORIES = ['output_formats', 'communication_style']
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write() calls"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+    def isatty(self):
+        return False
+
+@contextlib.contextmanager
+def scripted_input(answers):
+    """Replace input() with a script, collecting the prompts it was given"""
+    responses, prompts = iter(answers), []
+
+    def fake_input(prompt=''):
+        prompts.append(prompt)
+        return next(responses)
+
+    original_input = builtins.input
+    builtins.input = fake_input
+    try:
+        yield prompts
+    finally:
+        builtins.input = original_input
+
+def test_buffered_screen():
+    """Each step's header, question and options arrive with the prompt in one write"""
+    print("🧪 Testing buffered terminal screen")
+    stream = CountingStream()
+    session = QuestionSession('simple', PLATFORM_INFO, FIRST_CATEGORIES)
+    with scripted_input(['explain', '2', '5', 'Be brief', 'yes']) as prompts:
+        with contextlib.redirect_stdout(stream):
+            preferences = run_terminal(session, simple.SimpleView(), screen=LineScreen(stream))
+    assert preferences['output_formats']['key'] != 'custom_preference'
+    assert preferences['communication_style']['hint'] == "Be brief"
+
+    # The first prompt carries the category header and every option with it
+    assert 'Output Formats' in prompts[0] and '1. ' in prompts[0] and '2. ' in prompts[0]
+    # Simple Edition repeats the menu after 'explain', again as part of the prompt
+    assert '2. ' in prompts[1]
+    # Nothing but the last reply is written outside input() itself
+    assert stream.writes <= 2, stream.writes
+    print("✅ Buffered terminal screen works")
+
+def test_full_screen():
+    """Arrow keys and Enter pick options; custom text is typed on the frame's last line"""
+    print("🧪 Testing full-screen renderer")
+    stream = io.StringIO()
+    keys = iter(['down', 'down', 'up', 'enter',      # option 2
+                 '9', 'up', 'enter'])                # last option (custom) via wrap-around
+    screen = FullScreen(stream, keys=keys, size=(80, 24))
+    session = QuestionSession('simple', PLATFORM_INFO, FIRST_CATEGORIES)
+    with scripted_input(['Be brief', 'yes']) as prompts:
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            preferences = run_terminal(session, simple.SimpleView(), screen=screen)
+    reference = QuestionSession('simple', PLATFORM_INFO, FIRST_CATEGORIES)
+    reference.answer(2)
+    assert preferences['output_formats'] == reference.preferences()['output_formats']
+    assert preferences['communication_style']['hint'] == "Be brief"
+    assert len(prompts) == 2 and not prompts[0].startswith('\n')
+
+    output = stream.getvalue()
+    assert output.startswith("\x1b[?1049h") and "\x1b[?1049l" in output
+    assert "\x1b[7m" in output                      # the selected option is highlighted
+    assert stdout.getvalue() == ""                  # views only ever print into the frame
+    print("✅ Full-screen renderer works")
+
+def test_frame_diff():
+    """Redrawing a frame rewrites only the lines that changed"""
+    print("🧪 Testing frame diffing")
+    stream = io.StringIO()
+    screen = FullScreen(stream, size=(20, 10))
+    screen.draw(['title', 'one', 'two', ''])
+    first = stream.getvalue()
+    assert all(f"\x1b[{row};1H" in first for row in (1, 2, 3, 4))
+
+    stream.seek(0)
+    stream.truncate()
+    screen.draw(['title', 'one', 'TWO', ''])
+    second = stream.getvalue()
+    assert "\x1b[3;1HTWO" in second and "\x1b[1;1H" not in second and "\x1b[2;1H" not in second
+
+    # Long lines are clipped to the width and shorter frames clear what is left below
+    stream.seek(0)
+    stream.truncate()
+    screen.draw(['x' * 50])
+    third = stream.getvalue()
+    assert strip_ansi(third.split("\x1b[1;1H")[1]).startswith('x' * 18 + '…')
+    assert "\x1b[2;1H\x1b[J" in third
+    print("✅ Frame diffing works")
+
+def test_fallback():
+    """Without an interactive terminal the plain buffered screen is used"""
+    print("🧪 Testing full-screen fallback")
+    assert not full_screen_supported(io.StringIO(), io.StringIO())
+    with preferred_screen('full'):
+        assert type(choose_screen()) is LineScreen
+    assert type(choose_screen()) is LineScreen
+    print("✅ Full-screen fallback works")
+
+if __name__ == "__main__":
+    test_buffered_screen()
+    test_full_screen()
+    test_frame_diff()
+    test_fallback()
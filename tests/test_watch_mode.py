@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script for Goose Hints watch mode
+Edits saved preferences under a watcher and checks what gets regenerated
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+sys.path.append('src')
+
+from goose_hints_flow import custom_option
+from goose_hints_install import target_paths
+from goose_hints_platform import get_user_platform_info
+from goose_hints_state import save_state, state_path
+from goose_hints_storage import atomic_write
+from goose_hints_watch import (HintsWatch, InotifyWatcher, PollingWatcher, changed_categories, make_watcher,
+                               wait_for_changes)
+
+TERSE = custom_option("Keep answers short")
+DETAILED = custom_option("Explain every step")
+VISUAL = {'key': 'visual_charts', 'label': 'Charts', 'hint': 'Create visualizations and charts for data presentation'}
+PYTHON = {'key': 'python_focus', 'label': 'Python', 'hint': 'Prefer Python for data analysis and programming tasks'}
+
+def test_watchers():
+    """Both watchers report replaced files, ignore others and debounce bursts"""
+    print("🧪 Testing file watchers")
+    with tempfile.TemporaryDirectory() as tmp:
+        watched, other = Path(tmp) / "prefs.json", Path(tmp) / "other.json"
+        watched.write_text("{}", encoding='utf-8')
+        factories = [lambda: PollingWatcher([watched], interval=0.01)]
+        if sys.platform.startswith('linux'):
+            factories.append(lambda: make_watcher([watched]))
+        for factory in factories:
+            watcher = factory()
+            assert watcher.wait(0.05) == set()
+            other.write_text("{}", encoding='utf-8')
+            atomic_write(watched, '{"a": 1}')
+            assert watcher.wait(1.0) == {watched.resolve()}
+
+            def burst():
+                for i in range(3):
+                    time.sleep(0.05)
+                    atomic_write(watched, '{"a": %d}' % (i + 10))
+
+            thread = threading.Thread(target=burst)
+            thread.start()
+            started = time.monotonic()
+            assert wait_for_changes(watcher, debounce=0.2) == {watched.resolve()}
+            thread.join()
+            # Returned only after the whole burst plus the quiet period
+            assert time.monotonic() - started >= 0.3
+            assert watcher.wait(0.05) == set()
+            watcher.close()
+
+        if sys.platform.startswith('linux'):
+            # Idle waiting sleeps in select() instead of spinning
+            watcher = make_watcher([watched])
+            assert isinstance(watcher, InotifyWatcher)
+            cpu = time.process_time()
+            watcher.wait(0.3)
+            assert time.process_time() - cpu < 0.05
+            watcher.close()
+    print("✅ File watchers work")
+
+def test_incremental_refresh():
+    """Only outputs built from the categories that changed are regenerated"""
+    print("🧪 Testing incremental refresh")
+    with tempfile.TemporaryDirectory() as tmp:
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        root = Path(tmp) / "src"
+        for project in ('alpha', 'clients/acme'):
+            (root / project / '.git').mkdir(parents=True)
+        overrides = Path(tmp) / "overrides.json"
+        overrides.write_text('{"clients/*": {"communication_style": "Write for client audiences"}}', encoding='utf-8')
+        overlay = Path(tmp) / "baseline.json"
+        preferences = {'communication_style': TERSE, 'output_formats': VISUAL}
+        save_state(preferences, platform_info, 'simple')
+
+        watch = HintsWatch(platform_info, overlay=overlay, root=root, overrides=overrides, workers=2)
+        first = watch.refresh()
+        assert first['targets'] == ['hints', 'memory'] and first['projects']['written'] == 2
+        hints = target_paths(platform_info)['hints']
+
+        # communication_style is overridden in clients/acme, so only alpha is rewritten
+        save_state(dict(preferences, communication_style=DETAILED), platform_info, 'simple')
+        report = watch.refresh()
+        assert report['categories'] == ['communication_style']
+        assert report['projects']['projects'] == 1 and report['projects']['written'] == 1
+        assert "Explain every step" in (root / 'alpha' / '.goosehints').read_text(encoding='utf-8')
+        assert "Explain every step" in hints.read_text(encoding='utf-8')
+
+        # The org overlay wins over the saved answers; dropping a category removes it everywhere
+        atomic_write(overlay, '{"coding_preferences": %s}' % __import__('json').dumps(PYTHON))
+        save_state({'communication_style': DETAILED}, platform_info, 'simple')
+        report = watch.refresh()
+        assert report['categories'] == ['coding_preferences', 'output_formats']
+        assert report['projects']['written'] == 2
+        text = hints.read_text(encoding='utf-8')
+        assert "Prefer Python" in text and "Output Formats" not in text
+        memory = target_paths(platform_info)['memory'].read_text(encoding='utf-8')
+        assert "output_formats" not in memory and "# goose-hints coding_preferences" in memory
+
+        # Saving the same preferences again regenerates nothing
+        save_state({'communication_style': DETAILED}, platform_info, 'simple')
+        report = watch.refresh()
+        assert report == {'categories': [], 'targets': [], 'projects': None}
+    print("✅ Incremental refresh works")
+
+def test_run():
+    """The watch loop refreshes once at start and again after each debounced edit"""
+    print("🧪 Testing watch loop")
+    with tempfile.TemporaryDirectory() as tmp:
+        platform_info = get_user_platform_info(home=tmp, system='Linux')
+        save_state({'communication_style': TERSE}, platform_info, 'simple')
+        watch = HintsWatch(platform_info)
+        watcher = make_watcher(watch.sources())
+        if isinstance(watcher, PollingWatcher):
+            watcher.interval = 0.01
+        reports = []
+        thread = threading.Thread(target=watch.run, args=(watcher, 0.05, 2, reports.append))
+        thread.start()
+        time.sleep(0.2)
+        state_path(platform_info, 'simple').write_text("{not json", encoding='utf-8')  # caught mid-edit
+        time.sleep(0.3)
+        save_state({'communication_style': DETAILED}, platform_info, 'simple')
+        thread.join(5)
+        watcher.close()
+        assert not thread.is_alive()
+        assert reports[0]['targets'] == ['hints', 'memory'] and 'error' in reports[1]
+        assert reports[2]['categories'] == ['communication_style']
+        assert changed_categories({'a': 1, 'b': 2}, {'b': 3, 'c': 4}) == {'a', 'b', 'c'}
+    print("✅ Watch loop works")
+
+if __name__ == "__main__":
+    test_watchers()
+    test_incremental_refresh()
+    test_run()